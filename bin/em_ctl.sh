@@ -1,10 +1,12 @@
 #!/bin/sh
 #
 # EM Start-up Script em_ctl.sh
-# Parameter (mandatory) <stop|forcestop>
+# Parameter (mandatory) <stop|forcestop|reload>
 #
 # Shell script executed by RA or a maintenance operator
 # and does EM termination or forceful termination.
+# (reload : scenario and driver modules are loaded again at next use,
+#           and method start/finish log level is read again.)
 #
 # Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
 #
@@ -65,7 +67,7 @@ target=$(basename ${main_module})
 #######################
 
 em_usage() {
-    USAGE="Usage: $0 { start | stop [NORMAL_STOP] | status | forcestop }"
+    USAGE="Usage: $0 { start | stop [NORMAL_STOP] | status | forcestop | reload }"
     #echo "$USAGE" >&2
     echo "$USAGE"
 }
@@ -178,6 +180,18 @@ em_forcestop() {
     exit $result
 }
 
+em_reload() {
+    echo "EM RELOAD: SEND SIGHUP to EM Main Module..."
+    pkill -HUP -F "${EM_INSTALL_PATH}${pid_module}"
+    result=$?
+    if [ $result != 0 ]; then
+        echo "EM RELOAD: [ FAILURE ] NO PROCESS FOUND OR SEND SIGHUP FAILED ${result}"
+        return $EM_ERR
+    fi
+    echo "EM RELOAD: [ SUCCESS ] SUCCESSFULLY SEND SIGHUP TO EM MAIN MODULE"
+    return $EM_SUCCESS
+}
+
 em_status() {
     echo "EM STATUS: CHECKING EXISTENCE OF EM PROCESS..."
     if [ -e ${EM_INSTALL_PATH}${pid_module} ]; then
@@ -221,6 +235,9 @@ case $ACTION in
     status)
         em_status
         ;;
+    reload)
+        em_reload
+        ;;
     usage|help)
         em_usage
         ;;
@@ -6,7 +6,6 @@
 '''
 Driver common section module.
 '''
-import imp
 import json
 import copy
 from os import path
@@ -14,12 +13,10 @@ import traceback
 import xmltodict
 
 import GlobalModule
+import PluginLoader
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
-
-import threading
-
-mutex = threading.RLock()
+from EmOrderMessage import EmOrderMessage
 
 
 class EmCommonDriver(object):
@@ -29,7 +26,6 @@ class EmCommonDriver(object):
     __db_utility = None  
 
     __driver_path = ''  
-    __target_module = None  
     __target_driver_class_ins = None  
 
     @decorater_log_in_out
@@ -117,9 +113,8 @@ class EmCommonDriver(object):
                 GlobalModule.EM_LOGGER.debug(
                     "******    Driver Definition Read from EC Message")
                 try:
-                    ec_message_copy = copy.deepcopy(ec_message)
-                    ec_message_copy = json.loads(ec_message_copy)  
-                    table_info_dict = ec_message_copy["device"]["equipment"]
+                    ec_message_data = EmOrderMessage.to_data(ec_message)
+                    table_info_dict = ec_message_data["device"]["equipment"]
                     res_conf, self.__driver_path, driver_class =\
                         GlobalModule.EM_CONFIG.read_driver_conf(
                             table_info_dict["platform"],
@@ -147,24 +142,13 @@ class EmCommonDriver(object):
                 "106001    Driver: %s Select" % name)
 
             try:
-                global mutex
-                mutex.acquire()
-
-                GlobalModule.EM_LOGGER.debug(
-                    "[%s] Lock acquired" % threading.currentThread().ident)
-
-                GlobalModule.EM_LOGGER.debug(
-                    "******    Start Searching Module")
-                filepath, filename, data = imp.find_module(
-                    driver_class, [path_py])
                 GlobalModule.EM_LOGGER.debug(
                     "******    Start Loading Module")
-                self.__target_module = imp.load_module(
-                    driver_class, filepath, filename, data)
+                driver_class_obj = PluginLoader.load_class(
+                    driver_class, path_py)
                 GlobalModule.EM_LOGGER.debug(
                     "******    Set Module to Instance")
-                self.__target_driver_class_ins =\
-                    getattr(self.__target_module, driver_class)()
+                self.__target_driver_class_ins = driver_class_obj()
 
             except (AttributeError, ImportError, IOError) as e:
                 GlobalModule.EM_LOGGER.warning(
@@ -173,11 +157,6 @@ class EmCommonDriver(object):
                     "206003    %s" % (str(e)))
                 return GlobalModule.COM_START_DRIVER_FAULT
 
-            finally:
-                mutex.release()
-                GlobalModule.EM_LOGGER.debug(
-                    "[%s] Lock released" % threading.currentThread().ident)
-
             GlobalModule.EM_LOGGER.debug(
                 "******    Loading Module Success")
             return GlobalModule.COM_START_OK
@@ -251,8 +230,7 @@ class EmCommonDriver(object):
                     (getting registered info)")
                 try:
                     table_info_dict = {}
-                    ec_message_copy = copy.deepcopy(ec_message)
-                    json_data = json.loads(ec_message_copy)  
+                    json_data = EmOrderMessage.to_data(ec_message)
                     element = json_data["device"]["equipment"]
                     table_info_dict.update(element)
                     element = json_data["device"]["management-interface"]
@@ -46,6 +46,12 @@ class EmConfigManagement(object):
     __ParseListConfIFProcess = ['Port_number']
     __ParseListConfSysCommon = [
         'DB_access_port',
+        'DB_pool_size',
+        'DB_pool_max_overflow',
+        'DB_pool_timeout',
+        'DB_pool_recycle',
+        'DB_write_batch_size',
+        'DB_read_cache_ttl',
         'Timer_confirmed-commit',
         'Timer_confirmed-commit_em_offset',
         'Timer_connect_get_before_config',
@@ -59,13 +65,29 @@ class EmConfigManagement(object):
         'Timer_transaction_db_watch',
         'Timer_connection_retry',
         'Em_statusget_notify_interval',
+        'Timer_statusget_cache',
         'Connection_retry_num',
+        'Timer_netconf_session_idle',
+        'Netconf_reply_thread_num',
+        'Device_config_snapshot_interval',
+        'Driver_log_payload_limit',
+        'Driver_log_payload_file_num',
         'Em_log_file_generation_num',
         'Rest_request_average',
         'Em_resource_status_check_retry_num',
         'Em_resource_status_check_retry_timer',
+        'Em_order_parallel_num',
+        'Em_order_queue_size',
+        'Em_notify_queue_size',
+        'Em_notify_batch_num',
+        'Timer_notify_batch',
+        'Timer_notify_request',
     ]
-    __ParseListConfRestProcess = ['Rest_port_number']
+    __ParseListConfRestProcess = ['Rest_port_number',
+                                  'Rest_server_thread_num',
+                                  'Rest_keepalive_timeout',
+                                  'Rest_audit_thread_num',
+                                  'Rest_audit_vendor_thread_num']
     __ParseListConfScnario = [3, 4, 5]
     __ParseListConfService = [2]
 
@@ -73,6 +95,10 @@ class EmConfigManagement(object):
         'Em_notify_info_log',
         'Em_notify_warn_log',
         'Em_notify_error_log',
+        'DB_pool_pre_ping',
+        'DB_write_upsert',
+        'DB_read_cache',
+        'Netconf_session_pool',
     ]
 
     def read_if_process_conf(self, target_key):
@@ -158,6 +184,18 @@ class EmConfigManagement(object):
                                      self.__conf_sys_common,
                                      False)
 
+    def reload_sys_common_conf(self):
+        '''
+        Reloading of Definition across the System
+            Gets called from MAIN method when EM receives SIGHUP
+        Return value
+            Method Results : True or False
+        '''
+        before_dict = self.__conf_dict_sys_common
+        self.__conf_dict_sys_common = self.__load_conf(
+            self.__conf_dict_sys_common, self.__conf_sys_common)
+        return self.__conf_dict_sys_common is not before_dict
+
     def read_service_type_scenario_conf(self):
         '''
         Obtains Scenario List from Scenario Configuration
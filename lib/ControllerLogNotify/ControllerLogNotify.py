@@ -5,6 +5,8 @@
 
 import logging
 import threading
+import time
+import Queue
 import GlobalModule
 import requests
 import json
@@ -34,32 +36,66 @@ class ControllerLogNotify(object):
         self.controller_type = "em"
         self.api_url = "v1/internal/ec_ctrl/logstatusnotify"
         self.url_format = "http://{address}:{port}/{api_url}"
+        self.queue_size = self._get_conf("Em_notify_queue_size") or 1000
+        self.batch_num = self._get_conf("Em_notify_batch_num") or 50
+        batch_timer = self._get_conf("Timer_notify_batch")
+        self.batch_time = (batch_timer if batch_timer is not None
+                           else 1000) / 1000.0
+        request_timer = self._get_conf("Timer_notify_request")
+        self.request_timeout = (request_timer or 10000) / 1000.0
+        self._notify_queue = Queue.Queue(self.queue_size)
+        self._notify_thread = None
+        self._notify_thread_lock = threading.Lock()
+        self._session = None
+        self._stat_lock = threading.Lock()
+        self._notify_stat = {"sent": 0, "dropped": 0, "failed": 0}
 
     @decorater_log_in_out
     def notify_logs(self, msg, log_level):
         '''
         Log is notified.
+            Log is queued and sent by the notification thread,
+            so that the caller is not blocked by EC.
+            If the queue is full, the log is dropped.
         Argument:
             msg : log data (str)
             log_level : log level (int)
         '''
         if self.address and self.port:
-            thread = threading.Thread(target=self.send_notify_request,
-                                      args=(msg, log_level))
-            thread.daemon = True
-            thread.start()
+            self._start_notify_thread()
+            try:
+                self._notify_queue.put_nowait((msg, log_level))
+            except Queue.Full:
+                self._count_stat("dropped", 1)
+                GlobalModule.EM_LOGGER.debug("not notify : Queue Full")
         else:
             GlobalModule.EM_LOGGER.debug("not notify : No EC address")
 
+    @decorater_log
+    def get_notify_status(self):
+        '''
+        Notification counters are acquired.
+        Return value:
+            number of sent, dropped, failed logs and queued logs ; dict
+        '''
+        with self._stat_lock:
+            status = dict(self._notify_stat)
+        status["queued"] = self._notify_queue.qsize()
+        return status
+
     @decorater_log_in_out
-    def send_notify_request(self, msg, log_level):
+    def send_notify_request(self, msg_list, log_level):
         '''
         Request is sent to API for specified address.
         Argument:
-            msg : log data (str)
+            msg_list : log data (list or str)
             log_level : log level (int)
+        Return value:
+            Result ; boolean (True:Normal,False:Abnormal)
         '''
-        request_body = self._set_request_body(msg, log_level)
+        if not isinstance(msg_list, list):
+            msg_list = [msg_list]
+        request_body = self._set_request_body(msg_list, log_level)
         request_body = json.dumps(request_body)
         url = self.url_format.format(address=self.address,
                                      port=self.port,
@@ -68,15 +104,94 @@ class ControllerLogNotify(object):
         GlobalModule.EM_LOGGER.debug("Send PUT Request:" +
                                      "URL=%s ,Body=%s ,Header=%s",
                                      url, request_body, header)
-        req = requests.put(url, data=request_body, headers=header)
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            req = self._session.put(url,
+                                    data=request_body,
+                                    headers=header,
+                                    timeout=self.request_timeout)
+        except Exception as ex:
+            GlobalModule.EM_LOGGER.debug("request error:%s", ex)
+            self._session.close()
+            self._session = None
+            return False
         GlobalModule.EM_LOGGER.debug("request status:%s", req.status_code)
+        return req.ok
 
     @decorater_log
-    def _set_request_body(self, msg, log_level):
+    def _start_notify_thread(self):
+        '''
+        Notification thread is started if it is not running.
+        '''
+        if self._notify_thread is not None:
+            return
+        with self._notify_thread_lock:
+            if self._notify_thread is None:
+                thread = threading.Thread(target=self._notify_loop,
+                                          name="ControllerLogNotify")
+                thread.daemon = True
+                thread.start()
+                self._notify_thread = thread
+
+    def _notify_loop(self):
+        '''
+        Queued logs are sent in batches.
+            Logs are collected until the number of logs reaches batch number
+            or batch time has passed, and one request is sent per log level.
+        '''
+        while True:
+            batch = [self._notify_queue.get()]
+            deadline = time.time() + self.batch_time
+            while len(batch) < self.batch_num:
+                remaining = deadline - time.time()
+                try:
+                    if remaining > 0:
+                        batch.append(self._notify_queue.get(True, remaining))
+                    else:
+                        batch.append(self._notify_queue.get_nowait())
+                except Queue.Empty:
+                    break
+            self._send_batch(batch)
+
+    def _send_batch(self, batch):
+        '''
+        Batch of logs is sent for each log level in queued order.
+        Argument:
+            batch : list of (log data, log level)
+        '''
+        level_msgs = {}
+        level_order = []
+        for msg, log_level in batch:
+            if log_level not in level_msgs:
+                level_msgs[log_level] = []
+                level_order.append(log_level)
+            level_msgs[log_level].append(msg)
+        for log_level in level_order:
+            msg_list = level_msgs[log_level]
+            try:
+                is_ok = self.send_notify_request(msg_list, log_level)
+            except Exception as ex:
+                GlobalModule.EM_LOGGER.debug("notify error:%s", ex)
+                is_ok = False
+            self._count_stat("sent" if is_ok else "failed", len(msg_list))
+
+    def _count_stat(self, stat_name, count):
+        '''
+        Notification counter is added.
+        Argument:
+            stat_name : counter name (str)
+            count : number to be added (int)
+        '''
+        with self._stat_lock:
+            self._notify_stat[stat_name] += count
+
+    @decorater_log
+    def _set_request_body(self, msg_list, log_level):
         '''
         Body in request is generated.
         Argument:
-            msg : log data (str)
+            msg_list : log data (list)
             log_level : log level (int)
         Return value:
             body part ; dict
@@ -85,7 +200,7 @@ class ControllerLogNotify(object):
         controller_info = {}
         controller_info["controller_type"] = self.controller_type
         controller_info["log_level"] = self.LogName[log_level]
-        controller_info["message"] = [msg]
+        controller_info["message"] = msg_list
         body_json["controller"] = controller_info
         return body_json
 
@@ -0,0 +1,263 @@
+#! /usr/bin/env python
+# _*_ coding: utf-8 _*_
+# Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+# Filename: EmControllerStatusCollector.py
+'''
+Controller status collector which reads /proc directly.
+'''
+import os
+import math
+import time
+import socket
+import threading
+import collections
+import GlobalModule
+from EmCommonLog import decorater_log
+
+
+class EmControllerStatusCollector(object):
+    '''
+    Controller status collector class
+        Status is returned in the same format as controller_status.sh.
+        CPU and traffic rates are calculated from the previous sample.
+    '''
+
+    _proc_path = "/proc"
+
+    _sample_num = 16
+
+    _lock = threading.Lock()
+    _prev_cpu = None
+    _prev_proc_cpu = {}
+    _prev_net = None
+    _samples = collections.deque(maxlen=_sample_num)
+
+    @classmethod
+    @decorater_log
+    def collect(cls,
+                is_top=True,
+                is_nproc=True,
+                is_df=True,
+                is_sar=True,
+                is_hostname=True,
+                pid=0):
+        '''
+        Controller status is collected.
+        Argument:
+            is_top : CPU, memory and process information is collected.
+            is_nproc : number of processors is collected.
+            is_df : disk information is collected.
+            is_sar : traffic information is collected.
+            is_hostname : host name is collected.
+            pid : controller process ID (0: not collected)
+        Return value:
+            status : same format as controller_status.sh result (dict)
+        '''
+        result = {
+            "top": {"id": 0, "free": 0, "used": 0, "buffers": 0,
+                    "swapused": 0, "res": 0, "cpu": 0},
+            "nproc": 0,
+            "hostname": None,
+            "df": [],
+            "sar": [],
+        }
+        if is_sar and cls._prev_net is None:
+            baseline = cls._read_net_dev()
+            time.sleep(1)
+        with cls._lock:
+            if is_sar and cls._prev_net is None:
+                cls._prev_net = baseline
+            if is_top:
+                result["top"]["id"] = cls._get_cpu_idle()
+                result["top"].update(cls._get_memory())
+                if pid:
+                    result["top"].update(cls._get_process(pid))
+            if is_nproc:
+                result["nproc"] = os.sysconf("SC_NPROCESSORS_ONLN")
+            if is_df:
+                result["df"] = cls._get_disk()
+            if is_sar:
+                result["sar"] = cls._get_traffic()
+        if is_hostname:
+            result["hostname"] = socket.gethostname()
+        GlobalModule.EM_LOGGER.debug("collect result:%s", result)
+        return result
+
+    @classmethod
+    @decorater_log
+    def put_sample(cls, sample_key, status):
+        '''
+        Controller status is kept in the ring buffer of samples.
+        Argument:
+            sample_key : controller and acquisition targets (tuple)
+            status : controller status (dict)
+        '''
+        with cls._lock:
+            cls._samples.append((time.time(), sample_key, status))
+
+    @classmethod
+    @decorater_log
+    def get_sample(cls, sample_key, max_age):
+        '''
+        The newest controller status is acquired from the ring buffer.
+        Argument:
+            sample_key : controller and acquisition targets (tuple)
+            max_age : maximum elapsed time of sample (sec)
+        Return value:
+            controller status (dict) (None: no sample within max_age)
+        '''
+        now = time.time()
+        with cls._lock:
+            for sample_time, tmp_key, status in reversed(cls._samples):
+                if now - sample_time > max_age:
+                    break
+                if tmp_key == sample_key:
+                    return status
+        return None
+
+    @classmethod
+    def _read_file(cls, *path):
+        '''
+        File under /proc is read.
+        '''
+        with open(os.path.join(cls._proc_path, *path), "r") as proc_file:
+            return proc_file.read()
+
+    @classmethod
+    def _get_cpu_idle(cls):
+        '''
+        CPU idle rate (%) is acquired from /proc/stat.
+        '''
+        for line in cls._read_file("stat").splitlines():
+            if line.startswith("cpu "):
+                values = [int(val) for val in line.split()[1:9]]
+                break
+        else:
+            return 0
+        total = sum(values)
+        idle = values[3]
+        if cls._prev_cpu is not None:
+            prev_total, prev_idle = cls._prev_cpu
+            if total > prev_total:
+                total, idle = total - prev_total, idle - prev_idle
+        cls._prev_cpu = (sum(values), values[3])
+        if total <= 0:
+            return 0
+        return round(idle * 100.0 / total, 1)
+
+    @classmethod
+    def _get_memory(cls):
+        '''
+        Memory information (KiB) is acquired from /proc/meminfo.
+        '''
+        meminfo = {}
+        for line in cls._read_file("meminfo").splitlines():
+            items = line.split()
+            if len(items) >= 2:
+                meminfo[items[0].rstrip(":")] = int(items[1])
+        buffers = (meminfo.get("Buffers", 0) +
+                   meminfo.get("Cached", 0) +
+                   meminfo.get("SReclaimable", 0))
+        free = meminfo.get("MemFree", 0)
+        return {
+            "free": free,
+            "used": meminfo.get("MemTotal", 0) - free - buffers,
+            "buffers": buffers,
+            "swapused": (meminfo.get("SwapTotal", 0) -
+                         meminfo.get("SwapFree", 0)),
+        }
+
+    @classmethod
+    def _get_process(cls, pid):
+        '''
+        Resident memory (KiB) and CPU use rate (%) of process are
+        acquired from /proc/<pid>.
+        '''
+        ticks = float(os.sysconf("SC_CLK_TCK"))
+        stat = cls._read_file(str(pid), "stat")
+        fields = stat[stat.rindex(")") + 2:].split()
+        cpu_ticks = int(fields[11]) + int(fields[12])
+        uptime = float(cls._read_file("uptime").split()[0])
+        prev_ticks, prev_uptime = cls._prev_proc_cpu.get(
+            pid, (0, int(fields[19]) / ticks))
+        cls._prev_proc_cpu = {pid: (cpu_ticks, uptime)}
+        elapsed = uptime - prev_uptime
+        cpu = 0
+        if elapsed > 0:
+            cpu = round((cpu_ticks - prev_ticks) / ticks / elapsed * 100, 1)
+        page_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+        res = int(cls._read_file(str(pid), "statm").split()[1]) * page_kb
+        return {"res": res, "cpu": cpu}
+
+    @classmethod
+    def _get_disk(cls):
+        '''
+        Disk information (KiB) is acquired in the same format as "df -k".
+        '''
+        mounts = collections.OrderedDict()
+        for line in cls._read_file("mounts").splitlines():
+            items = line.split()
+            if len(items) < 2:
+                continue
+            mnt = items[1].replace("\\040", " ")
+            mounts.pop(mnt, None)
+            mounts[mnt] = items[0]
+        disk_list = []
+        for mnt, file_system in mounts.items():
+            try:
+                stat = os.statvfs(mnt)
+            except OSError:
+                continue
+            if stat.f_blocks == 0:
+                continue
+            size = stat.f_blocks * stat.f_frsize / 1024
+            used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize / 1024
+            avail = stat.f_bavail * stat.f_frsize / 1024
+            use_rate = "-"
+            if used + avail > 0:
+                use_rate = "%d%%" % (
+                    math.ceil(used * 100.0 / (used + avail)),)
+            disk_list.append("%s %d %d %d %s %s" % (
+                file_system, size, used, avail, use_rate, mnt))
+        return disk_list
+
+    @classmethod
+    def _read_net_dev(cls):
+        '''
+        Received/sent counter of each interface is acquired
+        from /proc/net/dev.
+        '''
+        net_dev = {}
+        for line in cls._read_file("net", "dev").splitlines()[2:]:
+            ifname, counter = line.split(":", 1)
+            values = [int(val) for val in counter.split()]
+            net_dev[ifname.strip()] = (values[1], values[9],
+                                       values[0], values[8],
+                                       values[6], values[15],
+                                       values[7])
+        return time.time(), net_dev
+
+    @classmethod
+    def _get_traffic(cls):
+        '''
+        Traffic information (per sec) is acquired in the same format as
+        "sar -n DEV". The first previous sample is taken by collect
+        without the lock held.
+        '''
+        now, net_dev = cls._read_net_dev()
+        prev_time, prev_dev = cls._prev_net or (now, net_dev)
+        cls._prev_net = (now, net_dev)
+        elapsed = now - prev_time
+        time_str = time.strftime("%H:%M:%S", time.localtime(now))
+        traffic_list = []
+        for ifname, values in net_dev.items():
+            prev_values = prev_dev.get(ifname, values)
+            rates = [max(val - prev, 0) / elapsed if elapsed > 0 else 0.0
+                     for val, prev in zip(values, prev_values)]
+            rates[2] /= 1024
+            rates[3] /= 1024
+            traffic_list.append(
+                "%s %s %s" % (time_str,
+                              ifname,
+                              " ".join("%.2f" % (val,) for val in rates)))
+        return traffic_list
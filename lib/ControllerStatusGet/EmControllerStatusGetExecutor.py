@@ -46,6 +46,7 @@ class EmControllerStatusGetExecutor(object):
             GlobalModule.EM_LOGGER.info(
                 "101013 Start Periodic execution " +
                 "for Em Controller status get.")
+            self.internal_status_log()
             status_data = self.controller_status_get()
             notify_list = self.compare_value(status_data)
             if notify_list:
@@ -60,6 +61,35 @@ class EmControllerStatusGetExecutor(object):
                 "101014 Complete toPeriodic execution " +
                 "for Em Controller status get.")
 
+    @decorater_log
+    def internal_status_log(self):
+        '''
+        Internal status of EM process is output to log.
+        '''
+        if GlobalModule.DB_CONTROL is not None:
+            GlobalModule.EM_LOGGER.debug(
+                "db connection pool:%s",
+                GlobalModule.DB_CONTROL.get_pool_status())
+            GlobalModule.EM_LOGGER.debug(
+                "db read cache:%s",
+                GlobalModule.DB_CONTROL.get_read_cache_status())
+        if GlobalModule.EM_ORDER_CONTROL is not None:
+            GlobalModule.EM_LOGGER.debug(
+                "order queue:%s",
+                GlobalModule.EM_ORDER_CONTROL.get_order_queue_status())
+        if GlobalModule.EM_LOG_NOTIFY is not None:
+            GlobalModule.EM_LOGGER.debug(
+                "log notify:%s",
+                GlobalModule.EM_LOG_NOTIFY.get_notify_status())
+        if GlobalModule.EM_REST_SERVER is not None:
+            from EmRestServer import get_request_latency
+            GlobalModule.EM_LOGGER.debug(
+                "rest latency:%s", get_request_latency())
+        if GlobalModule.NETCONFSSH is not None:
+            GlobalModule.EM_LOGGER.debug(
+                "netconf session:%s",
+                GlobalModule.NETCONFSSH.get_session_metrics())
+
     @decorater_log_in_out
     def controller_status_get(self):
         '''
@@ -5,7 +5,14 @@
 '''
 DB Control module.
 '''
+import contextlib
+import json
+import re
+import threading
+import time
 from oslo_db.sqlalchemy.engines import create_engine
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
 from uuid import UUID
 
 import GlobalModule
@@ -44,6 +51,69 @@ class EmDBControl(object):
 
     __delete_flg = "DELETE"
 
+    __config_filter_cols = ("platform_name",
+                            "vrf_name",
+                            "practice_system",
+                            "log_type",
+                            "get_timing")
+
+    __primary_keys = {
+        "transactionmgmtinfo": ("transaction_id",),
+        "devicestatusmgmtinfo": ("device_name", "transaction_id"),
+        "deviceregistrationinfo": ("device_name",),
+        "physicalifinfo": ("device_name", "if_name"),
+        "vlanifinfo": ("device_name", "if_name", "vlan_id", "slice_name"),
+        "lagifinfo": ("device_name", "lag_if_name"),
+        "lagmemberifinfo": ("device_name", "lag_if_name", "if_name"),
+        "l3vpnleafbgpbasicinfo": ("device_name", "neighbor_ipv4"),
+        "aclinfo": ("device_name", "acl_id"),
+        "vrfdetailinfo": ("device_name", "if_name", "vlan_id", "slice_name"),
+        "vrrpdetailinfo": ("device_name", "if_name", "vlan_id", "slice_name"),
+        "vrrptrackifinfo": ("vrrp_group_id", "track_if_name"),
+        "bgpdetailinfo": ("device_name", "if_name", "vlan_id", "slice_name"),
+        "staticroutedetailinfo": ("device_name", "if_name", "vlan_id",
+                                  "slice_name", "address_type", "address",
+                                  "prefix", "nexthop"),
+        "breakoutifinfo": ("device_name", "base_interface"),
+        "clusterlinkifinfo": ("device_name", "if_name"),
+        "dummyvlanifinfo": ("device_name", "vlan_id", "slice_name"),
+        "multihominginfo": ("device_name",),
+        "acldetailinfo": ("device_name", "acl_id", "term_name"),
+        "emsystemstatusinfo": ("service_status",),
+        "innerlinkifinfo": ("device_name", "if_name"),
+        "deviceconfigrationinfo": ("device_configration_id", "working_date"),
+        "nvradminpasswordmgmt": ("device_name",),
+    }
+
+    __foreign_keys = {
+        "devicestatusmgmtinfo": ("transactionmgmtinfo",),
+        "physicalifinfo": ("deviceregistrationinfo",),
+        "vlanifinfo": ("deviceregistrationinfo",),
+        "lagifinfo": ("deviceregistrationinfo",),
+        "lagmemberifinfo": ("lagifinfo", "physicalifinfo"),
+        "l3vpnleafbgpbasicinfo": ("deviceregistrationinfo",),
+        "aclinfo": ("deviceregistrationinfo",),
+        "vrfdetailinfo": ("vlanifinfo",),
+        "vrrpdetailinfo": ("vlanifinfo",),
+        "bgpdetailinfo": ("vlanifinfo",),
+        "staticroutedetailinfo": ("vlanifinfo",),
+        "breakoutifinfo": ("deviceregistrationinfo",),
+        "clusterlinkifinfo": ("deviceregistrationinfo",),
+        "dummyvlanifinfo": ("deviceregistrationinfo",),
+        "multihominginfo": ("deviceregistrationinfo",),
+        "acldetailinfo": ("aclinfo",),
+        "innerlinkifinfo": ("deviceregistrationinfo",),
+        "nvradminpasswordmgmt": ("deviceregistrationinfo",),
+    }
+
+    __float_columns = ("inflow_shaping_rate", "outflow_shaping_rate")
+
+    __where_col_pattern = re.compile(r"(\w+)\s*=\s*%s")
+    __table_name_pattern = re.compile(r"\b(?:FROM|INTO)\s+(\w+)",
+                                      re.IGNORECASE)
+    __read_table_pattern = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)",
+                                      re.IGNORECASE)
+
     @decorater_log
     def __init__(self):
         '''
@@ -82,9 +152,56 @@ class EmDBControl(object):
                     (':%s' % (password,) if password else '') +
                     '@%s:%s/%s' % (address, port_number, db_table))
 
+        self._pool_size = self.__read_pool_conf('DB_pool_size', 5)
+        self._pool_max_overflow = self.__read_pool_conf(
+            'DB_pool_max_overflow', 10)
+        self._pool_timeout = self.__read_pool_conf('DB_pool_timeout', 30)
+        self._pool_recycle = self.__read_pool_conf('DB_pool_recycle', 3600)
+        self._pool_pre_ping = self.__read_pool_conf('DB_pool_pre_ping', True)
+        self._write_upsert = self.__read_pool_conf('DB_write_upsert', False)
+        self._write_batch_size = self.__read_pool_conf(
+            'DB_write_batch_size', 100)
+        GlobalModule.EM_LOGGER.debug(
+            'pool size:%s overflow:%s timeout:%s recycle:%s pre_ping:%s' %
+            (self._pool_size, self._pool_max_overflow, self._pool_timeout,
+             self._pool_recycle, self._pool_pre_ping))
+        self._read_cache_enable = self.__read_pool_conf('DB_read_cache', True)
+        self._read_cache_ttl = self.__read_pool_conf('DB_read_cache_ttl', 0)
+        GlobalModule.EM_LOGGER.debug('write upsert:%s batch size:%s' %
+                                     (self._write_upsert,
+                                      self._write_batch_size))
+        GlobalModule.EM_LOGGER.debug('read cache:%s ttl:%s' %
+                                     (self._read_cache_enable,
+                                      self._read_cache_ttl))
+        self._upsert_sql_cache = {}
+
+        self._read_cache = {}
+        self._read_cache_tables = set()
+        self._read_cache_lock = threading.Lock()
+        self._read_cache_stat = {"hit": 0,
+                                 "miss": 0,
+                                 "invalidate": 0}
+
+        self._thread_conn = threading.local()
+        self._pool_stat_lock = threading.Lock()
+        self._pool_stat = {"checkout": 0,
+                           "checkout_time_total": 0.0,
+                           "checkout_time_max": 0.0,
+                           "exhausted": 0,
+                           "timeout": 0,
+                           "disconnected": 0}
+
         GlobalModule.EM_LOGGER.debug('URL = %s' % (self.url,))
         try:
-            self.engine = create_engine(self.url)
+            self.engine = create_engine(
+                self.url,
+                max_pool_size=self._pool_size,
+                max_overflow=self._pool_max_overflow,
+                pool_timeout=self._pool_timeout)
+            event.listen(self.engine, "connect", self.__on_pool_connect)
+            event.listen(self.engine, "checkout", self.__on_pool_checkout)
+            event.listen(self.engine, "commit", self.__on_commit)
+            event.listen(self.engine, "rollback", self.__on_rollback)
         except Exception, ex_message:
             GlobalModule.EM_LOGGER.error(
                 '305003 Database Control Error')
@@ -93,35 +210,391 @@ class EmDBControl(object):
             raise
         GlobalModule.EM_LOGGER.debug('end')
 
+    @staticmethod
+    @decorater_log
+    def __read_pool_conf(conf_key, default_value):
+        '''
+        Obtain connection pool setting from system common definition.
+        Explanation about parameter:
+            conf_key : config key name (str)
+            default_value : value used if the key is not defined
+        Return value:
+            setting value
+        '''
+        is_conf, value = (
+            GlobalModule.EM_CONFIG.read_sys_common_conf(conf_key))
+        if not is_conf or value is None or value == "":
+            value = default_value
+        return value
+
+    @staticmethod
+    def __on_pool_connect(dbapi_conn, connection_record):
+        '''
+        Record time of connecting to DB.
+        (Launched by connection pool when new DB connection is created.)
+        Explanation about parameter:
+            dbapi_conn : DBAPI connection
+            connection_record : connection record of pool
+        Return value:
+            None
+        '''
+        connection_record.info["em_connect_time"] = time.time()
+
+    def __on_pool_checkout(self, dbapi_conn, connection_record, conn_proxy):
+        '''
+        Check DB connection when it is taken out of connection pool.
+        Connection which is older than recycle time or does not respond
+        is discarded, and pool reconnects to DB.
+        (Launched by connection pool at checkout.)
+        Explanation about parameter:
+            dbapi_conn : DBAPI connection
+            connection_record : connection record of pool
+            conn_proxy : connection proxy
+        Return value:
+            None
+        '''
+        connect_time = connection_record.info.get("em_connect_time")
+        if (self._pool_recycle > 0 and connect_time is not None and
+                time.time() - connect_time > self._pool_recycle):
+            with self._pool_stat_lock:
+                self._pool_stat["disconnected"] += 1
+            raise sa_exc.DisconnectionError('connection is recycled')
+        if not self._pool_pre_ping:
+            return
+        cursor = None
+        try:
+            cursor = dbapi_conn.cursor()
+            cursor.execute("SELECT 1")
+        except Exception, ex_message:
+            GlobalModule.EM_LOGGER.debug(
+                'db ping error = %s' % (ex_message,))
+            with self._pool_stat_lock:
+                self._pool_stat["disconnected"] += 1
+            raise sa_exc.DisconnectionError('connection is not alive')
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+    def __on_commit(self, conn):
+        '''
+        Remove read cache of the tables written in the transaction.
+        (Launched by engine at every commit including auto commit.)
+        Explanation about parameter:
+            conn : Connection object
+        Return value:
+            None
+        '''
+        for written in conn.info.pop("em_written", ()):
+            self.__invalidate_read_cache(*written)
+
+    @staticmethod
+    def __on_rollback(conn):
+        '''
+        Discard the tables written in the transaction.
+        (Launched by engine at rollback.)
+        Explanation about parameter:
+            conn : Connection object
+        Return value:
+            None
+        '''
+        conn.info.pop("em_written", None)
 
     @decorater_log
     def __connect_db(self):
         '''
         Connected to each DB
+        (If the connection for the thread is held, it is reused.)
         Explanation about the parameters:
             url : Location of each DB
         Return value:
             conn : Connection object to each DB
         '''
-        conn = self.engine.connect()
+        conn = getattr(self._thread_conn, "conn", None)
+        if conn is not None and not conn.closed and not conn.invalidated:
+            return conn
+
+        pool = self.engine.pool
+        is_exhausted = (
+            pool.checkedout() >= self._pool_size + self._pool_max_overflow)
+        start_time = time.time()
+        try:
+            conn = self.engine.connect()
+        except sa_exc.TimeoutError:
+            with self._pool_stat_lock:
+                self._pool_stat["exhausted"] += int(is_exhausted)
+                self._pool_stat["timeout"] += 1
+            raise
+        checkout_time = (time.time() - start_time) * 1000
+        with self._pool_stat_lock:
+            self._pool_stat["checkout"] += 1
+            self._pool_stat["checkout_time_total"] += checkout_time
+            self._pool_stat["checkout_time_max"] = max(
+                self._pool_stat["checkout_time_max"], checkout_time)
+            self._pool_stat["exhausted"] += int(is_exhausted)
         GlobalModule.EM_LOGGER.info('105001 Database Control Start')
 
+        if getattr(self._thread_conn, "depth", 0) > 0:
+            self._thread_conn.conn = conn
         return conn
 
-    @staticmethod
     @decorater_log
-    def __close_db(conn):
+    def __close_db(self, conn):
         '''
         Close the connection to each DB.
+        (The connection held for the thread is not closed.)
         Explanation about parameter:
             connect : Connection object to each DB
         Return value:
             None
         '''
+        if conn is not None and conn is getattr(self._thread_conn,
+                                                "conn", None):
+            return
         if conn and not conn.closed:
             conn.close()
         GlobalModule.EM_LOGGER.info('105002 Database Control End')
 
+    @contextlib.contextmanager
+    def thread_connection(self):
+        '''
+        Hold one DB connection for the current thread while in with-block,
+        and reuse it for each read and write in the block.
+        Usage:
+            with GlobalModule.DB_CONTROL.thread_connection():
+                (read_*_info / write_*_info)
+        '''
+        depth = getattr(self._thread_conn, "depth", 0)
+        self._thread_conn.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._thread_conn.depth = depth
+            if depth == 0:
+                conn = getattr(self._thread_conn, "conn", None)
+                self._thread_conn.conn = None
+                self.__close_db(conn)
+
+    @decorater_log_in_out
+    def get_pool_status(self):
+        '''
+        Obtain status of DB connection pool.
+        Explanation about parameter:
+            None
+        Return value:
+            pool status : dict
+                pool_size : size of pool (int)
+                max_overflow : maximum overflow of pool (int)
+                checked_out : connections in use (int)
+                checkout : number of checkout (int)
+                checkout_time_average : average checkout latency (ms)
+                checkout_time_max : maximum checkout latency (ms)
+                exhausted : number of checkout with no idle connection (int)
+                timeout : number of checkout timeout (int)
+                disconnected : number of discarded connection (int)
+        '''
+        with self._pool_stat_lock:
+            stat = self._pool_stat.copy()
+        checkout_num = stat["checkout"]
+        return {
+            "pool_size": self._pool_size,
+            "max_overflow": self._pool_max_overflow,
+            "checked_out": self.engine.pool.checkedout(),
+            "checkout": checkout_num,
+            "checkout_time_average": (
+                stat["checkout_time_total"] / checkout_num
+                if checkout_num else 0.0),
+            "checkout_time_max": stat["checkout_time_max"],
+            "exhausted": stat["exhausted"],
+            "timeout": stat["timeout"],
+            "disconnected": stat["disconnected"],
+        }
+
+    @decorater_log_in_out
+    def begin_read_cache(self, device_names):
+        '''
+        Start read cache of the devices.
+        (Launched at the start of the order for the devices.)
+        Explanation about parameter:
+            device_names : device name list
+        Return value:
+            None
+        '''
+        if not self._read_cache_enable:
+            return
+        with self._read_cache_lock:
+            for device_name in device_names:
+                entry = self.__get_read_cache_entry(device_name)
+                if entry is None:
+                    entry = {"scope": 0,
+                             "expire": None,
+                             "generation": 0,
+                             "data": {}}
+                    self._read_cache[device_name] = entry
+                entry["scope"] += 1
+                entry["expire"] = None
+
+    @decorater_log_in_out
+    def end_read_cache(self, device_names):
+        '''
+        End read cache of the devices.
+        (Launched at the end of the order for the devices.
+         Cache is kept for DB_read_cache_ttl seconds after that.)
+        Explanation about parameter:
+            device_names : device name list
+        Return value:
+            None
+        '''
+        if not self._read_cache_enable:
+            return
+        with self._read_cache_lock:
+            for device_name in device_names:
+                entry = self._read_cache.get(device_name)
+                if entry is None:
+                    continue
+                entry["scope"] -= 1
+                if entry["scope"] > 0:
+                    continue
+                entry["scope"] = 0
+                if self._read_cache_ttl > 0:
+                    entry["expire"] = time.time() + self._read_cache_ttl
+                else:
+                    del self._read_cache[device_name]
+
+    @decorater_log_in_out
+    def get_read_cache_status(self):
+        '''
+        Obtain status of read cache.
+        Explanation about parameter:
+            None
+        Return value:
+            read cache status : dict
+                hit : number of reads from cache (int)
+                miss : number of reads from DB while cache is valid (int)
+                hit_rate : hit / (hit + miss) (float)
+                invalidate : number of invalidation by writes (int)
+                devices : number of devices whose cache is held (int)
+        '''
+        with self._read_cache_lock:
+            stat = self._read_cache_stat.copy()
+            device_num = len(self._read_cache)
+        read_num = stat["hit"] + stat["miss"]
+        return {
+            "hit": stat["hit"],
+            "miss": stat["miss"],
+            "hit_rate": (float(stat["hit"]) / read_num if read_num else 0.0),
+            "invalidate": stat["invalidate"],
+            "devices": device_num,
+        }
+
+    @decorater_log
+    def __get_read_cache_entry(self, device_name):
+        '''
+        Obtain valid read cache of the device.
+        (Expired cache is removed. Call with read cache lock.)
+        Explanation about parameter:
+            device_name : device name
+        Return value:
+            read cache : dict (None if not valid)
+        '''
+        entry = self._read_cache.get(device_name)
+        if entry is None or entry["scope"] > 0:
+            return entry
+        if entry["expire"] is not None and entry["expire"] > time.time():
+            return entry
+        del self._read_cache[device_name]
+        return None
+
+    @classmethod
+    @decorater_log
+    def __get_sql_tables(cls, sql):
+        '''
+        Obtain table names referred by SELECT sentence.
+        Explanation about parameter:
+            sql : SELECT sentence (str)
+        Return value:
+            table names (lower case) : set
+        '''
+        return set(
+            name.lower() for name in cls.__read_table_pattern.findall(sql))
+
+    @classmethod
+    @decorater_log
+    def __get_cascade_tables(cls, table_name):
+        '''
+        Obtain the table and the tables referring it by foreign key.
+        Explanation about parameter:
+            table_name : table name (lower case)
+        Return value:
+            table names (lower case) : set
+        '''
+        tables = set([table_name])
+        parents = [table_name]
+        while parents:
+            parent = parents.pop()
+            for child, child_parents in cls.__foreign_keys.items():
+                if parent in child_parents and child not in tables:
+                    tables.add(child)
+                    parents.append(child)
+        return tables
+
+    @staticmethod
+    @decorater_log
+    def __add_written(conn, select_query, delete_query, where_param):
+        '''
+        Keep the table written by __exec_write_sql until commit.
+        Explanation about parameter:
+            conn : Connection object
+            select_query : SELECT sentence (str)
+            delete_query : DELETE sentence (str)
+            where_param :  WHERE phrase parameter (tuple)
+        Return value:
+            None
+        '''
+        conn.info.setdefault("em_written", []).append(
+            (select_query, delete_query, where_param))
+
+    @decorater_log
+    def __invalidate_read_cache(self, select_query, delete_query, where_param):
+        '''
+        Remove read cache of the table written by __exec_write_sql.
+        (Launched when the transaction is committed.)
+        (If WHERE phrase has device_name, only cache of the device is
+         removed, otherwise cache of all devices is removed.)
+        Explanation about parameter:
+            select_query : SELECT sentence (str)
+            delete_query : DELETE sentence (str)
+            where_param :  WHERE phrase parameter (tuple)
+        Return value:
+            None
+        '''
+        if not self._read_cache_enable:
+            return
+        query = select_query or delete_query
+        tables = self.__get_cascade_tables(
+            self.__table_name_pattern.search(query).group(1).lower())
+        device_name = None
+        for col, value in zip(self.__where_col_pattern.findall(query),
+                              where_param or ()):
+            if col.lower() == "device_name":
+                device_name = value
+        with self._read_cache_lock:
+            if tables.isdisjoint(self._read_cache_tables):
+                return
+            if device_name is None:
+                entries = self._read_cache.values()
+            else:
+                entries = [self._read_cache[device_name]] if (
+                    device_name in self._read_cache) else []
+            for entry in entries:
+                entry["generation"] += 1
+                for sql in entry["data"].keys():
+                    if not tables.isdisjoint(self.__get_sql_tables(sql)):
+                        del entry["data"][sql]
+            self._read_cache_stat["invalidate"] += 1
+
     @staticmethod
     @decorater_log
     def __close_result(result):
@@ -170,9 +643,94 @@ class EmDBControl(object):
                 % (param, isinstance(param, parms_class)))
         return is_ok
 
+    @decorater_log
+    def __gen_upsert_sql(self, table_name, where_query_str, *table_cols):
+        '''
+        Create INSERT/UPDATE sentences.
+        (Created sentences are cached for each table and WHERE phrase.)
+        If DB_write_upsert is true and WHERE phrase specifies primary key
+        of the table, "INSERT ... ON CONFLICT" sentence is returned
+        as INSERT sentence and None is returned as UPDATE sentence.
+        Parameter:
+            table_name : Table name
+            where_query_str : List of letter strings which start with where and can work as phrases.
+            *table_cols : DB item name (set any numbers you like)
+        Return value:
+            INSERT sentence : str
+            UPDATE sentence : str
+        '''
+        cache_key = (table_name, tuple(where_query_str), table_cols)
+        sql = self._upsert_sql_cache.get(cache_key)
+        if sql is None:
+            if self._write_upsert:
+                sql = self.__gen_on_conflict_sql(
+                    table_name, where_query_str, *table_cols)
+            if sql is None:
+                sql = self.__gen_insert_update_sql(
+                    table_name, where_query_str, *table_cols)
+            self._upsert_sql_cache[cache_key] = sql
+        return sql
+
+    @classmethod
+    @decorater_log
+    def __gen_on_conflict_sql(cls, table_name, where_query_str, *table_cols):
+        '''
+        Create "INSERT ... ON CONFLICT (primary key) DO UPDATE" sentence.
+        Parameter:
+            table_name : Table name
+            where_query_str : List of letter strings which start with where and can work as phrases.
+            *table_cols : DB item name (set any numbers you like)
+        Return value:
+            INSERT sentence : str
+                (None if WHERE phrase is not equal to primary key)
+            UPDATE sentence : None
+        '''
+        key_cols = cls.__primary_keys.get(table_name.lower())
+        if not key_cols:
+            return None
+        where_str = ' '.join(where_query_str)
+        if re.search(r"\bOR\b", where_str, re.IGNORECASE):
+            return None
+        where_cols = set(
+            col.lower() for col in cls.__where_col_pattern.findall(where_str))
+        lower_cols = [col.lower() for col in table_cols]
+        if (where_cols != set(key_cols) or
+                not set(key_cols).issubset(lower_cols)):
+            return None
+
+        update_list = []
+        for col in table_cols:
+            if col.lower() in key_cols:
+                continue
+            if update_list:
+                update_list.append("     ,%s = EXCLUDED.%s" % (col, col))
+            else:
+                update_list.append("     %s = EXCLUDED.%s" % (col, col))
+
+        query_str = []
+        query_str.append("INSERT INTO")
+        query_str.append("    %s" % (table_name,))
+        query_str.append("(")
+        query_str.append(",".join(table_cols))
+        query_str.append(")")
+        query_str.append("VALUES")
+        query_str.append("(")
+        query_str.append(",".join(["%s"] * len(table_cols)))
+        query_str.append(")")
+        query_str.append("ON CONFLICT")
+        query_str.append("(")
+        query_str.append(",".join(key_cols))
+        query_str.append(")")
+        if update_list:
+            query_str.append("DO UPDATE SET")
+            query_str.extend(update_list)
+        else:
+            query_str.append("DO NOTHING")
+        return ' '.join(query_str), None
+
     @staticmethod
     @decorater_log
-    def __gen_upsert_sql(table_name, where_query_str, *table_cols):
+    def __gen_insert_update_sql(table_name, where_query_str, *table_cols):
         '''
         Create INSERT/UPDATE sentences.
         Parameter:
@@ -306,6 +864,7 @@ class EmDBControl(object):
         GlobalModule.EM_LOGGER.debug('EXEC SQL : ' + sql % where_tuple)
         try:
             conn = self.__connect_db()
+            self.__flush_write_batch(conn)
             result = conn.execute(sql, where_tuple)
             out_data = self.__output_select_result(result)
             is_ok = True
@@ -320,6 +879,100 @@ class EmDBControl(object):
             self.__close_db(conn)
         return is_ok, out_data
 
+    @decorater_log
+    def __execute_device_read_sql(self, device_name, sql):
+        '''
+        Issue SELECT sentence of one device through read cache.
+        (Result is cached while order for the device is in progress,
+         and it is removed when the device is written.)
+        Parameter:
+            device_name : Device name (str)
+            sql : SQL sentence to be issued (SELECT sentence only) (str)
+        Return value:
+            Execution result : boolean
+            Acquisition result : tuple
+        '''
+        out_data, cache_state = self.__lookup_read_cache(device_name, sql)
+        if out_data is not None:
+            return True, out_data
+        is_ok, out_data = self.__execute_read_sql((device_name,), sql)
+        if is_ok:
+            self.__store_read_cache(device_name, sql, cache_state, out_data)
+        return is_ok, out_data
+
+    @decorater_log
+    def __lookup_read_cache(self, device_name, sql):
+        '''
+        Obtain SELECT result of one device from read cache.
+        Parameter:
+            device_name : Device name (str)
+            sql : SELECT sentence (str)
+        Return value:
+            Acquisition result : tuple (None if not cached)
+            Cache state to store the result : tuple
+                (None if read cache is not valid)
+        '''
+        if not self._read_cache_enable:
+            return None, None
+        with self._read_cache_lock:
+            entry = self.__get_read_cache_entry(device_name)
+            if entry is None:
+                return None, None
+            if sql in entry["data"]:
+                self._read_cache_stat["hit"] += 1
+                return tuple(dict(row) for row in entry["data"][sql]), None
+            self._read_cache_stat["miss"] += 1
+            self._read_cache_tables.update(self.__get_sql_tables(sql))
+            return None, (entry, entry["generation"])
+
+    @decorater_log
+    def __store_read_cache(self, device_name, sql, cache_state, out_data):
+        '''
+        Store SELECT result of one device to read cache.
+        (Not stored if the device is written after __lookup_read_cache.)
+        Parameter:
+            device_name : Device name (str)
+            sql : SELECT sentence (str)
+            cache_state : Cache state returned by __lookup_read_cache
+            out_data : Acquisition result (tuple)
+        Return value:
+            None
+        '''
+        if cache_state is None:
+            return
+        entry, generation = cache_state
+        with self._read_cache_lock:
+            if (self._read_cache.get(device_name) is entry and
+                    entry["generation"] == generation):
+                entry["data"][sql] = tuple(dict(row) for row in out_data)
+
+    @classmethod
+    @decorater_log
+    def __convert_json_rows(cls, json_rows):
+        '''
+        Convert the rows aggregated by json_agg to the style of
+        SELECT results (same as __output_select_result).
+        Parameter:
+            json_rows : JSON array of rows (list or str)
+        Return value:
+            Acquisition result : tuple
+        '''
+        if json_rows is None:
+            return ()
+        if isinstance(json_rows, basestring):
+            json_rows = json.loads(json_rows)
+        rowlist = []
+        for json_row in json_rows:
+            rowdict = {}
+            for key, value in json_row.items():
+                if isinstance(value, unicode):
+                    value = str(value)
+                elif key in cls.__float_columns and value is not None:
+                    value = float(value)
+                rowdict[str(key)] = value
+            rowlist.append(rowdict)
+        return tuple(rowlist)
+
     @decorater_log
     def __exec_write_sql(self,
                          select_query,
@@ -336,14 +989,37 @@ class EmDBControl(object):
             select_query : SELECT sentence (str)
             insert_query : INSERT sentence (str)
             update_query : UPDATE sentence (str)
+                (If None, INSERT sentence is "INSERT ... ON CONFLICT"
+                 and it is issued without SELECT.)
             delete_query : DELETE sentence (str)
             upsert_param : UPDATE/INSERT parameter (tuple)
             where_param :  WHERE phrase parameter (tuple)
             db_control : DB control (DELETE should be launched in case of DELETE.)
             conn : Connection object
+                (In write_simultaneous_table, DELETE and
+                 INSERT ... ON CONFLICT of the same SQL in a row are kept
+                 and issued together before the next other SQL.)
         Return value:
             Execution result : boolean
         '''
+        write_batch = getattr(self._thread_conn, "write_batch", None)
+        if (write_batch is not None and conn is write_batch["conn"] and
+                self._write_batch_size > 1):
+            if db_control == self.__delete_flg:
+                batch_sql, batch_param = delete_query, where_param
+            elif update_query is None:
+                batch_sql, batch_param = insert_query, upsert_param
+            else:
+                batch_sql, batch_param = None, None
+            if batch_sql != write_batch["sql"]:
+                self.__flush_write_batch(conn)
+            if batch_sql is not None:
+                self.__add_written(conn, select_query,
+                                   delete_query, where_param)
+                write_batch["sql"] = batch_sql
+                write_batch["params"].append(batch_param)
+                return True
+
         is_auto_commit = False
         result = None
         return_val = False
@@ -351,11 +1027,17 @@ class EmDBControl(object):
             if conn is None:
                 is_auto_commit = True
                 conn = self.__connect_db()
+            self.__add_written(conn, select_query, delete_query, where_param)
             if db_control == self.__delete_flg:
                 GlobalModule.EM_LOGGER.debug(
                     'EXEC SQL : ' + delete_query % where_param)
                 result = conn.execute(delete_query, where_param)
                 return_val = True
+            elif update_query is None:
+                GlobalModule.EM_LOGGER.debug(
+                    'EXEC SQL : ' + insert_query % upsert_param)
+                result = conn.execute(insert_query, upsert_param)
+                return_val = True
             else:
                 GlobalModule.EM_LOGGER.debug(
                     'EXEC SQL : ' + select_query % where_param)
@@ -388,6 +1070,68 @@ class EmDBControl(object):
                 self.__close_db(conn)
         return return_val
 
+    @decorater_log
+    def __flush_write_batch(self, conn):
+        '''
+        Issue DELETE / INSERT ... ON CONFLICT sentences kept in
+        write_simultaneous_table.
+        (Launched before other SQL is issued on the connection.)
+        Parameter:
+            conn : Connection object (in transaction)
+        Return value:
+            None
+        '''
+        write_batch = getattr(self._thread_conn, "write_batch", None)
+        if (write_batch is None or conn is not write_batch["conn"] or
+                not write_batch["params"]):
+            return
+        sql = write_batch["sql"]
+        param_list = write_batch["params"]
+        write_batch["sql"] = None
+        write_batch["params"] = []
+        cursor = conn.connection.cursor()
+        try:
+            self.__execute_batch(cursor, sql, param_list)
+        finally:
+            cursor.close()
+
+    @decorater_log
+    def __execute_batch(self, cursor, sql, param_list):
+        '''
+        Issue the same SQL sentence for each parameter.
+        (Sentences are sent together for each DB_write_batch_size.
+         If it fails, sentences are issued one by one again
+         to find the sentence which causes the error.)
+        Parameter:
+            cursor : DBAPI cursor
+            sql : SQL sentence (str)
+            param_list : list of parameter (tuple)
+        Return value:
+            None
+        '''
+        page_size = max(self._write_batch_size, 1)
+        for index in range(0, len(param_list), page_size):
+            page = param_list[index:index + page_size]
+            GlobalModule.EM_LOGGER.debug(
+                'EXEC SQL (%s rows) : %s' % (len(page), sql))
+            statements = [cursor.mogrify(sql, param) for param in page]
+            if len(statements) == 1:
+                cursor.execute(statements[0])
+                continue
+            try:
+                cursor.execute(";".join(["SAVEPOINT em_write_batch"] +
+                                        statements +
+                                        ["RELEASE SAVEPOINT em_write_batch"]))
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT em_write_batch")
+                for statement in statements:
+                    try:
+                        cursor.execute(statement)
+                    except Exception, ex_message:
+                        GlobalModule.EM_LOGGER.debug(
+                            'EXEC SQL failed : %s (%s)' %
+                            (statement, ex_message))
+                        raise
 
     @decorater_log_in_out
     def read_transactionid_list(self):
@@ -410,6 +1154,90 @@ class EmDBControl(object):
                 ret_list.append(item["transaction_id"])
         return is_ok, ret_list
 
+    @decorater_log_in_out
+    def read_device_snapshot(self, device_name, tables):
+        '''
+        The method which returns the information of several tables of one device.
+        Tables which are not in read cache are read by one SELECT sentence.
+        Explanation about parameter:
+            device_name:Device name
+            tables:Table name list (table_* of this class)
+        Return value:
+            Execution result : boolean(True or False)
+            Refer to each table : dict {Table name : tuple}
+                (tuple is the same as read_*_info of the table)
+        '''
+        if not self.__check_parameter(device_name, str, not_null=True):
+            GlobalModule.EM_LOGGER.error('305003 Database Control Error')
+            return False, None
+
+        snapshot = {}
+        read_list = []
+        for table_name in set(tables):
+            sql = self.__gen_device_select_sql(table_name)
+            out_data, cache_state = self.__lookup_read_cache(device_name, sql)
+            if out_data is None:
+                read_list.append((table_name, sql, cache_state))
+            else:
+                snapshot[table_name] = out_data
+        if not read_list:
+            return True, snapshot
+
+        query_str = []
+        for index, read_table in enumerate(read_list):
+            query_str.append(
+                "SELECT %d AS em_index," % (index,) +
+                " (SELECT json_agg(em_row) FROM ( " + read_table[1] +
+                " ) AS em_row) AS em_rows")
+        q_str = " UNION ALL ".join(query_str)
+
+        is_ok, out_data = self.__execute_read_sql(
+            (device_name,) * len(read_list), q_str)
+        if not is_ok:
+            return False, None
+        for row in out_data:
+            table_name, sql, cache_state = read_list[row["em_index"]]
+            table_data = self.__convert_json_rows(row["em_rows"])
+            self.__store_read_cache(device_name, sql, cache_state, table_data)
+            snapshot[table_name] = table_data
+        return True, snapshot
+
+    @decorater_log
+    def __gen_device_select_sql(self, table_name):
+        '''
+        Create SELECT sentence of one device used by read_*_info.
+        Parameter:
+            table_name : Table name
+        Return value:
+            SELECT sentence : str
+        '''
+        if table_name.lower() == self.table_VrrpTrackIfInfo.lower():
+            return self.__gen_vrrp_trackif_select_sql()
+        return self.__gen_select_sql(table_name, ["WHERE device_name = %s"])
+
+    @staticmethod
+    @decorater_log
+    def __gen_vrrp_trackif_select_sql():
+        '''
+        Create SELECT sentence of VRRP track interface information of
+        one device.
+        Parameter:
+            None
+        Return value:
+            SELECT sentence : str
+        '''
+        query_str = []
+        query_str.append("SELECT DISTINCT")
+        query_str.append("     track.vrrp_group_id AS vrrp_group_id")
+        query_str.append("    ,track.track_if_name AS track_if_name")
+        query_str.append("    FROM")
+        query_str.append("        VrrpTrackIfInfo AS track")
+        query_str.append("    INNER JOIN VrrpDetailInfo AS vrrp ON")
+        query_str.append("        track.vrrp_group_id = vrrp.vrrp_group_id")
+        query_str.append("    WHERE")
+        query_str.append("        vrrp.device_name = %s")
+        return ' '.join(query_str)
+
     @decorater_log_in_out
     def initialize_order_mgmt_info(self):
         '''
@@ -873,7 +1701,22 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
+
+    @decorater_log_in_out
+    def read_device_regist_all_info(self):
+        '''
+        The method which returns the information of all equipments in the equipment registration information table.
+        Return value:
+            Execution result : boolean(True or False)
+            Refer to the equipment status management information table : tuple
+        '''
+        table_name = self.table_DeviceRegistrationInfo
+
+        where_query_str = ["ORDER BY device_name"]
+        q_str = self.__gen_select_sql(table_name, where_query_str)
+
+        return self.__execute_read_sql((), q_str)
 
     @decorater_log_in_out
     def write_vlanif_info(self,
@@ -1116,7 +1959,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_lagif_info(self,
@@ -1229,7 +2072,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_lagmemberif_info(self,
@@ -1323,7 +2166,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_leaf_bgp_basic_info(self,
@@ -1419,7 +2262,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_vrf_detail_info(self,
@@ -1567,7 +2410,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_vrrp_detail_info(self,
@@ -1683,7 +2526,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_vrrp_trackif_info(self,
@@ -1761,19 +2604,9 @@ class EmDBControl(object):
             GlobalModule.EM_LOGGER.error('305003 Database Control Error')
             return False, None
 
-        query_str = []
-        query_str.append("SELECT DISTINCT")
-        query_str.append("     track.vrrp_group_id AS vrrp_group_id")
-        query_str.append("    ,track.track_if_name AS track_if_name")
-        query_str.append("    FROM")
-        query_str.append("        VrrpTrackIfInfo AS track")
-        query_str.append("    INNER JOIN VrrpDetailInfo AS vrrp ON")
-        query_str.append("        track.vrrp_group_id = vrrp.vrrp_group_id")
-        query_str.append("    WHERE")
-        query_str.append("        vrrp.device_name = %s")
-        q_str = ' '.join(query_str)
+        q_str = self.__gen_vrrp_trackif_select_sql()
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_bgp_detail_info(self,
@@ -1905,7 +2738,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_static_route_detail_info(self,
@@ -2030,13 +2863,15 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_simultaneous_table(self, functions, params):
         '''
         Establish the DB connection which carries transaction and execute one by one using the parameter
         which has the method featuring data-feeding style.
+        (DELETE and INSERT ... ON CONFLICT of the same SQL in a row are
+         issued together if DB_write_batch_size is more than 1.)
         Parameter:
             functions:Method list
             params:Parameter list
@@ -2093,12 +2928,16 @@ class EmDBControl(object):
             con = self.__connect_db()
             db_trans = con.begin()
 
+            self._thread_conn.write_batch = {"conn": con,
+                                             "sql": None,
+                                             "params": []}
             for index, func in enumerate(functions):
                 param = params[index].copy()
                 target_func = func_dict[func.__name__]
                 is_upsert_ok = target_func(conn=con, **param)
                 if not is_upsert_ok:
                     raise ValueError
+            self.__flush_write_batch(con)
 
             db_trans.commit()
             is_insert = True
@@ -2111,6 +2950,7 @@ class EmDBControl(object):
                 'db_error_message = %s' % (ex_message,))
             is_insert = False
         finally:
+            self._thread_conn.write_batch = None
             self.__close_db(con)
         return is_insert
 
@@ -2202,7 +3042,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_cluster_link_if_info(self,
@@ -2309,7 +3149,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_breakout_if_info(self,
@@ -2404,7 +3244,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_inner_link_if_info(self,
@@ -2522,7 +3362,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_system_status_info(self,
@@ -2693,7 +3533,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def read_acl_all_info(self,):
@@ -2873,7 +3713,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def read_acl_detail_all_info(self):
@@ -3030,7 +3870,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def write_multi_homing_info(self,
@@ -3137,7 +3977,7 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
 
     @decorater_log_in_out
     def read_multi_homing_all_info(self):
@@ -3222,6 +4062,8 @@ class EmDBControl(object):
                                        log_type=None,
                                        get_timing=None,
                                        config_file=None,
+                                       base_configration_id=None,
+                                       delta_num=None,
                                        conn=None):
         '''
         Method which registers, updates  and deletes configuration information table
@@ -3236,7 +4078,10 @@ class EmDBControl(object):
             practice_system:acting system
             log_type:log type
             get_timing:timing of obtaining
-            config_file:configuration file
+            config_file:configuration file (delta if delta_num > 0)
+            base_configration_id:ID of full configuration of delta
+            delta_num:number of deltas after full configuration
+                      (0 or None : full configuration)
         Return Value:
            Execution Result : boolean(True or False)
 
@@ -3262,6 +4107,12 @@ class EmDBControl(object):
                      self.__check_parameter(get_timing, int, not_null=False))
             is_ok = (is_ok and
                      self.__check_parameter(config_file, str, not_null=True))
+            is_ok = (
+                is_ok and
+                self.__check_parameter(base_configration_id, int,
+                                       not_null=False))
+            is_ok = (is_ok and
+                     self.__check_parameter(delta_num, int, not_null=False))
 
         if not is_ok:
             GlobalModule.EM_LOGGER.error('305003 Database Control Error')
@@ -3279,6 +4130,8 @@ class EmDBControl(object):
         tmp_list.append(log_type)
         tmp_list.append(get_timing)
         tmp_list.append(config_file)
+        tmp_list.append(base_configration_id)
+        tmp_list.append(delta_num or 0)
         upsert_param = tuple(tmp_list)
 
         where_query_str = []
@@ -3302,7 +4155,9 @@ class EmDBControl(object):
                                   "practice_system",
                                   "log_type",
                                   "get_timing",
-                                  "config_file"))
+                                  "config_file",
+                                  "base_configration_id",
+                                  "delta_num"))
 
         return self.__exec_write_sql(select_query,
                                      insert_query,
@@ -3332,7 +4187,69 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
+
+    @decorater_log_in_out
+    def read_latest_device_configration_info(self,
+                                             device_name,
+                                             **filter_data):
+        '''
+        Method which returns the newest record of coniguration information table.
+        (Index of device name, working date/time and configuration ID
+         is used.)
+        Parameter:
+            device_name: device name
+            filter_data: refined condition (item name : value)
+        Return Value:
+            Execution Result : boolean(True or False)
+            Configuration information table (newest record only) : tuple
+        '''
+        table_name = self.table_DeviceConfigrationinfo
+
+        if not self.__check_parameter(device_name, str, not_null=True):
+            GlobalModule.EM_LOGGER.error('305003 Database Control Error')
+            return False, None
+
+        where_param = [device_name]
+        where_query_str = ["WHERE device_name = %s"]
+        for key in sorted(filter_data.keys()):
+            if key not in self.__config_filter_cols:
+                GlobalModule.EM_LOGGER.error('305003 Database Control Error')
+                return False, None
+            if filter_data[key] is None:
+                where_query_str.append("AND %s IS NULL" % (key,))
+            else:
+                where_query_str.append("AND %s = %%s" % (key,))
+                where_param.append(filter_data[key])
+        where_query_str.append("ORDER BY working_date DESC,"
+                               " working_time DESC,"
+                               " device_configration_id DESC")
+        where_query_str.append("LIMIT 1")
+        q_str = self.__gen_select_sql(table_name, where_query_str)
+
+        return self.__execute_read_sql(tuple(where_param), q_str)
+
+    @decorater_log_in_out
+    def read_device_configration_id_info(self, device_configration_id):
+        '''
+        Method which returns one record of coniguration information table.
+        Parameter:
+            device_configration_id: configuration ID
+        Return Value:
+            Execution Result : boolean(True or False)
+            Configuration information table : tuple
+        '''
+        table_name = self.table_DeviceConfigrationinfo
+
+        if not self.__check_parameter(device_configration_id, int,
+                                      not_null=True):
+            GlobalModule.EM_LOGGER.error('305003 Database Control Error')
+            return False, None
+
+        where_query_str = ["WHERE device_configration_id = %s"]
+        q_str = self.__gen_select_sql(table_name, where_query_str)
+
+        return self.__execute_read_sql((device_configration_id,), q_str)
 
     @decorater_log_in_out
     def write_nvr_administrator_password_info(self,
@@ -3410,4 +4327,4 @@ class EmDBControl(object):
         where_query_str = ["WHERE device_name = %s"]
         q_str = self.__gen_select_sql(table_name, where_query_str)
 
-        return self.__execute_read_sql((device_name,), q_str)
+        return self.__execute_device_read_sql(device_name, q_str)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+# Filename: EmDBIndexedRows.py
+'''
+Hash-indexed line data list module of DB.
+'''
+
+
+class EmDBIndexedRows(object):
+    '''
+    Line data list of DB with hash index.
+    (It is used instead of the line data list(tuple of dict) returned
+     by DB read. Hash index is created for each combination of keys
+     when it is used for the first time, so that the rows are searched
+     without scanning all rows every time.)
+    '''
+
+    def __init__(self, rows=None):
+        '''
+        Constructor
+        Explanation about parameter:
+            rows : line data list of DB (tuple of dict)
+        '''
+        if isinstance(rows, EmDBIndexedRows):
+            rows = rows._rows
+        self._rows = tuple(rows or ())
+        self._index = {}
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        return self._rows[index]
+
+    def __nonzero__(self):
+        return len(self._rows) > 0
+
+    def __repr__(self):
+        return repr(self._rows)
+
+    def select(self, **filters):
+        '''
+        Rows whose values are equal to all filters are acquired.
+        (A key which does not exist in the row is regarded as None.)
+        Explanation about parameter:
+            filters : key and value of filter
+        Explanation about return value:
+            rows in original order : list
+        '''
+        if not filters:
+            return list(self._rows)
+        keys = tuple(sorted(filters))
+        try:
+            index = self._get_index(keys)
+            return list(index.get(tuple(filters[key] for key in keys), ()))
+        except TypeError:
+            return [row for row in self._rows
+                    if all(row.get(key) == filters[key] for key in keys)]
+
+    def find(self, **filters):
+        '''
+        The first row which has all keys of filters and whose values are
+        equal to them is acquired.
+        Explanation about parameter:
+            filters : key and value of filter
+        Explanation about return value:
+            row (None : not found) : dict
+        '''
+        for row in self.select(**filters):
+            if all(key in row for key in filters):
+                return row
+        return None
+
+    def _get_index(self, keys):
+        '''
+        Hash index of the keys is acquired.
+        (It is created when it is used for the first time.)
+        Explanation about parameter:
+            keys : sorted keys (tuple)
+        Explanation about return value:
+            {tuple of values: [rows]} : dict
+        '''
+        index = self._index.get(keys)
+        if index is None:
+            index = {}
+            for row in self._rows:
+                index.setdefault(
+                    tuple(row.get(key) for key in keys), []).append(row)
+            self._index[keys] = index
+        return index
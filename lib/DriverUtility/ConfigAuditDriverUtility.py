@@ -7,6 +7,8 @@ Driver Utility(Audit)
 '''
 import re
 import traceback
+import threading
+import collections
 import EmDifflib
 from EmCommonLog import decorater_log, decorater_log_in_out
 from AuditConfigManagement import AuditConfigManagement
@@ -18,22 +20,34 @@ class ConfigAuditDriverUtility(object):
     Driver Utility(Audit)
     '''
 
+    _backref_re = re.compile(r"\\[1-9]|\(\?P=")
+
+    _conf_list_cache_size = 32
+
+    _conf_list_cache = collections.OrderedDict()
+
+    _conf_list_cache_lock = threading.Lock()
+
     @decorater_log_in_out
     def __init__(self,
                  from_config=None,
                  from_config_name="",
                  to_config=None,
                  to_config_name="",
-                 driver_info=None):
+                 driver_info=None,
+                 from_config_key=None):
         self.from_config = from_config
         self.from_config_name = from_config_name
         self.to_config = to_config
         self.to_config_name = to_config_name
         self.driver_info = driver_info
+        self.from_config_key = from_config_key
         audit_conf = AuditConfigManagement()
         audit_conf.load_config()
         exclusion_list = audit_conf.get_config(*driver_info)
+        self.exclusion_list = tuple(exclusion_list)
         self.exclusion_re_list = [re.compile(item) for item in exclusion_list]
+        self.exclusion_re = self._make_exclusion_re(exclusion_list)
 
     @decorater_log_in_out
     def compare_device_configuration(self):
@@ -47,14 +61,15 @@ class ConfigAuditDriverUtility(object):
         GlobalModule.EM_LOGGER.info(
             "115001 Start Compare Device Configuration")
         try:
-            list_config_1 = self._make_conf_list(self.from_config)
+            list_config_1 = self._make_from_conf_list()
             list_config_2 = self._make_conf_list(self.to_config)
 
             diff_obj = EmDifflib.unified_diff(list_config_1,
                                               list_config_2,
                                               fromfile=self.from_config_name,
                                               tofile=self.to_config_name,
-                                              n=0)
+                                              n=0,
+                                              is_hashed=True)
             str_list = []
             for line_str in diff_obj:
                 str_list.append(line_str)
@@ -72,6 +87,57 @@ class ConfigAuditDriverUtility(object):
             GlobalModule.EM_LOGGER.debug("diff = %s", return_str)
         return return_str
 
+    @decorater_log
+    def _make_exclusion_re(self, exclusion_list):
+        '''
+        Exclusion strings are combined into one regular expression.
+        Argument:
+            exclusion_list : exclusion strings : list
+        Return value:
+            combined regular expression (None : cannot be combined)
+        '''
+        if not exclusion_list:
+            return None
+        if any(self._backref_re.search(item) for item in exclusion_list):
+            return None
+        try:
+            return re.compile(
+                "|".join("(?:%s)" % (item,) for item in exclusion_list))
+        except re.error as exc_info:
+            GlobalModule.EM_LOGGER.debug(
+                "Exclusion strings are not combined:%s", exc_info)
+            return None
+
+    @decorater_log
+    def _make_from_conf_list(self):
+        '''
+        Device configuration string list generation of comparison source.
+            If from_config_key is set, the list is cached and reused
+            for the same key and exclusion strings.
+        Argument:
+            None
+        Return value:
+            device configuration (exclusion string applied, slice by row) : list
+        '''
+        if self.from_config_key is None:
+            return self._make_conf_list(self.from_config)
+        cls = ConfigAuditDriverUtility
+        cache_key = (self.from_config_key, self.exclusion_list)
+        with cls._conf_list_cache_lock:
+            conf_list = cls._conf_list_cache.pop(cache_key, None)
+            if conf_list is not None:
+                cls._conf_list_cache[cache_key] = conf_list
+        if conf_list is None:
+            conf_list = self._make_conf_list(self.from_config)
+            with cls._conf_list_cache_lock:
+                cls._conf_list_cache[cache_key] = conf_list
+                while len(cls._conf_list_cache) > cls._conf_list_cache_size:
+                    cls._conf_list_cache.popitem(last=False)
+        else:
+            GlobalModule.EM_LOGGER.debug(
+                "Use cached configuration:%s", self.from_config_key)
+        return conf_list
+
     @decorater_log
     def _make_conf_list(self, config_str):
         '''
@@ -82,6 +148,12 @@ class ConfigAuditDriverUtility(object):
             device configuration (exclusion string applied, slice by row) : list
         '''
         tmp = config_str.splitlines(True)
+        exclusion_re = self.exclusion_re
+        if exclusion_re is not None:
+            return ["" if exclusion_re.search(line) else line
+                    for line in tmp]
+        if not self.exclusion_re_list:
+            return tmp
         return ["" if self._check_exclusion(line) else line for line in tmp]
 
     @decorater_log
@@ -93,8 +165,9 @@ class ConfigAuditDriverUtility(object):
         Return value:
             result (True : exclusion target, False : other) : boolean
         '''
-        result = False
+        if self.exclusion_re is not None:
+            return bool(self.exclusion_re.search(line_str))
         for re_item in self.exclusion_re_list:
             if re_item.search(line_str):
-                result = True
-        return result
+                return True
+        return False
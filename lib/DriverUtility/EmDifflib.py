@@ -3,6 +3,7 @@
 # Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
 # Filename: EmDifflib.py
 
+import bisect
 from difflib import SequenceMatcher
 
 
@@ -21,7 +22,7 @@ def _format_range_unified(start, stop):
 
 
 def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
-                 tofiledate='', n=3, lineterm='\n'):
+                 tofiledate='', n=3, lineterm='\n', is_hashed=False):
     r"""
     Compare two sequences of lines; generate the delta as a unified diff.
 
@@ -35,6 +36,9 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
     file.writelines() since both the inputs and outputs have trailing
     newlines.
 
+    If is_hashed is True, lines are compared by HashedSequenceMatcher,
+    which is fast for long sequences with few differences.
+
     For inputs that do not have trailing newlines, set the lineterm
     argument to "" so that the output will be uniformly newline free.
 
@@ -61,8 +65,12 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
      four
     """
 
+    if is_hashed:
+        matcher = HashedSequenceMatcher(a, b)
+    else:
+        matcher = SequenceMatcher(None, a, b, False)
     started = False
-    for group in SequenceMatcher(None, a, b, False).get_grouped_opcodes(n):
+    for group in matcher.get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -86,3 +94,133 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
             if tag in ('replace', 'insert'):
                 for line in b[j1:j2]:
                     yield '+' + line
+
+
+class HashedSequenceMatcher(SequenceMatcher):
+    """
+    SequenceMatcher for lines, which is fast when most lines are equal.
+
+    Each line is replaced by an integer id (equal lines have equal id).
+    For long sequences, common head and tail are skipped, and the rest
+    is split by lines which appear only once in both sequences
+    (patience diff).
+    Only small parts between those lines are compared by SequenceMatcher.
+    Only get_opcodes and get_grouped_opcodes are supported.
+    """
+
+    _MATCH_THRESHOLD = 2000
+
+    def __init__(self, a, b):
+        line_ids = {}
+        self.a = a
+        self.b = b
+        self.a_ids = [line_ids.setdefault(line, len(line_ids)) for line in a]
+        self.b_ids = [line_ids.setdefault(line, len(line_ids)) for line in b]
+        self.matching_blocks = None
+        self.opcodes = None
+
+    def get_matching_blocks(self):
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+        a, b = self.a_ids, self.b_ids
+        la, lb = len(a), len(b)
+        if la + lb <= self._MATCH_THRESHOLD:
+            self.matching_blocks = SequenceMatcher(
+                None, a, b, False).get_matching_blocks()
+            return self.matching_blocks
+        head = 0
+        while head < la and head < lb and a[head] == b[head]:
+            head += 1
+        tail = 0
+        while (tail < la - head and tail < lb - head and
+               a[la - 1 - tail] == b[lb - 1 - tail]):
+            tail += 1
+        blocks = [(0, 0, head)]
+        self._match_blocks(head, la - tail, head, lb - tail, blocks)
+        blocks.append((la - tail, lb - tail, tail))
+
+        merged = []
+        for ai, bj, size in blocks:
+            if not size:
+                continue
+            if merged and merged[-1][0] + merged[-1][2] == ai and \
+                    merged[-1][1] + merged[-1][2] == bj:
+                merged[-1] = (merged[-1][0], merged[-1][1],
+                              merged[-1][2] + size)
+            else:
+                merged.append((ai, bj, size))
+        merged.append((la, lb, 0))
+        self.matching_blocks = merged
+        return merged
+
+    def _match_blocks(self, alo, ahi, blo, bhi, blocks):
+        a, b = self.a_ids, self.b_ids
+        if alo >= ahi or blo >= bhi:
+            return
+        if (ahi - alo) + (bhi - blo) > self._MATCH_THRESHOLD:
+            anchors = self._unique_anchors(alo, ahi, blo, bhi)
+            if anchors:
+                last_a, last_b = alo, blo
+                for ai, bj in anchors:
+                    self._match_blocks(last_a, ai, last_b, bj, blocks)
+                    blocks.append((ai, bj, 1))
+                    last_a, last_b = ai + 1, bj + 1
+                self._match_blocks(last_a, ahi, last_b, bhi, blocks)
+                return
+        matcher = SequenceMatcher(None, a[alo:ahi], b[blo:bhi], False)
+        for ai, bj, size in matcher.get_matching_blocks():
+            blocks.append((alo + ai, blo + bj, size))
+
+    def _unique_anchors(self, alo, ahi, blo, bhi):
+        a, b = self.a_ids, self.b_ids
+        a_pos = {}
+        for i in xrange(alo, ahi):
+            a_pos[a[i]] = -1 if a[i] in a_pos else i
+        b_pos = {}
+        for j in xrange(blo, bhi):
+            if a_pos.get(b[j], -1) >= 0:
+                b_pos[b[j]] = -1 if b[j] in b_pos else j
+        pairs = sorted((j, a_pos[line_id])
+                       for line_id, j in b_pos.iteritems() if j >= 0)
+
+        tails = []
+        tail_index = []
+        prev_index = [None] * len(pairs)
+        for index, (j, i) in enumerate(pairs):
+            pos = bisect.bisect_left(tails, i)
+            if pos:
+                prev_index[index] = tail_index[pos - 1]
+            if pos == len(tails):
+                tails.append(i)
+                tail_index.append(index)
+            else:
+                tails[pos] = i
+                tail_index[pos] = index
+        anchors = []
+        index = tail_index[-1] if tail_index else None
+        while index is not None:
+            j, i = pairs[index]
+            anchors.append((i, j))
+            index = prev_index[index]
+        anchors.reverse()
+        return anchors
+
+    def get_opcodes(self):
+        if self.opcodes is not None:
+            return self.opcodes
+        i = j = 0
+        self.opcodes = answer = []
+        for ai, bj, size in self.get_matching_blocks():
+            tag = ''
+            if i < ai and j < bj:
+                tag = 'replace'
+            elif i < ai:
+                tag = 'delete'
+            elif j < bj:
+                tag = 'insert'
+            if tag:
+                answer.append((tag, i, ai, j, bj))
+            i, j = ai + size, bj + size
+            if size:
+                answer.append(('equal', ai, i, bj, j))
+        return answer
@@ -6,9 +6,15 @@
 Common utility (DB) module for the driver.
 '''
 import json
+import zlib
+import base64
 import datetime
+import threading
 import traceback
+import collections
 import GlobalModule
+import EmDifflib
+from EmDBIndexedRows import EmDBIndexedRows
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
 
@@ -42,6 +48,12 @@ class EmDriverCommonUtilityDB(object):
     _if_type_lag = 2
     _if_type_breakout = 1
 
+    _base_config_cache_size = 32
+
+    _base_config_cache = collections.OrderedDict()
+
+    _base_config_cache_lock = threading.Lock()
+
     @decorater_log
     def __init__(self):
         '''
@@ -90,47 +102,6 @@ class EmDriverCommonUtilityDB(object):
                                       self._json_if_condition),
         }
 
-        self._get_db = {
-            self._table_device:
-            GlobalModule.DB_CONTROL.read_device_regist_info,
-            self._table_lag_if:
-            GlobalModule.DB_CONTROL.read_lagif_info,
-            self._table_lag_mem:
-            GlobalModule.DB_CONTROL.read_lagmemberif_info,
-            self._table_phy_if:
-            GlobalModule.DB_CONTROL.read_physical_if_info,
-            self._table_inner_link:
-            GlobalModule.DB_CONTROL.read_inner_link_if_info,
-            self._table_cluster_link:
-            GlobalModule.DB_CONTROL.read_cluster_link_if_info,
-            self._table_breakout:
-            GlobalModule.DB_CONTROL.read_breakout_if_info,
-            self._table_l3vpn_bgp:
-            GlobalModule.DB_CONTROL.read_leaf_bgp_basic_info,
-            self._table_vlan_if:
-            GlobalModule.DB_CONTROL.read_vlanif_info,
-            self._table_vrf:
-            GlobalModule.DB_CONTROL.read_vrf_detail_info,
-            self._table_bgp:
-            GlobalModule.DB_CONTROL.read_bgp_detail_info,
-            self._table_static:
-            GlobalModule.DB_CONTROL.read_static_route_detail_info,
-            self._table_vrrp:
-            GlobalModule.DB_CONTROL.read_vrrp_detail_info,
-            self._table_vrrp_track:
-            GlobalModule.DB_CONTROL.read_vrrp_trackif_info,
-            self._table_acl:
-            GlobalModule.DB_CONTROL.read_acl_info,
-            self._table_acl_detail:
-            GlobalModule.DB_CONTROL.read_acl_detail_info,
-            self._table_dummy_vlan_if:
-            GlobalModule.DB_CONTROL.read_dummy_vlan_if_info,
-            self._table_multi_homing:
-            GlobalModule.DB_CONTROL.read_multi_homing_info,
-            self._table_config_info:
-            GlobalModule.DB_CONTROL.read_device_configration_info,
-        }
-
         self._write_db = {
             self._table_config_info:
             GlobalModule.DB_CONTROL.write_device_configration_info,
@@ -209,28 +180,28 @@ class EmDriverCommonUtilityDB(object):
             newest device config : str
         '''
         try:
-            db_func = self._get_db[self._table_config_info]
-            is_ok, conf_rows = db_func(device_name=device_name)
+            db_func = GlobalModule.DB_CONTROL.read_latest_device_configration_info
+            is_ok, conf_rows = db_func(device_name, **filter_data)
             if not is_ok:
                 raise IOError("Failed to get data from DeviceConfigrationinfo")
             if not conf_rows:
-                return None, None
-
-            conf_rows = [row for row in conf_rows
-                         if self._check_filter_date(row, filter_data)]
-            if not conf_rows:
+                if filter_data:
+                    is_ok, conf_rows = db_func(device_name)
+                    if not is_ok:
+                        raise IOError(
+                            "Failed to get data from DeviceConfigrationinfo")
+                if not conf_rows:
+                    return None, None
                 raise ValueError("No config with matching filter")
 
-            def key_date(row):
-                wk_date = "{0}{1}".format(row.get("working_date"),
-                                          row.get("working_time"))
-                date_format = "%Y%m%d%H%M%S"
-                return datetime.datetime.strptime(wk_date, date_format)
-
-            sort_row = sorted(conf_rows, key=key_date)
-            latest_row = sort_row[-1]
-            GlobalModule.EM_LOGGER.debug("latest config:%s", latest_row)
-            latest_config = latest_row["config_file"]
+            latest_row = conf_rows[0]
+            GlobalModule.EM_LOGGER.debug(
+                "latest config:id=%s date=%s%s delta=%s",
+                latest_row["device_configration_id"],
+                latest_row["working_date"],
+                latest_row["working_time"],
+                latest_row.get("delta_num"))
+            latest_config = self._restore_device_config(latest_row)
             latest_date = "{0}{1}".format(latest_row["working_date"],
                                           latest_row["working_time"])
         except Exception as exc_info:
@@ -242,12 +213,123 @@ class EmDriverCommonUtilityDB(object):
             raise
         return latest_config, latest_date
 
+    @decorater_log_in_out
+    def read_device_configuration(self, device_configration_id):
+        '''
+        Obtain device config of any version from config information table.
+        Explanation about parameter:
+            device_configration_id: config ID int
+        Explanation about return value:
+            device config : str
+            date and time when device config is aquired : str
+        '''
+        is_ok, conf_rows = (
+            GlobalModule.DB_CONTROL.read_device_configration_id_info(
+                device_configration_id))
+        if not is_ok:
+            raise IOError("Failed to get data from DeviceConfigrationinfo")
+        if not conf_rows:
+            return None, None
+        config = self._restore_device_config(conf_rows[0])
+        date = "{0}{1}".format(conf_rows[0]["working_date"],
+                               conf_rows[0]["working_time"])
+        return config, date
+
+    @decorater_log
+    def _restore_device_config(self, row):
+        '''
+        Device config is restored from record of config information table.
+        (If the record is delta, it is applied to full config.)
+        Explanation about parameter:
+            row: record of config information table dict
+        Explanation about return value:
+            device config : str
+        '''
+        if not row.get("delta_num"):
+            return row["config_file"]
+        base_config = self._get_base_device_config(
+            row["base_configration_id"])
+        return self._apply_config_delta(base_config, row["config_file"])
+
+    @decorater_log
+    def _get_base_device_config(self, device_configration_id):
+        '''
+        Full device config which deltas are based on is obtained.
+        (Full config is cached because it is never updated.)
+        Explanation about parameter:
+            device_configration_id: config ID int
+        Explanation about return value:
+            device config : str
+        '''
+        cls = EmDriverCommonUtilityDB
+        with cls._base_config_cache_lock:
+            config = cls._base_config_cache.pop(device_configration_id, None)
+            if config is not None:
+                cls._base_config_cache[device_configration_id] = config
+                return config
+        is_ok, conf_rows = (
+            GlobalModule.DB_CONTROL.read_device_configration_id_info(
+                device_configration_id))
+        if not is_ok or not conf_rows:
+            raise IOError("Failed to get base config from "
+                          "DeviceConfigrationinfo(%s)" %
+                          (device_configration_id,))
+        config = conf_rows[0]["config_file"]
+        self._put_base_device_config(device_configration_id, config)
+        return config
+
+    @classmethod
+    @decorater_log
+    def _put_base_device_config(cls, device_configration_id, config):
+        '''
+        Full device config is stored in cache.
+        '''
+        with cls._base_config_cache_lock:
+            cls._base_config_cache[device_configration_id] = config
+            while len(cls._base_config_cache) > cls._base_config_cache_size:
+                cls._base_config_cache.popitem(last=False)
+
     @staticmethod
-    def _check_filter_date(row, filter_data):
-        for key, value in filter_data.items():
-            if row.get(key) != value:
-                return False
-        return True
+    @decorater_log
+    def _make_config_delta(base_config, config):
+        '''
+        Delta between device configs is generated.
+        Explanation about parameter:
+            base_config: full device config str
+            config: device config str
+        Explanation about return value:
+            delta (zlib compressed JSON [[start, end, replaced lines]]) : str
+        '''
+        base_lines = base_config.splitlines(True)
+        lines = config.splitlines(True)
+        matcher = EmDifflib.HashedSequenceMatcher(base_lines, lines)
+        delta = [[i1, i2, "".join(lines[j1:j2])]
+                 for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+                 if tag != "equal"]
+        return base64.b64encode(zlib.compress(json.dumps(delta)))
+
+    @staticmethod
+    @decorater_log
+    def _apply_config_delta(base_config, delta):
+        '''
+        Device config is restored by applying delta to full device config.
+        Explanation about parameter:
+            base_config: full device config str
+            delta: delta generated by _make_config_delta str
+        Explanation about return value:
+            device config : str
+        '''
+        base_lines = base_config.splitlines(True)
+        is_str = isinstance(base_config, str)
+        config = []
+        pos = 0
+        for start, end, text in json.loads(
+                zlib.decompress(base64.b64decode(delta))):
+            config.extend(base_lines[pos:start])
+            config.append(text.encode("utf-8") if is_str else text)
+            pos = end
+        config.extend(base_lines[pos:])
+        return "".join(config)
 
     @decorater_log_in_out
     def read_configureddata_info(self, device_name, service_name):
@@ -307,6 +389,7 @@ class EmDriverCommonUtilityDB(object):
         '''
         param = self._set_device_config_param(
             device_name, device_config, platform_name)
+        self._set_device_config_delta(param)
         is_ok = GlobalModule.DB_CONTROL.write_device_configration_info(**param)
 
         return is_ok
@@ -350,6 +433,53 @@ class EmDriverCommonUtilityDB(object):
 
         return device_config_param
 
+    @decorater_log
+    def _set_device_config_delta(self, device_config_param):
+        '''
+        Device config to be registered is replaced with delta from
+        the last full config.
+        (Full config is registered for every Device_config_snapshot_interval
+         versions, or when delta cannot be generated.)
+        Explanation about parameter:
+            device_config_param: device config table to be registered dict
+        Explanation about return value:
+            None
+        '''
+        is_ok, interval = GlobalModule.EM_CONFIG.read_sys_common_conf(
+            "Device_config_snapshot_interval")
+        if not is_ok or interval <= 1:
+            return
+        device_name = device_config_param["device_name"]
+        config = device_config_param["config_file"]
+        try:
+            is_ok, conf_rows = (
+                GlobalModule.DB_CONTROL.read_latest_device_configration_info(
+                    device_name,
+                    get_timing=device_config_param["get_timing"]))
+            if not is_ok or not conf_rows:
+                return
+            latest_row = conf_rows[0]
+            delta_num = latest_row.get("delta_num") or 0
+            if delta_num + 1 >= interval:
+                return
+            if delta_num:
+                base_id = latest_row["base_configration_id"]
+                base_config = self._get_base_device_config(base_id)
+            else:
+                base_id = latest_row["device_configration_id"]
+                base_config = latest_row["config_file"]
+                self._put_base_device_config(base_id, base_config)
+            delta = self._make_config_delta(base_config, config)
+            if len(delta) >= len(config):
+                return
+        except Exception as exc_info:
+            GlobalModule.EM_LOGGER.debug(
+                "Full config is registered ; %s", exc_info)
+            return
+        device_config_param["config_file"] = delta
+        device_config_param["base_configration_id"] = int(base_id)
+        device_config_param["delta_num"] = delta_num + 1
+
     @decorater_log
     def _get_db_infos(self, device_name, tables):
         '''
@@ -360,13 +490,21 @@ class EmDriverCommonUtilityDB(object):
         Explanation about return value:
             Acquisition result : Boolean
             Edit information : {DB name:({Item name: value})}
+        (If reading all tables at once fails, tables are read one by one
+         to find the table which fails.)
         '''
+        is_ok, tmp_info = GlobalModule.DB_CONTROL.read_device_snapshot(
+            device_name, tables)
+        if is_ok:
+            return True, tmp_info
         tmp_info = {}
         for table in tables:
-            is_ok, tmp_db = self._get_db[table](device_name=device_name)
+            is_ok, tmp_db = GlobalModule.DB_CONTROL.read_device_snapshot(
+                device_name, [table])
             if not is_ok:
+                GlobalModule.EM_LOGGER.debug("DB read error : %s", table)
                 return False, {"ERROR ! FAULT DB": table}
-            tmp_info[table] = tmp_db
+            tmp_info.update(tmp_db)
         return True, tmp_info
 
     @decorater_log
@@ -905,6 +1043,8 @@ class EmDriverCommonUtilityDB(object):
         json_return["vrf_detail"] = json_list_item
 
         t_table = db_info.get(self._table_vrrp, ())
+        t_track_table = EmDBIndexedRows(
+            db_info.get(self._table_vrrp_track, ()))
         json_list_item = []
         json_return["vrrp_detail_value"] = len(t_table)
         for row in t_table:
@@ -919,9 +1059,9 @@ class EmDriverCommonUtilityDB(object):
             json_item["priority"] = row["priority"]
             json_item["track_if_name"] = None
             tmp_list = []
-            for tr_name in db_info.get(self._table_vrrp_track, ()):
-                if tr_name["vrrp_group_id"] == row["vrrp_group_id"]:
-                    tmp_list.append(tr_name["track_if_name"])
+            for tr_name in t_track_table.select(
+                    vrrp_group_id=row["vrrp_group_id"]):
+                tmp_list.append(tr_name["track_if_name"])
             json_item["track_if_name"] = tmp_list
             json_list_item.append(json_item)
         json_return["vrrp_detail"] = json_list_item
@@ -1213,7 +1353,8 @@ class EmDriverCommonUtilityDB(object):
             (API data list(JSON format).xlsm  Refer to LAG information acquisition sheet for CE)
         '''
         t_table = db_info.get(self._table_acl, ())
-        t_acl_detail_table = db_info.get(self._table_acl_detail, ())
+        t_acl_detail_table = EmDBIndexedRows(
+            db_info.get(self._table_acl_detail, ()))
 
         json_obj = {}
         json_list_item = []
@@ -1314,7 +1455,8 @@ class EmDriverCommonUtilityDB(object):
             API data letter strings(json format) ; dict
         '''
         t_table = db_info.get(self._table_inner_link, ())
-        mem_table = db_info.get(self._table_lag_mem, ())
+        mem_table = EmDBIndexedRows(db_info.get(self._table_lag_mem, ()))
+        t_lag_table = EmDBIndexedRows(db_info.get(self._table_lag_if, ()))
 
         json_list_item = []
         for row in t_table:
@@ -1328,11 +1470,9 @@ class EmDriverCommonUtilityDB(object):
             json_item["vlan_id"] = row["vlan_id"]
 
             if json_item["if_type"] == self._if_type_lag:
-                t_lag_table = db_info.get(self._table_lag_if, ())
-                for lag_if in t_lag_table:
-                    if lag_if.get("lag_if_name") == json_item["if_name"]:
-                        json_item["lag_if_id"] = lag_if.get("lag_if_id")
-                        break
+                lag_ifs = t_lag_table.select(lag_if_name=json_item["if_name"])
+                if lag_ifs:
+                    json_item["lag_if_id"] = lag_ifs[0].get("lag_if_id")
                 lag_mems = []
                 lag_mems = self._select_row(mem_table,
                                             lag_if_name=json_item["if_name"])
@@ -1393,15 +1533,9 @@ class EmDriverCommonUtilityDB(object):
     def _select_row(rows, **filters):
         '''
         Extract only the line which contains keyword from the line data list of DB.
+        (Pass EmDBIndexedRows as rows when it is called repeatedly
+         for the same rows, so that the hash index is reused.)
         '''
-        tmp_row = []
-        for row in rows:
-            is_target = True
-            for filter_key in filters.keys():
-                if row.get(filter_key) != filters[filter_key]:
-                    is_target = False
-                    break
-            GlobalModule.EM_LOGGER.debug("is_target = %s", is_target)
-            if is_target:
-                tmp_row.append(row)
-        return tmp_row
+        if not isinstance(rows, EmDBIndexedRows):
+            rows = EmDBIndexedRows(rows)
+        return rows.select(**filters)
@@ -5,8 +5,13 @@
 '''
 Common utility for the driver (Log)
 '''
+import os
+import re
+import sys
 import logging
-import inspect
+import datetime
+import threading
+from lxml import etree
 import GlobalModule
 from EmCommonLog import decorater_log
 import EmLoggingTool
@@ -22,6 +27,10 @@ class EmDriverCommonUtilityLog(object):
                   "WARN": logging.WARN,
                   "ERROR": logging.ERROR}
 
+    __payload_count = 0
+
+    __payload_count_lock = threading.Lock()
+
     @decorater_log
     def __init__(self, device_name=None):
         '''
@@ -40,24 +49,89 @@ class EmDriverCommonUtilityLog(object):
                 raise ValueError("not 2rotate handler")
             for i in range(len(GlobalModule.EM_LOGGER.handlers)):
                 self._sethandler(i)
+            self.__driver_logger.setLevel(
+                min(handler.level
+                    for handler in self.__driver_logger.handlers))
+
+        (self.__payload_limit,
+         self.__payload_dir,
+         self.__payload_file_num) = self._get_payload_conf()
 
     @decorater_log
     def logging(self,
                 device_name=None,
                 log_level=None,
                 log_message=None,
-                log_module=" "):
+                log_module=" ",
+                *log_args):
         '''
         Log output (Individual section on the driver)
         Explanation about parameter:
             device_name: Device name
             log_level: Log level (DEBUG,INFO,WARN,ERROR)
             log_message: Log message
+                         (Format string if log_args is specified.)
+            log_module: Module name
+                        (Make sure to input "_name_" as the argument.)
+            log_args: Arguments of log message
+                      (Log message is formatted only when it is output.)
+        Explanation about the return value:
+            Log output result : Boolean
+        '''
+        return self.__output_log(
+            device_name, log_level, log_message, log_module, log_args)
+
+    @decorater_log
+    def logging_payload(self,
+                        device_name=None,
+                        log_level=None,
+                        log_message=None,
+                        payload=None,
+                        log_module=" "):
+        '''
+        Log output of large message such as NETCONF message
+        (Payload longer than Driver_log_payload_limit is truncated.
+         In that case, whole payload is output to the file in
+         Driver_log_payload_dir if it is set.
+         Old files more than Driver_log_payload_file_num are deleted.)
+        Explanation about parameter:
+            device_name: Device name
+            log_level: Log level (DEBUG,INFO,WARN,ERROR)
+            log_message: Log message (Format string with one "%s")
+            payload: Payload
             log_module: Module name
                         (Make sure to input "_name_" as the argument.)
         Explanation about the return value:
             Log output result : Boolean
         '''
+        return self.__output_log(
+            device_name, log_level, log_message, log_module, (payload,),
+            is_payload=True)
+
+    @staticmethod
+    def xml_str(node):
+        '''
+        XML node which is converted to string only when log is output
+        is acquired.
+        (Used as log_args of logging.)
+        Explanation about parameter:
+            node: XML node
+        Explanation about the return value:
+            XML node for log : _LogXmlStr
+        '''
+        return _LogXmlStr(node)
+
+    def __output_log(self,
+                     device_name,
+                     log_level,
+                     log_message,
+                     log_module,
+                     log_args,
+                     is_payload=False):
+        '''
+        Log output
+        (Caller information and message are made after level check.)
+        '''
         if self.__is_log_out is False:
             return False
 
@@ -67,10 +141,21 @@ class EmDriverCommonUtilityLog(object):
         if not device_name:
             device_name = self.log_dev_name
 
-        frame = inspect.currentframe(2)
+        level = self.__LogLevel.get(log_level)
+        if level is None:
+            return False
+        if not self.__driver_logger.isEnabledFor(level):
+            return True
+
+        frame = sys._getframe(3)
         log_line_no = str(frame.f_lineno)
         log_func_name = frame.f_code.co_name
 
+        if is_payload:
+            log_args = (self._get_payload_str(device_name, log_args[0]),)
+        if log_args:
+            log_message = log_message % log_args
+
         out_message = (
             "(%(module)s::%(funcName)s:%(lineno)s):{%(device)s}:%(message)s" %
             {"module": log_module,
@@ -81,19 +166,110 @@ class EmDriverCommonUtilityLog(object):
              }
         )
 
-        if log_level == "DEBUG":
-            self.__driver_logger.debug(out_message)
-        elif log_level == "INFO":
-            self.__driver_logger.info(out_message)
-        elif log_level == "WARN":
-            self.__driver_logger.warning(out_message)
-        elif log_level == "ERROR":
-            self.__driver_logger.error(out_message)
-        else:
-            return False
+        self.__driver_logger.log(level, out_message)
 
         return True
 
+    def _get_payload_str(self, device_name, payload):
+        '''
+        Payload is converted to the string for log.
+        Explanation about parameter:
+            device_name: Device name
+            payload: Payload
+        Explanation about the return value:
+            Payload for log : str
+        '''
+        if not isinstance(payload, basestring):
+            payload = str(payload)
+        if not self.__payload_limit or len(payload) <= self.__payload_limit:
+            return payload
+        payload_str = "%s...(%s chars)" % (payload[:self.__payload_limit],
+                                           len(payload))
+        if self.__payload_dir:
+            file_path = self._write_payload_file(device_name, payload)
+            if file_path:
+                payload_str += " (file=%s)" % (file_path,)
+        return payload_str
+
+    def _write_payload_file(self, device_name, payload):
+        '''
+        Whole payload is output to the file.
+        Explanation about parameter:
+            device_name: Device name
+            payload: Payload
+        Explanation about the return value:
+            File path (None : failed) : str
+        '''
+        with EmDriverCommonUtilityLog.__payload_count_lock:
+            EmDriverCommonUtilityLog.__payload_count += 1
+            count = EmDriverCommonUtilityLog.__payload_count
+            self._delete_payload_file()
+        file_path = None
+        try:
+            file_path = os.path.join(
+                self.__payload_dir,
+                "%s_%s_%s.log" % (
+                    device_name,
+                    datetime.datetime.now().strftime("%Y%m%d%H%M%S%f"),
+                    count))
+            if isinstance(payload, unicode):
+                payload = payload.encode("utf-8")
+            with open(file_path, "w") as payload_file:
+                payload_file.write(payload)
+        except Exception as ex:
+            GlobalModule.EM_LOGGER.debug(
+                "failed to write payload file(%s):%s" % (file_path, ex))
+            file_path = None
+        return file_path
+
+    def _delete_payload_file(self):
+        '''
+        Old payload files are deleted so that the number of files
+        after output of new file is Driver_log_payload_file_num.
+        (Must be called with the payload count lock held.)
+        '''
+        if not self.__payload_file_num:
+            return
+        try:
+            file_list = []
+            for file_name in os.listdir(self.__payload_dir):
+                match = re.search(r"_(\d{20})_(\d+)\.log$", file_name)
+                if match:
+                    file_list.append(
+                        (match.group(1), int(match.group(2)), file_name))
+            file_list.sort()
+            delete_num = len(file_list) - self.__payload_file_num + 1
+            for _, _, file_name in file_list[:max(delete_num, 0)]:
+                os.remove(os.path.join(self.__payload_dir, file_name))
+        except Exception as ex:
+            GlobalModule.EM_LOGGER.debug(
+                "failed to delete payload file(%s):%s" % (
+                    self.__payload_dir, ex))
+
+    @staticmethod
+    def _get_payload_conf():
+        '''
+        Config of payload log is acquired.
+        Explanation about the return value:
+            Max length of payload (0 : no limit) : int
+            Directory for whole payload (None : not output) : str
+            Max number of payload files (0 : no limit) : int
+        '''
+        is_ok, payload_limit = GlobalModule.EM_CONFIG.read_sys_common_conf(
+            "Driver_log_payload_limit")
+        if not is_ok or payload_limit < 0:
+            payload_limit = 0
+        is_ok, payload_dir = GlobalModule.EM_CONFIG.read_sys_common_conf(
+            "Driver_log_payload_dir")
+        if not is_ok or not payload_dir:
+            payload_dir = None
+        is_ok, payload_file_num = \
+            GlobalModule.EM_CONFIG.read_sys_common_conf(
+                "Driver_log_payload_file_num")
+        if not is_ok or payload_file_num < 0:
+            payload_file_num = 0
+        return payload_limit, payload_dir, payload_file_num
+
     @decorater_log
     def _sethandler(self, i):
         '''
@@ -107,3 +283,20 @@ class EmDriverCommonUtilityLog(object):
             "[%(asctime)s] [%(levelname)s] [tid=%(thread)d] %(message)s")
         handler.setFormatter(formatter)
         self.__driver_logger.addHandler(handler)
+
+
+class _LogXmlStr(object):
+    '''
+    XML node which is converted to string only when log is output
+    '''
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        '''
+        Constructor
+        '''
+        self._node = node
+
+    def __str__(self):
+        return etree.tostring(self._node)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+# Filename: EmXmlTemplate.py
+'''
+Compiled XML template for creating NETCONF message of driver.
+'''
+import copy
+from lxml import etree
+
+
+class EmXmlTemplate(object):
+    '''
+    Compiled XML template.
+    (Node tree is created once from the definition, and its copy is
+     added to the parent node with the parameters set to its slots.
+     Nodes are the same as the ones created by
+     EmSeparateDriver._set_xml_tag.)
+
+    Definition of node:
+        (tag, [attribute dict], [text], [child node definition, ...])
+        Text or attribute value "$name" is the slot of parameter "name".
+            text      : str(parameter) ("" if parameter is None)
+            attribute : parameter (Attribute is not set if None.)
+        Node whose text slot is in "optional" is not added
+        if the parameter is None.
+    Example:
+        EmXmlTemplate(("vlan", {"operation": "$operation"},
+                       ("name", "$name"),
+                       ("vlan-id", "$vlan_id")))
+    '''
+
+    _SLOT_MARK = "$"
+
+    def __init__(self, *nodes, **kwargs):
+        '''
+        Constructor
+        Explanation about parameter:
+            nodes : Definition of top nodes (tuple)
+            optional : Slot names of optional nodes (tuple)
+        '''
+        optional = kwargs.get("optional", ())
+        self._skeleton = etree.Element("template")
+        for node in nodes:
+            self._compile_node(self._skeleton, node)
+        self._text_slots = []
+        self._attr_slots = []
+        self._optional_slots = []
+        for index, element in enumerate(self._skeleton.iter()):
+            if self._is_slot(element.text):
+                name = element.text[1:]
+                if name in optional:
+                    self._optional_slots.append((index, name))
+                self._text_slots.append((index, name))
+                element.text = ""
+            for key, value in element.attrib.items():
+                if self._is_slot(value):
+                    self._attr_slots.append((index, key, value[1:]))
+                    del element.attrib[key]
+        self._optional_slots.reverse()
+
+    @classmethod
+    def _is_slot(cls, value):
+        '''
+        Whether value is the slot or not is checked.
+        '''
+        return value is not None and value.startswith(cls._SLOT_MARK)
+
+    @classmethod
+    def _compile_node(cls, parent, node):
+        '''
+        Node of definition is created under parent node.
+        '''
+        element = etree.SubElement(parent, node[0])
+        element.text = ""
+        for item in node[1:]:
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    element.set(key, value)
+            elif isinstance(item, tuple):
+                cls._compile_node(element, item)
+            else:
+                element.text = item
+
+    def fill(self, parent, **params):
+        '''
+        Copy of template is added to parent node.
+        Explanation about parameter:
+            parent : Parent node object
+            params : Parameters for slots
+        Explanation about return value:
+            Added node (the first one if template has multiple top nodes)
+        '''
+        tmp_nodes = copy.deepcopy(self._skeleton)
+        elements = list(tmp_nodes.iter())
+        for index, name in self._text_slots:
+            value = params.get(name)
+            if value is not None:
+                elements[index].text = str(value)
+        for index, key, name in self._attr_slots:
+            value = params.get(name)
+            if value is not None:
+                elements[index].set(key, value)
+        for index, name in self._optional_slots:
+            if params.get(name) is None:
+                elements[index].getparent().remove(elements[index])
+        top_node = tmp_nodes[0]
+        parent.extend(tmp_nodes)
+        return top_node
@@ -13,57 +13,100 @@ import os
 import GlobalModule
 import EmLoggingTool
 
-__EM_START_STOP_LOGGER = None
+__EM_START_STOP_LOGGER = logging.getLogger(__name__)
+__EM_START_STOP_LOGGER.propagate = False
+
+__EM_START_STOP_LOG_LEVEL = logging.NOTSET
+
+__EM_DECORATOR_LOG_MODULES = set()
+
+_LOG_LEVELS = {
+    "TRACE": GlobalModule.TRACE_LOG_LEVEL,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARN,
+    "ERROR": logging.ERROR,
+}
 
 _TRACEBACK_LIMIT = 2
 
+_VALUE_STR_LIMIT = 4096
+
+
+def _get_log_info(func):
+    '''
+    Log header and logger of the method are acquired.
+    (Called once when the method is decorated.)
+    Explanation about parameter:
+        func : decorated method
+    Return value:
+        log header : str
+        logger for module of the method : logging.Logger
+    '''
+    func_code = getattr(func, "func_code", None)
+    if func_code is not None:
+        f_module = os.path.basename(func_code.co_filename)
+        f_line_no = func_code.co_firstlineno
+    else:
+        f_module = getattr(func, "__module__", None)
+        f_line_no = 0
+    log_head = "(%s::%s:%s): " % (f_module,
+                                  getattr(func, "__name__", func),
+                                  f_line_no)
+    logger = logging.getLogger(
+        "%s.%s" % (__name__, getattr(func, "__module__", None)))
+    return log_head, logger
+
+
+def _get_value_str(value):
+    '''
+    Value is converted to the string for log.
+    (It is truncated when it is longer than _VALUE_STR_LIMIT.)
+    '''
+    value_str = "%s" % (value,)
+    if _VALUE_STR_LIMIT and len(value_str) > _VALUE_STR_LIMIT:
+        value_str = "%s...(%s chars)" % (value_str[:_VALUE_STR_LIMIT],
+                                        len(value_str))
+    return value_str
+
+
+def _output_error_log(logger, log_head, exc_info):
+    '''
+    Method error DEBUG log output.
+    '''
+    logger.debug("%sERROR(%s):%s" % (log_head,
+                                     type(exc_info).__name__,
+                                     exc_info.message))
+    if _TRACEBACK_LIMIT:
+        trc_str = traceback.format_exc(limit=_TRACEBACK_LIMIT)
+        logger.debug("%sTRACEBACK:%s" % (log_head, trc_str))
+
 
 def decorater_log(func):
     '''
     Method start/finish DEBUG log output decorator.
         *@decorater_log is required as the decorator method when using.
     '''
+    log_head, logger = _get_log_info(func)
+    log_start = log_head + "START"
+    log_end = log_head + "END"
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         '''
         Decorator wrapper.
         '''
-        def output_decorate_log(conditon, func, level=GlobalModule.TRACE_LOG_LEVEL):
-            '''
-            Method start/finish DEBUG log output.
-            '''
-            f_name = func.__name__
-            f_module = os.path.basename(
-                func.func_code.co_filename)
-            f_line_no = func.func_code.co_firstlineno
-            log_str = (
-                "(%(module)s::%(funcName)s:%(lineno)s): %(message)s" %
-                {"module": f_module,
-                 "funcName": f_name,
-                 "lineno": f_line_no,
-                 "message": conditon,
-                 }
-            )
-            if level == GlobalModule.TRACE_LOG_LEVEL:
-                __EM_START_STOP_LOGGER.log(
-                    GlobalModule.TRACE_LOG_LEVEL, log_str)
-            else:
-                __EM_START_STOP_LOGGER.debug(log_str)
-
-        output_decorate_log("START", func)
+        is_output = logger.isEnabledFor(GlobalModule.TRACE_LOG_LEVEL)
+        if is_output:
+            logger.log(GlobalModule.TRACE_LOG_LEVEL, log_start)
         try:
             return_val = func(*args, **kwargs)
         except Exception as exc_info:
-            output_decorate_log("ERROR(%s):%s" %
-                                (type(exc_info).__name__, exc_info.message),
-                                func, logging.DEBUG)
-            if _TRACEBACK_LIMIT:
-                trc_str = traceback.format_exc(limit=_TRACEBACK_LIMIT)
-                output_decorate_log("TRACEBACK:{0}".format(trc_str),
-                                    func, logging.DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                _output_error_log(logger, log_head, exc_info)
             raise
-        output_decorate_log("END", func)
+        if is_output:
+            logger.log(GlobalModule.TRACE_LOG_LEVEL, log_end)
         return return_val
     return wrapper
 
@@ -73,74 +116,100 @@ def decorater_log_in_out(func):
     Method start/finish DEBUG log output decorator.
         *@decorater_log is required as the decorator method when using.
     '''
+    log_head, logger = _get_log_info(func)
+    log_start = log_head + "START %s %s"
+    log_end = log_head + "END %s"
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         '''
         Decorator wrapper.
         '''
-        def output_decorate_log_in(conditon, func, *args, **kwargs):
-            '''
-            Method start/finish DEBUG log output.
-            '''
-            f_name = func.__name__
-            f_module = os.path.basename(
-                func.func_code.co_filename)
-            f_line_no = func.func_code.co_firstlineno
-            log_str = (
-                "(%(module)s::%(funcName)s:%(lineno)s): %(message)s %(val1)s %(val2)s" %
-                {"module": f_module,
-                 "funcName": f_name,
-                 "lineno": f_line_no,
-                 "message": conditon,
-                 "val1": args,
-                 "val2": kwargs,
-                 }
-            )
-            __EM_START_STOP_LOGGER.debug(log_str)
-
-        def output_decorate_log_out(conditon, func, values):
-            '''
-            Method start/finish DEBUG log output.
-            '''
-            f_name = func.__name__
-            f_module = os.path.basename(
-                func.func_code.co_filename)
-            f_line_no = func.func_code.co_firstlineno
-            log_str = (
-                "(%(module)s::%(funcName)s:%(lineno)s): %(message)s %(val)s" %
-                {"module": f_module,
-                 "funcName": f_name,
-                 "lineno": f_line_no,
-                 "message": conditon,
-                 "val": values,
-                 }
-            )
-            __EM_START_STOP_LOGGER.debug(log_str)
-
-        output_decorate_log_in("START", func, *args, **kwargs)
+        is_output = logger.isEnabledFor(logging.DEBUG)
+        if is_output:
+            logger.debug(log_start % (_get_value_str(args),
+                                      _get_value_str(kwargs)))
         try:
             return_val = func(*args, **kwargs)
         except Exception as exc_info:
-            output_decorate_log_out("ERROR(%s):%s" %
-                                    (type(exc_info).__name__,
-                                     exc_info.message),
-                                    func, exc_info)
-            if _TRACEBACK_LIMIT:
-                trc_str = traceback.format_exc(limit=_TRACEBACK_LIMIT)
-                output_decorate_log_out("TRACEBACK:{0}".format(trc_str),
-                                        func, "")
+            if logger.isEnabledFor(logging.DEBUG):
+                _output_error_log(logger, log_head, exc_info)
             raise
-        output_decorate_log_out("END", func, return_val)
+        if is_output:
+            logger.debug(log_end % (_get_value_str(return_val),))
         return return_val
     return wrapper
 
 
+def set_decorator_log_level(level, module_name=None):
+    '''
+    Output level of the method start/finish log is changed.
+    (It can be changed while EM is running.)
+    Explanation about parameter:
+        level : log level (logging.DEBUG etc.
+                None : level at initialization (all modules),
+                       level of all modules (each module))
+        module_name : module name of method (None : all modules)
+    '''
+    if module_name is None:
+        logger = __EM_START_STOP_LOGGER
+        if level is None:
+            level = __EM_START_STOP_LOG_LEVEL
+    else:
+        logger = logging.getLogger("%s.%s" % (__name__, module_name))
+        if level is None:
+            level = logging.NOTSET
+    logger.setLevel(level)
+
+
+def load_decorator_log_level():
+    '''
+    Output level of the method start/finish log is set from
+    system common definition.
+    (Called at initialization and when EM receives SIGHUP.)
+        Em_decorator_log_level : level of all modules
+                                 (not set : level at initialization)
+        Em_decorator_log_level_module : level of each module
+                                        (module:level,module:level...)
+    '''
+    global __EM_DECORATOR_LOG_MODULES
+
+    is_ok, conf_level = GlobalModule.EM_CONFIG.read_sys_common_conf(
+        "Em_decorator_log_level")
+    all_level = _LOG_LEVELS.get(conf_level) if is_ok and conf_level else None
+    if conf_level and all_level is None:
+        GlobalModule.EM_LOGGER.debug(
+            "Em_decorator_log_level is invalid:%s", conf_level)
+    set_decorator_log_level(all_level)
+
+    is_ok, conf_modules = GlobalModule.EM_CONFIG.read_sys_common_conf(
+        "Em_decorator_log_level_module")
+    module_levels = {}
+    for module_conf in (conf_modules or "").split(","):
+        module_name, _, conf_level = module_conf.partition(":")
+        if not module_name:
+            continue
+        if conf_level not in _LOG_LEVELS:
+            GlobalModule.EM_LOGGER.debug(
+                "Em_decorator_log_level_module is invalid:%s", module_conf)
+            continue
+        module_levels[module_name] = _LOG_LEVELS[conf_level]
+    for module_name in __EM_DECORATOR_LOG_MODULES - set(module_levels):
+        set_decorator_log_level(None, module_name)
+    for module_name, level in module_levels.items():
+        set_decorator_log_level(level, module_name)
+    __EM_DECORATOR_LOG_MODULES = set(module_levels)
+    GlobalModule.EM_LOGGER.debug(
+        "decorator log level:%s module:%s", all_level, module_levels)
+
+
 def init_decorator_log():
     '''
     Method start/finish DEBUG log output decorator initialize.
         *Execute after EM_LOGGER creation using main function.
     '''
     global __EM_START_STOP_LOGGER
+    global __EM_START_STOP_LOG_LEVEL
 
     __EM_START_STOP_LOGGER = logging.getLogger(__name__)
     __EM_START_STOP_LOGGER.propagate = False
@@ -156,8 +225,12 @@ def init_decorator_log():
 
     logging.addLevelName(
         GlobalModule.TRACE_LOG_LEVEL, GlobalModule.TRACE_LOG_LEVEL_LABEL)
-    handler.setLevel(time_rotate_handle.level)
+    handler.setLevel(GlobalModule.TRACE_LOG_LEVEL)
+    __EM_START_STOP_LOG_LEVEL = time_rotate_handle.level
+    __EM_START_STOP_LOGGER.setLevel(__EM_START_STOP_LOG_LEVEL)
 
     __EM_START_STOP_LOGGER.addHandler(handler)
 
+    load_decorator_log_level()
+
     return True
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+# Filename: EmOrderMessage.py
+'''
+Order message module for each device.
+'''
+import json
+import copy
+from lxml import etree
+
+
+class EmOrderXml(str):
+    '''
+    EC message (XML string) for each device with its XML element.
+    (It is created once for each device by scenario, and the XML element
+     is used instead of parsing the string again.
+     The XML element must not be modified.)
+    '''
+
+    def __new__(cls, element):
+        '''
+        Constructor
+        Explanation about parameter:
+            element : XML element of device
+        '''
+        self = super(EmOrderXml, cls).__new__(cls, etree.tostring(element))
+        self._element = copy.deepcopy(element)
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def element(self):
+        '''
+        XML element of device (read-only)
+        '''
+        return self._element
+
+    @staticmethod
+    def to_element(message):
+        '''
+        XML element of EC message is acquired.
+        Explanation about parameter:
+            message : EC message (EmOrderXml or XML string)
+        Explanation about return value:
+            XML element (It must not be modified.) : lxml.etree._Element
+        '''
+        if isinstance(message, EmOrderXml):
+            return message._element
+        return etree.fromstring(message)
+
+
+class EmOrderMessage(str):
+    '''
+    EC message (JSON string) for each device with its parsed object.
+    (It is created once for each device by scenario, and shared by
+     scenario, common driver and individual driver.
+     The parsed object is read-only, and deepcopy of it is modifiable.)
+    '''
+
+    def __new__(cls, data):
+        '''
+        Constructor
+        Explanation about parameter:
+            data : EC message (dict)
+        '''
+        self = super(EmOrderMessage, cls).__new__(cls, json.dumps(data))
+        self._data = _freeze(data)
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def data(self):
+        '''
+        Parsed EC message (read-only)
+        '''
+        return self._data
+
+    @staticmethod
+    def to_data(message):
+        '''
+        Parsed object of EC message is acquired.
+        Explanation about parameter:
+            message : EC message (EmOrderMessage or JSON string)
+        Explanation about return value:
+            EC message (It must not be modified.) : dict
+        '''
+        if isinstance(message, EmOrderMessage):
+            return message._data
+        return json.loads(message)
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("EC message is read-only")
+
+
+class _FrozenDict(dict):
+    '''
+    Read-only dict
+    '''
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return dict((copy.deepcopy(key, memo), copy.deepcopy(value, memo))
+                    for key, value in self.iteritems())
+
+
+class _FrozenList(list):
+    '''
+    Read-only list
+    '''
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = _read_only
+    __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+def _freeze(data):
+    '''
+    Read-only copy of the object is created.
+    '''
+    if isinstance(data, dict):
+        return _FrozenDict((key, _freeze(value))
+                           for key, value in data.iteritems())
+    if isinstance(data, (list, tuple)):
+        return _FrozenList(_freeze(value) for value in data)
+    return data
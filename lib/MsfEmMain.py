@@ -145,6 +145,29 @@ def receive_signal(signum, frame):
         notify_em_changeover("start")
 
 
+def receive_reload_signal(signum, frame):
+    '''
+    The method to be called at the MAIN thread when receiving SIGHUP.
+    Scenario and driver classes are loaded again at the next use,
+    and the method start/finish log level is set from conf_sys_common.conf.
+    Explanation about parameter:
+        signum: signal number
+        frame: frame object
+    Explanation about the return value:
+        None
+    '''
+    GlobalModule.EM_LOGGER.info('Receive signal (signum = %s ,frame = %s)'
+                                % (signum, frame))
+
+    PluginLoader.reload_classes()
+
+    if GlobalModule.EM_CONFIG.reload_sys_common_conf():
+        EmCommonLog.load_decorator_log_level()
+    else:
+        GlobalModule.EM_LOGGER.error('301008 ReLoad conf Error (%s)' %
+                                     ("conf_sys_common.conf",))
+
+
 def notify_em_changeover(kind):
     '''
     Start switching-over process to EC and  notifies the completion.
@@ -524,6 +547,7 @@ def msf_em_start():
 
     signal.signal(signal.SIGUSR1, receive_signal)
     signal.signal(signal.SIGUSR2, receive_signal)
+    signal.signal(signal.SIGHUP, receive_reload_signal)
 
     if system_status == EmSysCommonUtilityDB.STATE_CHANGE_OVER:
         check_resource_status(err_mes_conf)
@@ -6,6 +6,7 @@
 Netconf Server function
 '''
 import io
+import itertools
 import Queue
 import time
 import threading
@@ -32,6 +33,9 @@ class EmNetconfSessionDate(object):
     '''
     lock = threading.Lock()
     session_date = {}
+    pending_rpc = {}
+    pending_rpc_counter = itertools.count(1)
+    session_metrics = {}
 
     @classmethod
     @decorater_log
@@ -63,10 +67,69 @@ class EmNetconfSessionDate(object):
         '''
         try:
             with cls.lock:
+                cls.pending_rpc.pop(session_id, None)
+                cls.session_metrics.pop(session_id, None)
                 del cls.session_date[session_id]
         except KeyError:
             GlobalModule.EM_LOGGER.debug("Active Session-id None")
 
+    @classmethod
+    @decorater_log
+    def add_pending_rpc(cls, session_id, ec_message, rpc):
+        '''
+        Processing the registration of parsed rpc which waits for reply
+        (Number assigned to each request is set to EC message as key)
+        '''
+        with cls.lock:
+            ec_message.pending_rpc_id = next(cls.pending_rpc_counter)
+            cls.pending_rpc.setdefault(session_id, {})[
+                ec_message.pending_rpc_id] = (rpc, time.time())
+            metrics = cls.session_metrics.setdefault(
+                session_id,
+                {"rpc_count": 0, "reply_count": 0,
+                 "latency_total": 0.0, "latency_max": 0.0})
+            metrics["rpc_count"] += 1
+
+    @classmethod
+    @decorater_log
+    def pop_pending_rpc(cls, session_id, ec_message):
+        '''
+        Processing the acquisition of parsed rpc which waits for reply
+        (None is returned if rpc is not registered)
+        '''
+        with cls.lock:
+            pending = cls.pending_rpc.get(session_id, {})
+            rpc_info = pending.pop(
+                getattr(ec_message, "pending_rpc_id", None), None)
+            if rpc_info is None:
+                return None
+            rpc, receive_time = rpc_info
+            latency = time.time() - receive_time
+            metrics = cls.session_metrics.get(session_id)
+            if metrics is not None:
+                metrics["reply_count"] += 1
+                metrics["latency_total"] += latency
+                metrics["latency_max"] = max(metrics["latency_max"], latency)
+        return rpc
+
+    @classmethod
+    @decorater_log
+    def get_session_metrics(cls):
+        '''
+        Processing the acquisition of number of rpc waiting for reply
+        and rpc latency (sec) for each session
+        '''
+        result = {}
+        with cls.lock:
+            for session_id, metrics in cls.session_metrics.items():
+                tmp = dict(metrics)
+                tmp["queue_depth"] = len(cls.pending_rpc.get(session_id, {}))
+                tmp["latency_average"] = (
+                    tmp["latency_total"] / tmp["reply_count"]
+                    if tmp["reply_count"] else 0.0)
+                result[session_id] = tmp
+        return result
+
 
 class NetconfMethods(server.NetconfMethods):
     '''
@@ -166,7 +229,7 @@ class NetconfMethods(server.NetconfMethods):
             return False, etree.fromstring(self.__rpc_error_message)
 
         transaction_result = \
-            GlobalModule.EM_ORDER_CONTROL.get_transaction_presence()
+            GlobalModule.EM_ORDER_CONTROL.get_order_acceptance()
 
         if transaction_result is not True:
             return False, etree.fromstring(self._rpc_error_message_temp)
@@ -177,6 +240,8 @@ class NetconfMethods(server.NetconfMethods):
 
         file_rpc = io.BytesIO(str_rpc)
 
+        EmNetconfSessionDate.add_pending_rpc(session, file_rpc, rpc)
+
         GlobalModule.EM_ORDER_CONTROL.execute(file_rpc, session)
 
         GlobalModule.EM_LOGGER.debug("rpc_get_config end")
@@ -204,7 +269,7 @@ class NetconfMethods(server.NetconfMethods):
             return False, etree.fromstring(self.__rpc_error_message)
 
         transaction_result = \
-            GlobalModule.EM_ORDER_CONTROL.get_transaction_presence()
+            GlobalModule.EM_ORDER_CONTROL.get_order_acceptance()
 
         if transaction_result is not True:
             return False, etree.fromstring(self._rpc_error_message_temp)
@@ -215,6 +280,8 @@ class NetconfMethods(server.NetconfMethods):
 
         file_rpc = io.BytesIO(str_rpc)
 
+        EmNetconfSessionDate.add_pending_rpc(session, file_rpc, rpc)
+
         GlobalModule.EM_ORDER_CONTROL.execute(file_rpc, session)
 
         GlobalModule.EM_LOGGER.debug("rpc_edit_config end")
@@ -276,11 +343,10 @@ class EmNetconfSSHServerSocket(server.NetconfSSHServerSocket):
             timeout_time = 300.0
             GlobalModule.EM_LOGGER.debug(
                 "timeout value is %s", (timeout_time,))
-            self.timeout_flag = False
-            timer = threading.Timer(timeout_time, self._timeout_accept)
-            timer.start()
+            deadline = time.time() + timeout_time
             while True:
-                if self.timeout_flag:
+                if time.time() > deadline:
+                    self._timeout_accept()
                     raise Exception("accept thread is timeout")
                 if self.debug:
                     GlobalModule.EM_LOGGER.debug(
@@ -326,7 +392,6 @@ class EmNetconfSSHServerSocket(server.NetconfSSHServerSocket):
             self.client_socket.close()
             self.client_socket = None
         finally:
-            timer.cancel()
             self.timeout_flag = False
             self.server.remove_socket(self)
 
@@ -562,7 +627,12 @@ class EmNetconfSSHServer(object):
         Constructor
         '''
         self.nc_server = None
-        self.que_events = Queue.Queue(10)
+        result, reply_thread_num = GlobalModule.EM_CONFIG.\
+            read_sys_common_conf("Netconf_reply_thread_num")
+        if result is not True or reply_thread_num < 1:
+            reply_thread_num = 1
+        self.que_events_list = [Queue.Queue(10)
+                                for _ in range(reply_thread_num)]
         self.stop_event = threading.Event()
         self.started = True
         self.__rpc_error_message = """
@@ -664,9 +734,13 @@ class EmNetconfSSHServer(object):
         self.stop_mon_thread.daemon = True
         self.stop_mon_thread.start()
 
-        self.wait_order_thread = threading.Thread(target=self._wait_order_resp)
-        self.wait_order_thread.daemon = True
-        self.wait_order_thread.start()
+        self.wait_order_threads = []
+        for que_events in self.que_events_list:
+            wait_order_thread = threading.Thread(target=self._wait_order_resp,
+                                                 args=(que_events,))
+            wait_order_thread.daemon = True
+            wait_order_thread.start()
+            self.wait_order_threads.append(wait_order_thread)
 
     @decorater_log_in_out
     def send_response(self,
@@ -686,13 +760,31 @@ class EmNetconfSSHServer(object):
             True:Normal
             False:Abnormal
         '''
+        que_events = self.que_events_list[
+            hash(session_id) % len(self.que_events_list)]
         try:
             put_param = (order_result, ec_message, session_id, response_info)
-            self.que_events.put(put_param, block=False)
+            que_events.put(put_param, block=False)
         except Queue.Full:
             return False
         return True
 
+    @decorater_log
+    def get_session_metrics(self):
+        '''
+        Number of rpc waiting for reply and rpc latency for each session
+        and number of responses in each reply queue are acquired.
+        Explanation about parameter:
+            None
+        Explanation about return value:
+            session metrics : dict
+        '''
+        return {
+            "sessions": EmNetconfSessionDate.get_session_metrics(),
+            "reply_queue_depth": [que_events.qsize()
+                                  for que_events in self.que_events_list],
+        }
+
     @decorater_log_in_out
     def start(self):
         '''
@@ -840,6 +932,8 @@ class EmNetconfSSHServer(object):
             response_info:response(EmNetconfResponse object)
         Explanation about return value:
         '''
+        rpc = EmNetconfSessionDate.pop_pending_rpc(session_id, ec_message)
+
         session_date = EmNetconfSessionDate.get_session_date(session_id)
 
         if session_date is None:
@@ -850,35 +944,36 @@ class EmNetconfSSHServer(object):
         rpc_reply = self._response_plugin.create_resp_message(order_resp,
                                                               response_info)
 
-        rpc_str = ec_message.read()
-
-        GlobalModule.EM_LOGGER.debug("rpc_reply: %s", rpc_str)
+        if rpc is None:
+            rpc_str = ec_message.read()
+            GlobalModule.EM_LOGGER.debug("rpc_reply: %s", rpc_str)
+            rpc = etree.fromstring(rpc_str)
 
-        session_date.send_rpc_reply(rpc_reply, etree.fromstring(rpc_str))
+        session_date.send_rpc_reply(rpc_reply, rpc)
 
     @decorater_log
-    def _wait_order_resp(self):
+    def _wait_order_resp(self, que_events):
         """
         Wait for orderflow control response.
         Start method making response for EC.
         Explanation about parameter：
-            None
+            que_events:Queue of responses (same session uses same queue)
         Explanation about return value:
             None
         """
         while self.started:
             try:
-                queue_param = self.que_events.get()
+                queue_param = que_events.get()
 
                 self._send_netconf_resp(*queue_param)
 
-                self.que_events.task_done()
+                que_events.task_done()
 
             except Exception as exception:
                 GlobalModule.EM_LOGGER.debug(
                     "Message Send Error:%s", str(type(exception)))
 
-                self.que_events.task_done()
+                que_events.task_done()
 
     @decorater_log
     def _load_response_plugin(self):
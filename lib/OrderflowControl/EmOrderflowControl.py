@@ -10,7 +10,6 @@ import threading
 import datetime
 import time
 import uuid
-import imp
 import copy
 import os
 import traceback
@@ -20,6 +19,7 @@ from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
 import PluginLoader
 from EmNetconfResponse import EmNetconfResponse
+from EmSysCommonUtilityDB import EmTransactionStatusNotice
 
 
 class EmOrderflowControl(threading.Thread):
@@ -27,12 +27,8 @@ class EmOrderflowControl(threading.Thread):
     Order flow control class.
     '''
 
-    timeout_flag = False  
     rpc_name = '{urn:ietf:params:xml:ns:netconf:base:1.0}'
 
-    _target_scenario_module = None
-    _target_scenario_class_ins = None
-
     _log_str_trans_status = {
         GlobalModule.TRA_STAT_PROC_ERR_ORDER:
         "Processing failure(Inadequate request)",
@@ -56,9 +52,25 @@ class EmOrderflowControl(threading.Thread):
 
         self.stop_event = threading.Event()
 
+        self._order_parallel_num = int(
+            self._get_timer_config('Em_order_parallel_num', 1))
+        self._order_queue_size = int(
+            self._get_timer_config('Em_order_queue_size', 10))
+
+        self._order_lock = threading.Lock()
+        self._pending_orders = []
+        self._running_devices = {}
+        self._running_order_num = 0
+        self._is_running_exclusive = False
+        self._timeout_transactions = set()
+        self._order_wait_stat = {"count": 0,
+                                 "total": 0.0,
+                                 "max": 0.0,
+                                 "last": 0.0}
+
         super(EmOrderflowControl, self).__init__()
         self.daemon = True
-        self.que_event = Queue.Queue(10)
+        self.que_event = Queue.Queue(self._order_queue_size)
         self.start()
 
         self._wait_for_remaining_order_completion()
@@ -88,16 +100,19 @@ class EmOrderflowControl(threading.Thread):
 
             ec_message = que_item[0]
             session_id = que_item[1]
+            receive_time = que_item[2]
 
-            self._order_main(ec_message, session_id)
+            self._prepare_order(ec_message, session_id, receive_time)
 
             self.que_event.task_done()
         except Queue.Empty:
             pass
         except (StopIteration, IOError, StandardError) as exc_info:
-            GlobalModule.EM_LOGGER.debug("ERROR:", exc_info.message)
+            GlobalModule.EM_LOGGER.debug("ERROR:%s", exc_info.message)
             self.que_event.task_done()
 
+        self._dispatch_orders()
+
     @decorater_log_in_out
     def execute(self, ec_message, session_id):
         '''
@@ -109,7 +124,8 @@ class EmOrderflowControl(threading.Thread):
             None
         '''
         try:
-            self.que_event.put((ec_message, session_id), block=False)
+            self.que_event.put((ec_message, session_id, time.time()),
+                               block=False)
         except Queue.Full:
             GlobalModule.EM_LOGGER.debug("que_event is full")
             order_result = GlobalModule.ORDER_RES_PROC_ERR_TEMP
@@ -117,16 +133,21 @@ class EmOrderflowControl(threading.Thread):
                                 ec_message=ec_message,
                                 session_id=session_id)
 
-    @staticmethod
     @decorater_log_in_out
-    def get_transaction_presence():
+    def get_transaction_presence(self):
         '''
         Obtain presence of transaction in progress
+        (Orders waiting for dispatch are treated as transaction in progress.)
         Explanation about parameter:
             None
         Explanation about return value:
             Availability of transaction information:boolean
         '''
+        with self._order_lock:
+            pending_num = len(self._pending_orders)
+        if pending_num > 0 or not self.que_event.empty():
+            return False
+
         read_tras_list_result, transaction_id_list = \
             GlobalModule.EMSYSCOMUTILDB.read_transactionid_list()
 
@@ -135,6 +156,55 @@ class EmOrderflowControl(threading.Thread):
         else:
             return False if transaction_id_list is not None else True
 
+    @decorater_log_in_out
+    def get_order_acceptance(self):
+        '''
+        Obtain whether new order can be accepted.
+        (If orders are executed one by one,
+         it depends on presence of transaction in progress.)
+        Explanation about parameter:
+            None
+        Explanation about return value:
+            Availability of order acceptance:boolean
+        '''
+        if self._order_parallel_num <= 1:
+            return self.get_transaction_presence()
+        with self._order_lock:
+            pending_num = len(self._pending_orders)
+        return pending_num + self.que_event.qsize() < self._order_queue_size
+
+    @decorater_log_in_out
+    def get_order_queue_status(self):
+        '''
+        Obtain status of order queue.
+        Explanation about parameter:
+            None
+        Explanation about return value:
+            order queue status : dict
+                queue_depth : number of orders waiting for dispatch (int)
+                running_num : number of orders in progress (int)
+                running_devices : device names in progress (list)
+                wait_count : number of dispatched orders (int)
+                wait_time_last : wait time of last order (ms)
+                wait_time_max : maximum wait time (ms)
+                wait_time_average : average wait time (ms)
+        '''
+        with self._order_lock:
+            wait_stat = self._order_wait_stat.copy()
+            status = {
+                "queue_depth": (len(self._pending_orders) +
+                                self.que_event.qsize()),
+                "running_num": self._running_order_num,
+                "running_devices": self._running_devices.keys(),
+            }
+        status["wait_count"] = wait_stat["count"]
+        status["wait_time_last"] = wait_stat["last"]
+        status["wait_time_max"] = wait_stat["max"]
+        status["wait_time_average"] = (
+            wait_stat["total"] / wait_stat["count"]
+            if wait_stat["count"] else 0.0)
+        return status
+
     @decorater_log_in_out
     def stop(self):
         '''
@@ -147,16 +217,16 @@ class EmOrderflowControl(threading.Thread):
         self.stop_event.set()
         self.join()
 
-    @decorater_log_in_out
-    def _order_main(self, ec_message, session_id):
+    @decorater_log
+    def _prepare_order(self, ec_message, session_id, receive_time):
         '''
-        Wait for request from Netconf server, conduct order control after receiving request.
+        Analyze request from Netconf server and add it to dispatch waiting list.
         Explanation about parameter:
             ec_message:EC message
             session_id:Session ID
+            receive_time:Time of receiving request (float)
         Explanation about return value:
-            None           
-        
+            None
         '''
         transaction_id = self._issue_transaction_id()
 
@@ -168,6 +238,128 @@ class EmOrderflowControl(threading.Thread):
                                       session_id=session_id,
                                       order_contents=order_contents)
         )
+        device_names = order_info[5]
+
+        order = {
+            "transaction_id": transaction_id,
+            "ec_message": ec_message,
+            "session_id": session_id,
+            "order_contents": order_contents,
+            "order_info": order_info,
+            "device_names": (frozenset(device_names)
+                             if device_names else None),
+            "receive_time": receive_time,
+        }
+        with self._order_lock:
+            self._pending_orders.append(order)
+        GlobalModule.EM_LOGGER.debug(
+            'Order waiting for dispatch(transaction:%s devices:%s)',
+            transaction_id, device_names)
+
+    @decorater_log
+    def _dispatch_orders(self):
+        '''
+        Start orders waiting for dispatch in order of arrival.
+        Orders are started in parallel only if their device sets are disjoint
+        from the devices in progress and those of preceding waiting orders.
+        Order whose devices are unknown is executed exclusively.
+        Explanation about parameter:
+            None
+        Explanation about return value:
+            None
+        '''
+        start_orders = []
+        with self._order_lock:
+            blocked_devices = set()
+            for order in self._pending_orders[:]:
+                if (self._running_order_num >= self._order_parallel_num or
+                        self._is_running_exclusive):
+                    break
+                device_names = order["device_names"]
+                if device_names is None:
+                    if self._running_order_num == 0 and not blocked_devices:
+                        self._is_running_exclusive = True
+                        start_orders.append(order)
+                        self._pending_orders.remove(order)
+                        self._running_order_num += 1
+                    break
+                if (device_names.isdisjoint(self._running_devices) and
+                        device_names.isdisjoint(blocked_devices)):
+                    for name in device_names:
+                        self._running_devices[name] = order["transaction_id"]
+                    start_orders.append(order)
+                    self._pending_orders.remove(order)
+                    self._running_order_num += 1
+                else:
+                    blocked_devices.update(device_names)
+            queue_depth = len(self._pending_orders) + self.que_event.qsize()
+            for order in start_orders:
+                wait_time = (time.time() - order["receive_time"]) * 1000
+                self._order_wait_stat["count"] += 1
+                self._order_wait_stat["total"] += wait_time
+                self._order_wait_stat["last"] = wait_time
+                self._order_wait_stat["max"] = max(
+                    self._order_wait_stat["max"], wait_time)
+                order["wait_time"] = wait_time
+
+        for order in start_orders:
+            GlobalModule.EM_LOGGER.info(
+                '103005 Order Dispatch(transaction:%s wait:%.1fms queue:%s)',
+                order["transaction_id"], order["wait_time"], queue_depth)
+            thread = threading.Thread(target=self._order_thread,
+                                      args=(order,))
+            thread.daemon = True
+            thread.start()
+
+    @decorater_log
+    def _order_thread(self, order):
+        '''
+        Execute order control, and release devices of the order at the end.
+        DB read cache of the devices is valid while the order is executed.
+        Explanation about parameter:
+            order:order waiting for dispatch (dict)
+        Explanation about return value:
+            None
+        '''
+        GlobalModule.DB_CONTROL.begin_read_cache(order["device_names"] or ())
+        try:
+            self._order_main(transaction_id=order["transaction_id"],
+                             ec_message=order["ec_message"],
+                             session_id=order["session_id"],
+                             order_contents=order["order_contents"],
+                             order_info=order["order_info"])
+        except (StopIteration, IOError, StandardError) as exc_info:
+            GlobalModule.EM_LOGGER.debug("ERROR:%s", exc_info.message)
+        finally:
+            GlobalModule.DB_CONTROL.end_read_cache(order["device_names"] or ())
+            with self._order_lock:
+                for name in (order["device_names"] or ()):
+                    self._running_devices.pop(name, None)
+                if order["device_names"] is None:
+                    self._is_running_exclusive = False
+                self._running_order_num -= 1
+                self._timeout_transactions.discard(order["transaction_id"])
+            EmTransactionStatusNotice.remove(order["transaction_id"])
+
+    @decorater_log_in_out
+    def _order_main(self,
+                    transaction_id=None,
+                    ec_message=None,
+                    session_id=None,
+                    order_contents=None,
+                    order_info=None):
+        '''
+        Conduct order control for the dispatched request.
+        Explanation about parameter:
+            transaction_id:transaction ID
+            ec_message:EC message
+            session_id:Session ID
+            order_contents:order contents
+            order_info:result of order analysis (tuple)
+        Explanation about return value:
+            None           
+        
+        '''
         service_kind = order_info[0]
         order_kind = order_info[1]
         device_num = order_info[2]
@@ -188,14 +380,18 @@ class EmOrderflowControl(threading.Thread):
 
         order_timer_set = order_timer / 1000
 
-        timer = threading.Timer(order_timer_set, self._find_timeout)
+        timer = threading.Timer(order_timer_set,
+                                self._find_timeout,
+                                args=(transaction_id,))
         timer.start()
 
         GlobalModule.EM_LOGGER.debug('Timer of waiting order start.')
 
-        self._load_scenario_module(scenario_name)
+        scenario_ins = self._load_scenario_module(scenario_name)
 
-        self._start_scenario(transaction_id=transaction_id,
+        GlobalModule.EM_LOGGER.info('103001 Service:%s start', scenario_name)
+        self._start_scenario(scenario_ins,
+                             transaction_id=transaction_id,
                              ec_message=ec_message,
                              session_id=session_id,
                              scenario_name=scenario_name,
@@ -230,9 +426,7 @@ class EmOrderflowControl(threading.Thread):
             scenario_name=scenario_name
         )
 
-        self._target_scenario_class_ins.notify(ec_message,
-                                               transaction_id,
-                                               order_kind)
+        scenario_ins.notify(ec_message, transaction_id, order_kind)
 
         GlobalModule.EM_LOGGER.debug('Monitoring(Edit-config)')
         self._monitoring(transaction_id=transaction_id,
@@ -286,9 +480,7 @@ class EmOrderflowControl(threading.Thread):
             scenario_name=scenario_name
         )
 
-        self._target_scenario_class_ins.notify(ec_message,
-                                               transaction_id,
-                                               order_kind)
+        scenario_ins.notify(ec_message, transaction_id, order_kind)
 
         GlobalModule.EM_LOGGER.debug('Monitoring(Commit)')
         self._monitoring(transaction_id=transaction_id,
@@ -316,9 +508,7 @@ class EmOrderflowControl(threading.Thread):
             scenario_name=scenario_name
         )
 
-        self._target_scenario_class_ins.notify(ec_message,
-                                               transaction_id,
-                                               order_kind)
+        scenario_ins.notify(ec_message, transaction_id, order_kind)
 
         order_result = GlobalModule.ORDER_RES_OK
         self._processing_on_order_ok(
@@ -338,11 +528,12 @@ class EmOrderflowControl(threading.Thread):
         '''
         Search all files  in  scenario deirectory if the scenario file exists, 
         import and  instantiate the senario files.
+        (Scenario module is imported only at the first order of the scenario.)
 
         Explanation about parameter:
             scenario_name:scenario  name (str)
         Explanation about return value:
-            None
+            scenario instance
         '''
         scenario_name_em = 'Em' + scenario_name
         GlobalModule.EM_LOGGER.debug('Generate start class name.:%s',
@@ -351,42 +542,18 @@ class EmOrderflowControl(threading.Thread):
         lib_path = GlobalModule.EM_LIB_PATH
         GlobalModule.EM_LOGGER.debug('enviroment value path:%s', lib_path)
 
-        mod_dir = self._search_file("{0}.py".format(scenario_name_em),
-                                    os.path.join(lib_path, 'Scenario'))
-        GlobalModule.EM_LOGGER.debug('Search dir = %s', mod_dir)
-        filepath, filename, data = imp.find_module(scenario_name_em, [mod_dir])
-        GlobalModule.EM_LOGGER.debug('Search module.')
-
-        self._target_scenario_module = (
-            imp.load_module(scenario_name_em, filepath, filename, data))
+        scenario_class = PluginLoader.load_class(
+            scenario_name_em, os.path.join(lib_path, 'Scenario'),
+            is_search=True)
         GlobalModule.EM_LOGGER.debug('Read module.')
 
-        self._target_scenario_class_ins = (
-            getattr(self._target_scenario_module, scenario_name_em)())
+        scenario_ins = scenario_class()
         GlobalModule.EM_LOGGER.debug('Create instance.')
-
-    @staticmethod
-    @decorater_log
-    def _search_file(file_name, root_dir):
-        '''
-        Search all files in  scenario deirectory if the scenario file exists, 
-        return the directory path.
-        Explanation about parameter:
-            file_name:File name (str)
-            root_dir:Directory path (str)
-        Explanation about return value:
-            Directory path of module file (str)
-        '''
-        for root, dirs, files in os.walk(root_dir):
-            GlobalModule.EM_LOGGER.debug(
-                "Search:root={0},dirs={1},files={2}".format(root, dirs, files))
-            for file_data in files:
-                if file_data == file_name:
-                    return root
-        return None
+        return scenario_ins
 
     @decorater_log
     def _start_scenario(self,
+                        scenario_ins,
                         transaction_id=None,
                         ec_message=None,
                         session_id=None,
@@ -398,6 +565,7 @@ class EmOrderflowControl(threading.Thread):
         '''
         Start scenarion.
         Explanation about parameter:
+            scenario_ins:scenario instance
             transaction_id:transaction ID
             ec_message:EC message
             session_id:Session ID
@@ -411,9 +579,7 @@ class EmOrderflowControl(threading.Thread):
         '''
         order_kind_sc = None if order_kind == "get" else order_kind
         scenario_start_result = (
-            self._target_scenario_class_ins.execute(ec_message,
-                                                    transaction_id,
-                                                    order_kind_sc)
+            scenario_ins.execute(ec_message, transaction_id, order_kind_sc)
         )
         if not scenario_start_result:
             order_result = GlobalModule.ORDER_RES_PROC_ERR_OTH
@@ -504,11 +670,12 @@ class EmOrderflowControl(threading.Thread):
             session_id:Session ID
             order_contents:order contents
         Explanation about return value:
-            None
+            service type, order type, number of devices, scenario name,
+            order timer value, device name list : tuple
         '''
 
         try:
-            service_kind, order_kind, device_num = (
+            service_kind, order_kind, device_num, device_names = (
                 self._analysis_em_scenario(ec_message)
             )
         except ValueError:
@@ -556,10 +723,8 @@ class EmOrderflowControl(threading.Thread):
                 order_contents=order_contents,
             )
             raise StandardError('Failed in Scenario select.')
-        else:
-            GlobalModule.EM_LOGGER.info(
-                '103001 Service:%s start', scenario_name)
-        return service_kind, order_kind, device_num, scenario_name, order_timer
+        return (service_kind, order_kind, device_num,
+                scenario_name, order_timer, device_names)
 
     @decorater_log
     def _analysis_em_scenario(self, ec_message):
@@ -572,6 +737,7 @@ class EmOrderflowControl(threading.Thread):
             service type:str
             order type:order_kind
             number of devices:str
+            device name list:list (None if device names are unknown)
         '''
         get_plugin = None
         try:
@@ -585,8 +751,12 @@ class EmOrderflowControl(threading.Thread):
                     ec_message, self.plugin_analysis_message)
                 raise Exception("Failed to get plugin")
             get_plugin.rpc_name = self.rpc_name
-            service_kind, order_kind, device_num, device_type = (
+            analysis_result = (
                 get_plugin.analysis_scenario_from_recv_message(ec_message))
+            service_kind, order_kind, device_num, device_type = (
+                analysis_result[:4])
+            device_names = (analysis_result[4]
+                            if len(analysis_result) > 4 else None)
         except Exception:
             GlobalModule.EM_LOGGER.error(
                 "303010 Error Execute Plugin for Analysis Message")
@@ -596,7 +766,7 @@ class EmOrderflowControl(threading.Thread):
         GlobalModule.EM_LOGGER.debug(
             'analysis result Service:%s Order:%s Device_Num:%s Device_type:%s',
             service_kind, order_kind, device_num, device_type)
-        return service_kind, order_kind, device_num
+        return service_kind, order_kind, device_num, device_names
 
     @staticmethod
     @decorater_log
@@ -670,7 +840,9 @@ class EmOrderflowControl(threading.Thread):
     @decorater_log
     def _monitor_transaction(self, transaction_id, tra_mng_stat, device_num):
         '''
-        Monitor order management information DB regularly, notify the sync instruction to individual processing of each scenario.
+        Monitor order management information DB each time device status
+        is updated, notify the sync instruction to individual processing of each scenario.
+        (DB is also read regularly in case of no update notice.)
         Explanation about parameter:
             transaction_id:Transaction ID
             tra_mng_stat:Transaction status
@@ -683,7 +855,7 @@ class EmOrderflowControl(threading.Thread):
         retry_flg = True
 
         monitor_time = self._get_timer_config('Timer_transaction_db_watch',
-                                              100)
+                                              1000)
         GlobalModule.EM_LOGGER.debug('Transaction DB Watch Timer = %s',
                                      monitor_time)
 
@@ -706,14 +878,16 @@ class EmOrderflowControl(threading.Thread):
                                device_num=None,
                                retry_timer=None):
         '''
-        Monitor order management information DB periodically and notify each scenario ndividual process
+        Monitor order management information DB and notify each scenario ndividual process
         of synchronization request.
         (loop process in monitor_transaction method)
+        If loop continues, wait for update notice of device status.
         
         Explanation about parameter:
             transaction_id:transaction ID
             tra_mng_stat:transaction status
             device_num:number of devices
+            retry_timer:maximum waiting time for update notice (sec)
         Explanation about return value:
             loop continuation flag: True or False (True if loop continues)
             method result : True or False
@@ -722,12 +896,16 @@ class EmOrderflowControl(threading.Thread):
         is_retry = False
         roll_cnt = 0
         error_cnt = 0
-        if EmOrderflowControl.timeout_flag:
-            EmOrderflowControl.timeout_flag = False
+        with self._order_lock:
+            is_timeout = transaction_id in self._timeout_transactions
+            self._timeout_transactions.discard(transaction_id)
+        if is_timeout:
             GlobalModule.EM_LOGGER.debug('Monitor Timeout')
             order_result = GlobalModule.ORDER_RES_PROC_ERR_OTH
             return False, False, order_result
 
+        notice_seq = EmTransactionStatusNotice.get_sequence(transaction_id)
+
         read_mtd = (
             GlobalModule.EMSYSCOMUTILDB.read_transaction_device_status_list)
         is_ok, dev_con_list = read_mtd(transaction_id)
@@ -782,7 +960,9 @@ class EmOrderflowControl(threading.Thread):
         else:
             GlobalModule.EM_LOGGER.debug('Monitor Retry')
             order_result = None
-            time.sleep(retry_timer)
+            EmTransactionStatusNotice.wait(transaction_id,
+                                           notice_seq,
+                                           retry_timer)
         return is_retry, True, order_result
 
     @staticmethod
@@ -861,20 +1041,21 @@ class EmOrderflowControl(threading.Thread):
 
         return anaiy_order
 
-    @staticmethod
     @decorater_log
-    def _find_timeout():
+    def _find_timeout(self, transaction_id):
         '''
         Response NG to Netconf server whem waiting timer for order completion has been timed out. 
         Explanation about parameter:
-           None
+           transaction_id : transaction ID (uuid)
         Explanation about return value:
            None
         '''
 
-        GlobalModule.EM_LOGGER.debug('Timeout detection')
+        GlobalModule.EM_LOGGER.debug('Timeout detection(%s)', transaction_id)
 
-        EmOrderflowControl.timeout_flag = True
+        with self._order_lock:
+            self._timeout_transactions.add(transaction_id)
+        EmTransactionStatusNotice.notify(transaction_id)
 
     @decorater_log
     def _processing_on_order_ok(self,
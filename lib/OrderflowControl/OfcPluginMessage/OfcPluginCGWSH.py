@@ -145,3 +145,34 @@ class OfcPluginCGWSH(_OfcPluginMSF):
             GlobalModule.EM_LOGGER.debug('device count is fault')
             raise ValueError('Failed to counting device')
         return device_num
+
+    @decorater_log
+    def _get_device_name_list(self, element, device_type, sys_ns):
+        '''
+        Device names with received Netconf are acquired.
+        Argument:
+            element:config part
+            device_type:device type
+            sys_ns:service name space
+        Return value:
+            device name list:list (None if any device name is not found)
+        '''
+        device_list = []
+        device_list.extend(element[0].findall(device_type))
+        tmp_dev_type = None
+        if self.tag_asr_info in device_type:
+            tmp_dev_type = device_type.replace(self.tag_asr_info,
+                                               self.tag_nvr_info)
+        elif self.tag_nvr_info in device_type:
+            tmp_dev_type = device_type.replace(self.tag_nvr_info,
+                                               self.tag_asr_info)
+        device_list.extend(element[0].findall(tmp_dev_type))
+        device_tag = sys_ns + "managementInfo" + "/" + sys_ns + "hostname"
+        device_name_list = []
+        for device in device_list:
+            name_elm = device.find(device_tag)
+            if name_elm is None or not name_elm.text:
+                GlobalModule.EM_LOGGER.debug('device name is not found')
+                return None
+            device_name_list.append(name_elm.text)
+        return device_name_list
@@ -71,11 +71,13 @@ class _OfcPluginMSF(object):
             order type:order_kind
             number of :str
             device type:str
+            device name list:list
         '''
 
         service_kind = None
         device_type = None
         device_num = None
+        device_name_list = None
 
         context = copy.deepcopy(ec_message)
         context = etree.iterparse(context, events=(self.ev_start, self.ev_end))
@@ -91,6 +93,9 @@ class _OfcPluginMSF(object):
 
                 device_num = self._count_device(element, sys_ns + device_type)
 
+                device_name_list = self._get_device_name_list(
+                    element, sys_ns + device_type, sys_ns)
+
                 order_kind = self._analysis_netconf_operation(
                     context, service_kind, config_ptn, self.rpc_name, sys_ns)
                 break
@@ -98,8 +103,10 @@ class _OfcPluginMSF(object):
         GlobalModule.EM_LOGGER.debug(
             'analysis result Service:%s Order:%s Device_Num:%s Device_type:%s',
             service_kind, order_kind, device_num, device_type)
+        GlobalModule.EM_LOGGER.debug('Device_Name:%s', device_name_list)
 
-        return service_kind, order_kind, device_num, device_type
+        return (service_kind, order_kind, device_num,
+                device_type, device_name_list)
 
     @decorater_log
     def _analysis_service(self, element):
@@ -169,6 +176,27 @@ class _OfcPluginMSF(object):
             raise ValueError('Failed to counting device')
         return device_num
 
+    @staticmethod
+    @decorater_log
+    def _get_device_name_list(element, device_type, sys_ns):
+        '''
+        Device names in received Netconf are acquired.
+        Argument:
+            element:config part
+            device_type:device type
+            sys_ns:service name space
+        Return value:
+            device name list:list (None if any device name is not found)
+        '''
+        device_name_list = []
+        for device in element[0].findall(device_type):
+            name_elm = device.find(sys_ns + "name")
+            if name_elm is None or not name_elm.text:
+                GlobalModule.EM_LOGGER.debug('device name is not found')
+                return None
+            device_name_list.append(name_elm.text)
+        return device_name_list
+
     @decorater_log
     def _analysis_netconf_operation(self,
                                     context,
@@ -7,8 +7,12 @@ Module for controlling plugin.
 '''
 import imp
 import os
+import threading
 import GlobalModule
 
+_loaded_classes = {}
+_loaded_classes_lock = threading.Lock()
+
 
 def load_module(module_name, basepath):
     '''
@@ -42,3 +46,57 @@ def load_plugins(basepath, plugin_top_name):
             GlobalModule.EM_LOGGER.debug("Import Error:%s", ex)
             raise
     return plugin_list
+
+
+def search_module_dir(module_name, root_dir):
+    '''
+    Directory which has the module is searched under root directory.
+    (None is returned if the module is not found.)
+    '''
+    file_name = "{0}.py".format(module_name)
+    for root, dirs, files in os.walk(root_dir):
+        GlobalModule.EM_LOGGER.debug(
+            "Search:root={0},dirs={1},files={2}".format(root, dirs, files))
+        if file_name in files:
+            return root
+    return None
+
+
+def load_class(module_name, basepath, class_name=None, is_search=False):
+    '''
+    Class of module is loaded and returned.
+    Module is loaded only at the first time, and its class is reused
+    until reload_classes is called.
+    (If is_search is True, module is searched under basepath.)
+    '''
+    if class_name is None:
+        class_name = module_name
+    key = (os.path.normpath(basepath), module_name, class_name)
+    class_obj = _loaded_classes.get(key)
+    if class_obj is not None:
+        return class_obj
+    with _loaded_classes_lock:
+        class_obj = _loaded_classes.get(key)
+        if class_obj is None:
+            mod_dir = basepath
+            if is_search:
+                mod_dir = search_module_dir(module_name, basepath)
+                if mod_dir is None:
+                    raise ImportError(
+                        "No module named {0}".format(module_name))
+            GlobalModule.EM_LOGGER.debug(
+                'Load module:%s dir:%s', module_name, mod_dir)
+            class_obj = getattr(load_module(module_name, mod_dir), class_name)
+            _loaded_classes[key] = class_obj
+    return class_obj
+
+
+def reload_classes():
+    '''
+    Classes loaded by load_class are cleared,
+    and modules are loaded again at next load_class.
+    '''
+    with _loaded_classes_lock:
+        GlobalModule.EM_LOGGER.info(
+            'Reload classes (%s loaded)', len(_loaded_classes))
+        _loaded_classes.clear()
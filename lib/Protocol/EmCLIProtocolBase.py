@@ -5,11 +5,12 @@
 '''
 Protocol processing section(CLI)
 '''
+import codecs
 import json
 import paramiko
 import re
+import time
 import traceback
-import threading
 import GlobalModule
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
@@ -27,6 +28,8 @@ class EmCLIProtocol(object):
 
     _SSH_RECV_COUNT = 10
 
+    _RECV_SEARCH_OVERLAP = 1024
+
 
     @decorater_log
     def __init__(self, error_recv_message=[], connected_recv_message="#"):
@@ -41,14 +44,14 @@ class EmCLIProtocol(object):
         self._device_ip = None
         self._ssh_timeout_val = None
         self._ssh_recv_time = None
-        self._ssh_recv_mes_max_bytes = 50
+        self._ssh_recv_mes_max_bytes = 32768
+        self._recv_keyword_patterns = {}
         self._send_message_methods = {
             "get-config": self._send_edit_config,
             "edit-config": self._send_edit_config,
         }
         self._send_message_type = self._send_message_methods.keys()
         self._test_mode = False
-        self._is_recv_timeout = False
 
 
     @decorater_log_in_out
@@ -345,28 +348,46 @@ class EmCLIProtocol(object):
 
     @decorater_log
     def _recv_message(self, shell_obj, receive_keyword):
-        output = ''
-        self._is_recv_timeout = False
-        timer = threading.Timer(self._ssh_recv_time, self._set_timeout_flag)
-        timer.start()
+        '''
+        Receive message from device until receive keyword is found.
+            Data is read as much as received, and only the new data
+            (with the end of the previous data) is searched for the keyword.
+        Parameter:
+            shell_obj : ssh object
+            receive_keyword : Receive keyword (regular expression)
+        Return value
+            Received message
+        '''
+        keyword_re = self._recv_keyword_patterns.get(receive_keyword)
+        if keyword_re is None:
+            keyword_re = re.compile(receive_keyword)
+            self._recv_keyword_patterns[receive_keyword] = keyword_re
+        is_search_all = "^" in receive_keyword
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        output_list = []
+        search_tail = u''
+        deadline = time.time() + self._ssh_recv_time
         while True:
-            if self._is_recv_timeout:
+            if time.time() > deadline:
+                GlobalModule.EM_LOGGER.debug("receive timeout")
                 raise Exception("SSH command receive timeout")
-            tmp_rcv = shell_obj.recv(
-                self._ssh_recv_mes_max_bytes).decode('utf-8')
+            tmp_data = shell_obj.recv(self._ssh_recv_mes_max_bytes)
+            if not tmp_data:
+                raise Exception("SSH channel closed")
+            tmp_rcv = decoder.decode(tmp_data)
             GlobalModule.EM_LOGGER.debug("receive:%s" % (tmp_rcv,))
-            output = output + tmp_rcv
-            if(re.search(receive_keyword, output)):
+            output_list.append(tmp_rcv)
+            if is_search_all:
+                search_text = u''.join(output_list)
+            else:
+                search_text = search_tail + tmp_rcv
+            if keyword_re.search(search_text):
                 break
-        timer.cancel()
+            search_tail = search_text[-self._RECV_SEARCH_OVERLAP:]
+        output = u''.join(output_list)
         GlobalModule.EM_LOGGER.debug("receive all message:%s" % (output,))
         return output
 
-    @decorater_log
-    def _set_timeout_flag(self):
-        GlobalModule.EM_LOGGER.debug("receive timeout")
-        self._is_recv_timeout = True
-
 
     @decorater_log
     def _logging_send_command_str(self, command_list=[]):
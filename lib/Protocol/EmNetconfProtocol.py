@@ -8,6 +8,7 @@ Protocol processing section (Netconf)
 import traceback
 import time
 import json
+import threading
 from ncclient import manager
 from ncclient import operations
 import GlobalModule
@@ -25,6 +26,9 @@ class EmNetconfProtocol(object):
     __CONNECT_CAPABILITY_NG = 2
     __CONNECT_NO_RESPONSE = 3
 
+    _session_pool = {}
+    _session_pool_lock = threading.Lock()
+
     @decorater_log_in_out
     def connect_device(self, device_info):
         '''
@@ -105,6 +109,25 @@ class EmNetconfProtocol(object):
             GlobalModule.EM_LOGGER.debug(
                 "Connection Retry Num: %s", retry_num_val)
 
+        self.__pool_key = None
+        self.__is_session_dirty = False
+        self.__is_session_locked = False
+        is_pool, self.__pool_idle_time = self.__read_session_pool_conf()
+        if is_pool:
+            self.__pool_key = (self.__device_ip,
+                               port_number,
+                               username,
+                               password,
+                               str(device_info),
+                               device_info_dict.get("os_name"))
+            connection = self.__borrow_session(self.__pool_key,
+                                               self.__pool_idle_time)
+            if connection is not None:
+                self.__connection = connection
+                GlobalModule.EM_LOGGER.debug(
+                    "SSH Connection Reused for %s", self.__device_ip)
+                return self.__CONNECT_OK
+
         for count in range(retry_num_val):
             try:
                 self.__connection = EmNetconfClient.connect_ssh(
@@ -279,9 +302,12 @@ class EmNetconfProtocol(object):
                 "207005 protocol %s Sending Error", message_type)
             GlobalModule.EM_LOGGER.debug(
                 "Sending Error:%s", str(type(exception)))
+            self.__is_session_dirty = True
 
             return False, None
 
+        self.__set_session_state(judg_message_type, receive_message)
+
         GlobalModule.EM_LOGGER.info("107002 Receiving rpc-reply from %s",
                                     self.__device_ip)
 
@@ -297,6 +323,18 @@ class EmNetconfProtocol(object):
         Explanation about return value:
         Judgment result : boolean (True:Normal,False:Abnormal)
         '''
+        if (self.__pool_key is not None and
+                not self.__is_session_dirty and
+                not self.__is_session_locked and
+                self.__is_session_alive(self.__connection)):
+            self.__return_session(self.__pool_key,
+                                  self.__connection,
+                                  self.__pool_idle_time)
+            self.__connection = None
+            GlobalModule.EM_LOGGER.debug(
+                "SSH Connection Pooled for %s", self.__device_ip)
+            return True
+
         try:
             self.__connection.close_session()
 
@@ -322,6 +360,177 @@ class EmNetconfProtocol(object):
         self.__capability_list = \
             ('urn:ietf:params:netconf:base:1.0',
              'urn:ietf:params:netconf:base:1.1')
+        self.__pool_key = None
+        self.__pool_idle_time = 0
+        self.__is_session_dirty = False
+        self.__is_session_locked = False
+
+    @decorater_log
+    def __set_session_state(self, message_type, receive_message):
+        '''
+        Session state update
+            Keep whether the session has uncommitted configuration
+            or a lock, which must not be handed over to the next order.
+        Explanation about parameter:
+            message_type: Message type (judgment message type)
+            receive_message: Response signal
+        Explanation about return value:
+            None
+        '''
+        is_rpc_ok = "rpc-error" not in str(receive_message)
+        if message_type == "lock":
+            self.__is_session_locked = True
+        elif message_type == "unlock":
+            if is_rpc_ok:
+                self.__is_session_locked = False
+        elif message_type in ("edit_config", "confirmed_commit"):
+            self.__is_session_dirty = True
+        elif message_type in ("commit", "discard_changes"):
+            if is_rpc_ok:
+                self.__is_session_dirty = False
+
+    @staticmethod
+    @decorater_log
+    def __read_session_pool_conf():
+        '''
+        Session pool configuration acquisition
+        Explanation about parameter:
+            None
+        Explanation about return value:
+            Session pool enable : boolean
+            Idle time of pooled session (sec) : float
+        '''
+        result, is_pool = GlobalModule.EM_CONFIG.\
+            read_sys_common_conf("Netconf_session_pool")
+        if result is not True:
+            is_pool = False
+        result, idle_timer = GlobalModule.EM_CONFIG.\
+            read_sys_common_conf("Timer_netconf_session_idle")
+        if result is not True:
+            idle_timer = 300000
+        GlobalModule.EM_LOGGER.debug(
+            "Netconf Session Pool: %s Idle Timer: %s", is_pool, idle_timer)
+        return is_pool, idle_timer / 1000.0
+
+    @staticmethod
+    @decorater_log
+    def __is_session_alive(connection):
+        '''
+        Session health check
+            Check the SSH transport of the session with an ignore message.
+        Explanation about parameter:
+            connection: ncclient Manager
+        Explanation about return value:
+            Check result : boolean (True:Alive,False:Dead)
+        '''
+        try:
+            if connection is None or not connection.connected:
+                return False
+            transport = connection._session.transport
+            if transport is None or not transport.is_active():
+                return False
+            transport.send_ignore()
+        except Exception as exception:
+            GlobalModule.EM_LOGGER.debug(
+                "Session Check Error:%s", str(type(exception)))
+            return False
+        return True
+
+    @staticmethod
+    @decorater_log
+    def __close_session(connection):
+        '''
+        Close session that is evicted from the session pool.
+        Explanation about parameter:
+            connection: ncclient Manager
+        Explanation about return value:
+            None
+        '''
+        try:
+            connection.close_session()
+        except Exception as exception:
+            GlobalModule.EM_LOGGER.debug(
+                "Disconnect Error:%s", str(type(exception)))
+
+    @classmethod
+    @decorater_log
+    def __pop_expired_sessions(cls, now, idle_time):
+        '''
+        Remove sessions idle longer than idle time from the session pool.
+            Must be called with the session pool lock held.
+        Explanation about parameter:
+            now: Current time
+            idle_time: Idle time of pooled session (sec)
+        Explanation about return value:
+            Removed sessions : list
+        '''
+        expired = []
+        for pool_key in cls._session_pool.keys():
+            sessions = []
+            for connection, last_used in cls._session_pool[pool_key]:
+                if now - last_used > idle_time:
+                    expired.append(connection)
+                else:
+                    sessions.append((connection, last_used))
+            if sessions:
+                cls._session_pool[pool_key] = sessions
+            else:
+                del cls._session_pool[pool_key]
+        return expired
+
+    @classmethod
+    @decorater_log
+    def __borrow_session(cls, pool_key, idle_time):
+        '''
+        Take a live session out of the session pool.
+        Explanation about parameter:
+            pool_key: Device IP, port, credentials and device information
+            idle_time: Idle time of pooled session (sec)
+        Explanation about return value:
+            Session : ncclient Manager (None: No pooled session)
+        '''
+        with cls._session_pool_lock:
+            expired = cls.__pop_expired_sessions(time.time(), idle_time)
+            sessions = cls._session_pool.get(pool_key, [])
+            candidates = list(reversed(sessions))
+            cls._session_pool.pop(pool_key, None)
+        for connection in expired:
+            cls.__close_session(connection)
+        result = None
+        for index, (connection, _) in enumerate(candidates):
+            if cls.__is_session_alive(connection):
+                result = connection
+                unused = candidates[index + 1:]
+                if unused:
+                    with cls._session_pool_lock:
+                        cls._session_pool[pool_key] = (
+                            list(reversed(unused)) +
+                            cls._session_pool.get(pool_key, []))
+                break
+            GlobalModule.EM_LOGGER.debug(
+                "Evict Dead Session for %s", pool_key[0])
+            cls.__close_session(connection)
+        return result
+
+    @classmethod
+    @decorater_log
+    def __return_session(cls, pool_key, connection, idle_time):
+        '''
+        Put the session back to the session pool.
+        Explanation about parameter:
+            pool_key: Device IP, port, credentials and device information
+            connection: ncclient Manager
+            idle_time: Idle time of pooled session (sec)
+        Explanation about return value:
+            None
+        '''
+        now = time.time()
+        with cls._session_pool_lock:
+            expired = cls.__pop_expired_sessions(now, idle_time)
+            cls._session_pool.setdefault(pool_key, []).append(
+                (connection, now))
+        for tmp_connection in expired:
+            cls.__close_session(tmp_connection)
 
     @decorater_log
     def __judg_control_signal(self, message_type):
@@ -8,11 +8,12 @@ Controller log acquisition scenario.
 import re
 import os
 import glob
+import gzip
 import socket
 import traceback
+import collections
 from datetime import datetime, timedelta
 from flask import jsonify
-import linecache
 import EmSeparateRestScenario
 import GlobalModule
 from EmCommonLog import decorater_log
@@ -47,6 +48,7 @@ class EmControllerLogGet(EmSeparateRestScenario.EmRestScenario):
         self._file_format = "%Y-%m-%d"
         self._log_count = 0
         self._log_data = []
+        self._read_block_size = 65536
 
     @decorater_log
     def _get_url_param(self, request):
@@ -299,6 +301,8 @@ class EmControllerLogGet(EmSeparateRestScenario.EmRestScenario):
                                         end_date=None):
         '''
         Open the files under applicable file names, obtain log.
+            Plain file is read backwards by blocks from the end of file,
+            gzip file is read forwards as stream.
         Explanation about parameter:
             file_name:Log File Name
             limit_number:Maximum number of read lines
@@ -308,43 +312,125 @@ class EmControllerLogGet(EmSeparateRestScenario.EmRestScenario):
             Acquisition log data
         '''
         GlobalModule.EM_LOGGER.debug("Get Log Date in %s" % (file_name, ))
-        with open(file_name, "r") as log_file:
+        start_str = (start_date.strftime(self._log_date_format)
+                     if start_date is not None else None)
+        end_str = (end_date.strftime(self._log_date_format)
+                   if end_date is not None else None)
+        if file_name.endswith(".gz"):
+            get_log_data = self._get_log_data_from_gz_file(
+                file_name, limit_number, start_str, end_str)
+        else:
+            with open(file_name, "rb") as log_file:
+                get_log_data = self._get_log_data_from_reverse_lines(
+                    self._read_reverse_lines(log_file),
+                    limit_number,
+                    start_str,
+                    end_str)
+
+        GlobalModule.EM_LOGGER.debug(
+            "%s Date log num is %s" % (file_name, len(get_log_data)))
+        return get_log_data
+
+    @decorater_log
+    def _read_reverse_lines(self, log_file):
+        '''
+        Read lines from the end of file by blocks.
+        Explanation about parameter:
+            log_file:Log File Object
+        Explanation about return value:
+            Lines in reverse order (generator)
+        '''
+        log_file.seek(0, os.SEEK_END)
+        position = log_file.tell()
+        remainder = ""
+        is_last_block = True
+        while position > 0:
+            read_size = min(self._read_block_size, position)
+            position -= read_size
+            log_file.seek(position)
+            block = log_file.read(read_size) + remainder
+            if is_last_block and block.endswith("\n"):
+                block = block[:-1]
+            is_last_block = False
+            lines = block.split("\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        if not is_last_block:
+            yield remainder
 
-            line_num = sum(1 for line in log_file)
-            linecache.clearcache()
+    @decorater_log
+    def _get_log_data_from_reverse_lines(self,
+                                         lines,
+                                         limit_number,
+                                         start_str=None,
+                                         end_str=None):
+        '''
+        Obtain log from lines in reverse order.
+        Explanation about parameter:
+            lines:Lines in reverse order
+            limit_number:Maximum number of read lines
+            start_str:Reading target period (start date "%Y/%m/%d")
+            end_str:Reading target period (end date "%Y/%m/%d")
+        Explanation about return value:
+            Acquisition log data (newest first)
+        '''
+        tmp_log = []
+        get_log_data = []
+        for line in lines:
+            tmp_log.append(line)
+            match_obj = self._log_re.search(line)
+            if not match_obj:
+                continue
+            log_date = match_obj.groups()[0]
+            if start_str is not None and log_date < start_str:
+                break
+            if end_str is None or log_date <= end_str:
+                tmp_log.reverse()
+                get_log_data.append("\n".join(tmp_log))
             tmp_log = []
-            get_log_data = []
-            counter = 0
-            while True:
-                line = linecache.getline(file_name, int(line_num))
-                counter += 1
-                match_obj = self._log_re.search(line)
+            if len(get_log_data) >= limit_number + 1:
+                break
+        return get_log_data
 
-                tmp_log.append(line.rstrip("\n"))
-                if match_obj:
-
-                    log_date = datetime.strptime(match_obj.groups()[0],
-                                                 self._log_date_format)
-                    if start_date is not None and log_date < start_date:
-                        break
-                    if end_date is None or log_date <= end_date:
-                        if len(tmp_log) > 1:
-                            tmp_log.reverse()
-                            result = '\n'.join(tmp_log)
-                            get_log_data.append(result)
-                        elif len(tmp_log) != 0:
-                            get_log_data.append("".join(tmp_log))
-
-                    tmp_log = []
-
-                    if len(get_log_data) >= limit_number + 1:
-                        break
-
-                if line_num > 1:
-                    line_num -= 1
-                else:
+    @decorater_log
+    def _get_log_data_from_gz_file(self,
+                                   file_name,
+                                   limit_number,
+                                   start_str=None,
+                                   end_str=None):
+        '''
+        Obtain log from gzip file which has been rotated.
+            Only the newest logs up to maximum number of read lines
+            are kept while the file is read forwards.
+        Explanation about parameter:
+            file_name:Log File Name
+            limit_number:Maximum number of read lines
+            start_str:Reading target period (start date "%Y/%m/%d")
+            end_str:Reading target period (end date "%Y/%m/%d")
+        Explanation about return value:
+            Acquisition log data (newest first)
+        '''
+        get_log_data = collections.deque(maxlen=limit_number + 1)
+        tmp_log = None
+        with gzip.open(file_name, "rb") as log_file:
+            for line in log_file:
+                line = line.rstrip("\n")
+                match_obj = self._log_re.search(line)
+                if not match_obj:
+                    if tmp_log is not None:
+                        tmp_log.append(line)
+                    continue
+                if tmp_log is not None:
+                    get_log_data.append("\n".join(tmp_log))
+                    tmp_log = None
+                log_date = match_obj.groups()[0]
+                if end_str is not None and log_date > end_str:
                     break
-
-        GlobalModule.EM_LOGGER.debug(
-            "%s Date log num is %s" % (file_name, len(get_log_data)))
+                if start_str is None or log_date >= start_str:
+                    tmp_log = [line]
+        if tmp_log is not None:
+            get_log_data.append("\n".join(tmp_log))
+        get_log_data = list(get_log_data)
+        get_log_data.reverse()
         return get_log_data
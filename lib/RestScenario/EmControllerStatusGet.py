@@ -9,6 +9,7 @@ import os
 import traceback
 import commands
 import json
+import threading
 from flask import jsonify
 from copy import deepcopy
 import paramiko
@@ -18,6 +19,7 @@ from EmCommonLog import decorater_log, decorater_log_in_out
 from MsfEmMain import get_counter_send
 from EmRestServer import get_counter_recv
 from EmSysCommonUtilityDB import EmSysCommonUtilityDB
+from EmControllerStatusCollector import EmControllerStatusCollector
 
 
 class UrlParameterGetInfo(object):
@@ -82,7 +84,7 @@ class EmControllerStatusGet(EmSeparateRestScenario.EmRestScenario):
         self.em_sby = "em_sby"
         self._ctl_info_list = (self.em_act, self.em_sby)
         self._ctl_shell_class = {
-            self.em_act: ExecuteShellScript,
+            self.em_act: ExecuteStatusCollector,
             self.em_sby: ExecuteShellScriptWithSSH,
         }
         self._shell_analysis_class = {
@@ -180,8 +182,16 @@ class EmControllerStatusGet(EmSeparateRestScenario.EmRestScenario):
                                                      self._get_info_list)
         info_list = []
         ctl = None
+        cache_time = self._get_sample_cache_time()
         try:
             for ctl in ctl_info_list:
+                sample_key = (ctl, tuple(get_info_list))
+                shell_result = EmControllerStatusCollector.get_sample(
+                    sample_key, cache_time)
+                if shell_result is not None:
+                    GlobalModule.EM_LOGGER.debug("use sample:%s", ctl)
+                    info_list.append(shell_result)
+                    continue
                 exec_shell_cls = self._ctl_shell_class[ctl]
                 result_analysis_cls = self._shell_analysis_class[ctl]
                 shell_result = (
@@ -190,6 +200,8 @@ class EmControllerStatusGet(EmSeparateRestScenario.EmRestScenario):
                                                        result_analysis_cls)
                 )
                 shell_result["controller_type"] = ctl
+                EmControllerStatusCollector.put_sample(sample_key,
+                                                       shell_result)
                 info_list.append(shell_result)
         except Exception:
             GlobalModule.EM_LOGGER.error(
@@ -198,6 +210,19 @@ class EmControllerStatusGet(EmSeparateRestScenario.EmRestScenario):
         os_info["informations"] = info_list
         return os_info
 
+    @decorater_log
+    def _get_sample_cache_time(self):
+        '''
+        Obtain time to answer with the controller status acquired before.
+        Return value:
+            Cache time (sec) (0: not answered with the status acquired before)
+        '''
+        is_ok, cache_time = GlobalModule.EM_CONFIG.read_sys_common_conf(
+            "Timer_statusget_cache")
+        if not is_ok or cache_time is None:
+            cache_time = 10000
+        return cache_time / 1000.0
+
     @decorater_log
     def _gen_response(self, os_info, request_count):
         '''
@@ -411,11 +436,58 @@ class ExecuteShellScript(object):
         return value
 
 
+class ExecuteStatusCollector(ExecuteShellScript):
+    '''
+    Obtain controller status from /proc without shell script.
+    '''
+
+    @decorater_log_in_out
+    def get_shell_info_from_config(self):
+        '''
+        Obtain necessary information from config management section.
+        (Shell script is not used.)
+        '''
+        pass
+
+    @decorater_log_in_out
+    def set_command(self):
+        '''
+        Create executing command.(Shell script is not used.)
+        '''
+        self.command_txt = "collect %s" % (self.command_param,)
+
+    @decorater_log
+    def _execute_command(self, command_txt=None):
+        '''
+        Obtain controller status in the same format as shell script result.
+        Explanation about parameter:
+            command_txt:Execute Command (not used)
+        Explanation about return value:
+            Controller status (dict)
+        '''
+        params = [int(param) for param in self.command_param.split()]
+        try:
+            return EmControllerStatusCollector.collect(
+                is_top=bool(params[0]),
+                is_nproc=bool(params[1]),
+                is_df=bool(params[2]),
+                is_sar=bool(params[3]),
+                is_hostname=bool(params[4]),
+                pid=params[5])
+        except (IOError, OSError, ValueError, IndexError) as ex:
+            error_mes = "Failed to collect status:{0}".format(ex)
+            raise Exception((self._error_text % ("010305", error_mes)))
+
+
 class ExecuteShellScriptWithSSH(ExecuteShellScript):
     '''
     Connecct with SSH and execute shell script.
+        SSH connection is kept and reused in the next execution.
     '''
 
+    _ssh_client = None
+    _ssh_lock = threading.Lock()
+
     @decorater_log
     def __init__(self, lib_path):
         '''
@@ -471,15 +543,16 @@ class ExecuteShellScriptWithSSH(ExecuteShellScript):
         '''
         if not command_txt:
             command_txt = self.command_txt
-        with paramiko.SSHClient() as ssh:
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(hostname=self.address,
-                        port=self.port,
-                        username=self.username,
-                        password=self.password)
-            stdin, stdout, stderr = ssh.exec_command(command_txt)
-            info_stdout = stdout.read()
-            info_stderr = stderr.read()
+        cls = ExecuteShellScriptWithSSH
+        with cls._ssh_lock:
+            try:
+                ssh = self._get_ssh_client()
+                stdin, stdout, stderr = ssh.exec_command(command_txt)
+                info_stdout = stdout.read()
+                info_stderr = stderr.read()
+            except Exception:
+                self._close_ssh_client()
+                raise
             if info_stderr:
                 GlobalModule.EM_LOGGER.debug("stdout:%s", info_stdout)
                 error_mes = "Failed to execute shell:{0}".format(info_stderr)
@@ -489,6 +562,46 @@ class ExecuteShellScriptWithSSH(ExecuteShellScript):
                 return_value = info_stdout
         return return_value
 
+    @decorater_log
+    def _get_ssh_client(self):
+        '''
+        Obtain SSH connection to the server.
+            Connection is reused if it is active for the same server and user.
+        Explanation about return value:
+            SSH client (paramiko.SSHClient)
+        '''
+        cls = ExecuteShellScriptWithSSH
+        conn_info = (self.address, self.port, self.username, self.password)
+        if cls._ssh_client is not None:
+            ssh, tmp_conn_info = cls._ssh_client
+            transport = ssh.get_transport()
+            if (tmp_conn_info == conn_info and
+                    transport is not None and transport.is_active()):
+                return ssh
+            self._close_ssh_client()
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh.connect(hostname=self.address,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password)
+        cls._ssh_client = (ssh, conn_info)
+        return ssh
+
+    @staticmethod
+    @decorater_log
+    def _close_ssh_client():
+        '''
+        Close SSH connection to the server.
+        '''
+        cls = ExecuteShellScriptWithSSH
+        if cls._ssh_client is not None:
+            try:
+                cls._ssh_client[0].close()
+            except Exception as ex:
+                GlobalModule.EM_LOGGER.debug("SSH close error:%s", ex)
+            cls._ssh_client = None
+
 
 class AnalysisShellResult(object):
     '''
@@ -508,12 +621,15 @@ class AnalysisShellResult(object):
         '''
         Analyze shell script result.
         Explanation about parameter:
-            result_json:shell script result (txt)
+            result_json:shell script result (txt or dict)
             get_info_list:Acquisition Target List
         Explanation about return value:
             Shell script result (dict)
         '''
-        result_json = json.loads(shell_result_txt)
+        if isinstance(shell_result_txt, dict):
+            result_json = shell_result_txt
+        else:
+            result_json = json.loads(shell_result_txt)
         result_shell = self._analysis_shell_info(result_json,
                                                  get_info_list)
         mgmt_ip = self._get_em_mgmt_ip_address()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+# Filename: EmDeviceConfigAuditBulk.py
+'''
+Module for Config-Audit of multiple hosts
+'''
+import json
+import time
+import Queue
+import threading
+import collections
+import traceback
+from flask import Response
+import EmSeparateRestScenario
+import GlobalModule
+from EmCommonLog import decorater_log, decorater_log_in_out
+from EmDeviceConfigAudit import EmDeviceConfigAudit
+
+
+class EmDeviceConfigAuditBulk(EmSeparateRestScenario.EmRestScenario):
+    '''
+    Class for Config-Audit of multiple hosts
+    (Results are returned by one JSON line for each host as soon as
+     its Config-Audit finishes, and the summary line is returned last.)
+    '''
+
+    _default_thread_num = 16
+
+    _default_vendor_thread_num = 4
+
+    @decorater_log
+    def __init__(self):
+        '''
+        Constructor
+        '''
+
+        super(EmDeviceConfigAuditBulk, self).__init__()
+        self.scenario_name = "EmDeviceConfigAuditBulk"
+        self.error_code_top = "05"
+        self._error_code_list = {"050101": 400,
+                                 "050301": 500,
+                                 "050399": 500, }
+        self.is_detail = False
+
+    @decorater_log
+    def _scenario_main(self, *args, **kwargs):
+        '''
+        Scenario processing
+        Config-Audit of the specified hosts(all registered hosts if not
+        specified) is executed in parallel.
+        Argument:
+            *args, **kwargs : variable argument, variable keyword argument(list,dict)
+                              (request object is in kwarg.)
+        Return value:
+            response object
+        '''
+        request = kwargs.get("request")
+        hostname_list = self._get_hostname_list(request)
+        self.is_detail = (request.args.get("detail", "").lower() == "true")
+        GlobalModule.EM_LOGGER.debug(
+            "start bulk config-audit: hostname=%s" % (hostname_list,))
+        try:
+            job_list, result_list = self._make_job_list(hostname_list)
+            thread_num, vendor_thread_num = self._get_thread_num()
+        except Exception:
+            GlobalModule.EM_LOGGER.debug(
+                "Trace Back:%s" % (traceback.format_exc(),))
+            raise
+        response = Response(
+            self._generate_result(job_list, result_list,
+                                  thread_num, vendor_thread_num),
+            mimetype="application/x-ndjson")
+        response.status_code = 200
+        return response
+
+    @decorater_log
+    def _get_hostname_list(self, request):
+        '''
+        Host name list is acquired from request.
+            GET : hostname parameters (comma separated value is allowed)
+            POST : "hostname_list" of JSON body
+        Argument:
+            request : request object
+        Return value:
+            host name list (None : all registered hosts) : list
+        '''
+        if request.method == "POST":
+            body = request.get_json(force=True, silent=True) or {}
+            hostname_list = body.get("hostname_list")
+            if hostname_list is not None and (
+                    not isinstance(hostname_list, list) or
+                    not all(isinstance(tmp, basestring)
+                            for tmp in hostname_list)):
+                raise ValueError(self._error_text % (
+                    "050101", "hostname_list is not list of str"))
+        else:
+            hostname_list = []
+            for tmp in request.args.getlist("hostname"):
+                hostname_list.extend(
+                    name.strip() for name in tmp.split(",") if name.strip())
+            hostname_list = hostname_list or None
+        if hostname_list is None:
+            return None
+        return [str(tmp) for tmp in collections.OrderedDict.fromkeys(
+            hostname_list)]
+
+    @decorater_log
+    def _make_job_list(self, hostname_list):
+        '''
+        Job list of Config-Audit is generated.
+        Argument:
+            hostname_list : host name list (None : all registered hosts)
+        Return value:
+            job list : list [(host name, platform name)]
+            result list of hosts which are not registered : list
+        '''
+        job_list = []
+        result_list = []
+        if hostname_list is None:
+            is_ok, data = (
+                GlobalModule.EMSYSCOMUTILDB.read_device_registered_list())
+            if not is_ok:
+                raise IOError(self._error_text % (
+                    "050301", "Failed to get device list."))
+            job_list.extend(data)
+            return job_list, result_list
+        for hostname in hostname_list:
+            is_ok, data = (
+                GlobalModule.EMSYSCOMUTILDB.read_separate_driver_info(
+                    hostname))
+            if not is_ok:
+                raise IOError(self._error_text % (
+                    "050301", "Failed to get device info."))
+            if not data:
+                result_list.append({"hostname": hostname,
+                                    "result": "NG",
+                                    "error_code": "030101",
+                                    "elapsed_time": 0.0})
+            else:
+                job_list.append((hostname, data[0]))
+        return job_list, result_list
+
+    @decorater_log
+    def _get_thread_num(self):
+        '''
+        Number of threads for Config-Audit is acquired.
+        Argument:
+            None
+        Return value:
+            number of threads : int
+            number of threads for each platform : int
+        '''
+        is_ok, thread_num = GlobalModule.EM_CONFIG.read_if_process_rest_conf(
+            "Rest_audit_thread_num")
+        if not is_ok or thread_num <= 0:
+            thread_num = self._default_thread_num
+        is_ok, vendor_thread_num = (
+            GlobalModule.EM_CONFIG.read_if_process_rest_conf(
+                "Rest_audit_vendor_thread_num"))
+        if not is_ok or vendor_thread_num <= 0:
+            vendor_thread_num = self._default_vendor_thread_num
+        return thread_num, vendor_thread_num
+
+    def _generate_result(self,
+                         job_list,
+                         result_list,
+                         thread_num,
+                         vendor_thread_num):
+        '''
+        Config-Audit is executed by thread pool, and its result is
+        returned for each host as soon as it finishes.
+        (Remaining jobs are cancelled if the response is closed.)
+        Argument:
+            job_list : job list : list [(host name, platform name)]
+            result_list : result list of hosts which are not audited : list
+            thread_num : number of threads : int
+            vendor_thread_num : number of threads for each platform : int
+        Return value:
+            JSON line : generator
+        '''
+        start_time = time.time()
+        result_queue = Queue.Queue()
+        scheduler = _AuditJobScheduler(job_list, vendor_thread_num)
+        for count in range(min(thread_num, len(job_list))):
+            thread = threading.Thread(target=self._audit_thread,
+                                      args=(scheduler, result_queue),
+                                      name="EmConfigAudit-%d" % (count,))
+            thread.daemon = True
+            thread.start()
+        summary = {"total": len(job_list) + len(result_list),
+                   "ok": 0,
+                   "ng": 0,
+                   "diff": 0,
+                   "device_time": {}}
+        try:
+            for count in range(len(job_list) + len(result_list)):
+                if count < len(result_list):
+                    result = result_list[count]
+                else:
+                    result = result_queue.get()
+                if result["result"] == "OK":
+                    summary["ok"] += 1
+                    if result["diff"]["diff_data_unified"]:
+                        summary["diff"] += 1
+                else:
+                    summary["ng"] += 1
+                summary["device_time"][result["hostname"]] = (
+                    result["elapsed_time"])
+                yield json.dumps(result) + "\n"
+        finally:
+            scheduler.cancel()
+        summary["elapsed_time"] = round(time.time() - start_time, 3)
+        GlobalModule.EM_LOGGER.debug(
+            "end bulk config-audit: total=%s ok=%s ng=%s time=%s" %
+            (summary["total"], summary["ok"], summary["ng"],
+             summary["elapsed_time"]))
+        yield json.dumps({"summary": summary}) + "\n"
+
+    def _audit_thread(self, scheduler, result_queue):
+        '''
+        Thread which executes Config-Audit of jobs.
+        Argument:
+            scheduler : job scheduler
+            result_queue : queue for result
+        Return value:
+            None
+        '''
+        while True:
+            job = scheduler.get_job()
+            if job is None:
+                return
+            hostname, platform_name = job
+            try:
+                result_queue.put(self._audit_device(hostname))
+            finally:
+                scheduler.done_job(platform_name)
+
+    @decorater_log_in_out
+    def _audit_device(self, hostname):
+        '''
+        Config-Audit of one host is executed.
+        Argument:
+            hostname : host name (str)
+        Return value:
+            result of Config-Audit : dict
+        '''
+        start_time = time.time()
+        audit = EmDeviceConfigAudit()
+        try:
+            audit._execute_config_audit(hostname)
+            result = audit._gen_response_json()
+            if not self.is_detail:
+                result.get("latest_em_config", {}).pop("config", None)
+                result["ne_config"].pop("config", None)
+            result["result"] = "OK"
+        except Exception as ex:
+            GlobalModule.EM_LOGGER.debug(
+                "Config-Audit Error:%s Trace Back:%s" %
+                (hostname, traceback.format_exc()))
+            error_code = (audit._analysis_error(str(ex)) or
+                          "%s0399" % (audit.error_code_top,))
+            result = {"hostname": hostname,
+                      "result": "NG",
+                      "error_code": error_code}
+        result["elapsed_time"] = round(time.time() - start_time, 3)
+        return result
+
+
+class _AuditJobScheduler(object):
+    '''
+    Job scheduler which limits number of running jobs for each platform.
+    (Platforms are selected in turn.)
+    '''
+
+    def __init__(self, job_list, vendor_thread_num):
+        '''
+        Constructor
+        '''
+        self._vendor_thread_num = vendor_thread_num
+        self._pending = collections.OrderedDict()
+        for hostname, platform_name in job_list:
+            self._pending.setdefault(
+                platform_name, collections.deque()).append(
+                    (hostname, platform_name))
+        self._running = collections.defaultdict(int)
+        self._condition = threading.Condition()
+        self._is_cancel = False
+
+    def get_job(self):
+        '''
+        Job is acquired.
+        (Wait until any platform has free thread.)
+        Return value:
+            job : tuple (host name, platform name) (None : no job)
+        '''
+        with self._condition:
+            while not self._is_cancel and self._pending:
+                for platform_name, job_queue in self._pending.items():
+                    if self._running[platform_name] < self._vendor_thread_num:
+                        job = job_queue.popleft()
+                        del self._pending[platform_name]
+                        if job_queue:
+                            self._pending[platform_name] = job_queue
+                        self._running[platform_name] += 1
+                        return job
+                self._condition.wait()
+            return None
+
+    def done_job(self, platform_name):
+        '''
+        Finish of job is notified.
+        '''
+        with self._condition:
+            self._running[platform_name] -= 1
+            self._condition.notify_all()
+
+    def cancel(self):
+        '''
+        Remaining jobs are cancelled.
+        '''
+        with self._condition:
+            self._is_cancel = True
+            self._condition.notify_all()
@@ -6,16 +6,20 @@
 Rest Server function.
 '''
 import os
-import imp
+import time
+import Queue
+import bisect
 import traceback
 import threading
 import functools
+import collections
 import signal
-from datetime import datetime, timedelta
-from copy import deepcopy
+from datetime import datetime
 from flask import Flask, request
 from flask_cors import CORS
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
 import GlobalModule
+import PluginLoader
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
 
@@ -23,62 +27,109 @@ application = Flask(__name__)
 
 CORS(application)
 
-_request_date_list = []
+_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_request_time_list = collections.deque()
+
+_request_latency = {}
 
 _request_lock = threading.Lock()
 
 
 @decorater_log_in_out
 def get_counter_recv():
-    _request_lock.acquire()
-
-    is_ok, unit_time = (
-        GlobalModule.EM_CONFIG.read_sys_common_conf("Rest_request_average"))
-
-    diffdate = datetime.now() - timedelta(seconds=unit_time)
+    '''
+    Number of requests received in the last Rest_request_average seconds.
+    '''
+    return len(_get_request_time_list())
 
-    counter = 0
-    for timeval in _request_date_list[:]:
-        counter += 1
-        if timeval <= diffdate:
-            break
 
-    _request_lock.release()
-    return counter
+@decorater_log_in_out
+def get_request_latency():
+    '''
+    Latency histogram of each REST API.
+    Return value:
+        {api name: {"count", "total", "buckets":[(upper bound(sec), count)]}}
+    '''
+    result = {}
+    with _request_lock:
+        for api_name, (total, counts) in _request_latency.items():
+            result[api_name] = {
+                "count": sum(counts),
+                "total": total,
+                "buckets": zip(_LATENCY_BUCKETS + (None,), counts),
+            }
+    return result
 
 
 def _deco_count_request(func):
     '''
-    Request counter recorder.
+    Request counter and latency recorder.
     '''
+    api_name = func.__name__.replace("rest_if_", "", 1)
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         _request_counter()
-        return func(*args, **kwargs)
+        start_time = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record_latency(api_name, time.time() - start_time)
     return wrapper
 
 
 @decorater_log
-def _request_counter(request_date=datetime.now()):
+def _get_request_time_list():
+    '''
+    Received time of requests within Rest_request_average seconds.
+    '''
+    is_ok, unit_time = (
+        GlobalModule.EM_CONFIG.read_sys_common_conf("Rest_request_average"))
+    if not is_ok:
+        return []
+    before_time = time.time() - unit_time
+    with _request_lock:
+        time_list = [tmp for tmp in _request_time_list if tmp >= before_time]
+    time_list.sort(reverse=True)
+    return time_list
+
+
+@decorater_log
+def _request_counter(request_time=None):
     '''
     Update request history list.
+    (Requests older than Rest_request_average seconds are removed.)
     '''
-    _request_lock.acquire()
     is_ok, unit_time = (
         GlobalModule.EM_CONFIG.read_sys_common_conf("Rest_request_average"))
     if not is_ok:
         GlobalModule.EM_LOGGER.error('310009 REST Count Error')
-        _request_lock.release()
         return False
-    before_time = request_date + timedelta(seconds=(-1 * unit_time))
-    global _request_date_list
-    _request_date_list.append(request_date)
-    _request_date_list = [
-        tmp for tmp in deepcopy(_request_date_list) if tmp >= before_time]
-    _request_lock.release()
+    if request_time is None:
+        request_time = time.time()
+    before_time = request_time - unit_time
+    with _request_lock:
+        _request_time_list.append(request_time)
+        while _request_time_list and _request_time_list[0] < before_time:
+            _request_time_list.popleft()
     return True
 
 
+@decorater_log
+def _record_latency(api_name, latency):
+    '''
+    Record latency of REST API.
+    '''
+    with _request_lock:
+        api_latency = _request_latency.get(api_name)
+        if api_latency is None:
+            api_latency = [0.0, [0] * (len(_LATENCY_BUCKETS) + 1)]
+            _request_latency[api_name] = api_latency
+        api_latency[0] += latency
+        api_latency[1][bisect.bisect_left(_LATENCY_BUCKETS, latency)] += 1
+
+
 @application.route("/v1/internal/em_ctrl/statusget")
 @_deco_count_request
 def rest_if_statusget():
@@ -89,9 +140,11 @@ def rest_if_statusget():
         key : Key
     Return value :
     '''
+    request_date_list = [datetime.fromtimestamp(tmp)
+                         for tmp in _get_request_time_list()]
     return _execute_rest_api("/v1/internal/em_ctrl/statusget",
                              request=request,
-                             request_date_list=deepcopy(_request_date_list))
+                             request_date_list=request_date_list)
 
 
 @application.route("/v1/internal/em_ctrl/log")
@@ -137,6 +190,22 @@ def rest_if_device_config_audit(hostname):
                              hostname=hostname)
 
 
+@application.route("/v1/internal/node_ctrl/neconfigaudit",
+                   methods=["GET", "POST"])
+@_deco_count_request
+def rest_if_device_config_audit_bulk():
+    '''
+    Device Config-Audit of multiple devices.
+        Executes Config-Audit of specified devices (all devices if omitted)
+        in parallel, and returns result of each device as it finishes.
+    Parameter:
+        key : Key
+    Return value :
+    '''
+    return _execute_rest_api("/v1/internal/node_ctrl/neconfigaudit",
+                             request=request)
+
+
 @decorater_log
 def _execute_rest_api(rest_uri, *args, **kwargs):
     '''
@@ -185,16 +254,11 @@ def _import_scenario_and_get_instance(rest_scenario_name):
     lib_path = GlobalModule.EM_LIB_PATH
     GlobalModule.EM_LOGGER.debug('environment path:%s', lib_path)
 
-    filepath, filename, data =\
-        imp.find_module(
-            rest_scenario_name, [os.path.join(lib_path, 'RestScenario')])
-    GlobalModule.EM_LOGGER.debug('search modules')
-
-    scenario_mod = imp.load_module(
-        rest_scenario_name, filepath, filename, data)
+    scenario_cls = PluginLoader.load_class(
+        rest_scenario_name, os.path.join(lib_path, 'RestScenario'))
     GlobalModule.EM_LOGGER.debug('load modules')
 
-    scenario_ins = getattr(scenario_mod, rest_scenario_name)()
+    scenario_ins = scenario_cls()
     GlobalModule.EM_LOGGER.debug('instantiation')
 
     return scenario_ins
@@ -209,6 +273,84 @@ def _execute_scenario(scenario_ins, *arg, **kwargs):
     return scenario_ins.execute(*arg, **kwargs)
 
 
+class EmRestRequestHandler(WSGIRequestHandler):
+    '''
+    REST request handler which keeps HTTP/1.1 connection alive
+    '''
+
+    protocol_version = "HTTP/1.1"
+
+    def handle_one_request(self):
+        '''
+        One request is handled.
+        (Connection is closed after the response if other connections
+         are waiting for worker thread.)
+        '''
+        WSGIRequestHandler.handle_one_request(self)
+        if self.server.has_waiting_request():
+            self.close_connection = 1
+
+
+class EmRestWSGIServer(BaseWSGIServer):
+    '''
+    WSGI server which handles connections by fixed number of threads
+    '''
+
+    multithread = True
+
+    @decorater_log
+    def __init__(self, host, port, app, thread_num, keepalive_timeout):
+        '''
+        Constructor
+        '''
+        super(EmRestWSGIServer, self).__init__(host, port, app,
+                                               EmRestRequestHandler)
+        self._keepalive_timeout = keepalive_timeout
+        self._request_queue = Queue.Queue()
+        self._worker_threads = []
+        for count in range(thread_num):
+            thread = threading.Thread(target=self._process_request_thread,
+                                      name="EmRestWorker-%d" % (count,))
+            thread.daemon = True
+            thread.start()
+            self._worker_threads.append(thread)
+
+    def get_request(self):
+        '''
+        Connection is accepted with idle timeout.
+        (Connection with no data for Rest_keepalive_timeout seconds
+         is closed, so that idle keep-alive connection releases the thread.)
+        '''
+        request, client_address = self.socket.accept()
+        request.settimeout(self._keepalive_timeout)
+        return request, client_address
+
+    def has_waiting_request(self):
+        '''
+        Whether any connection is waiting for worker thread.
+        '''
+        return not self._request_queue.empty()
+
+    def process_request(self, request, client_address):
+        '''
+        Connection is handed over to worker thread.
+        '''
+        self._request_queue.put((request, client_address))
+
+    def _process_request_thread(self):
+        '''
+        Worker thread handling connections.
+        '''
+        while True:
+            request, client_address = self._request_queue.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+
 class EmRestServer(object):
     '''
     REST server class
@@ -237,8 +379,26 @@ class EmRestServer(object):
     @decorater_log
     def _run_server(self):
         '''
-        REST server launching method (execute app.run)
+        REST server launching method
+        (If Rest_server_thread_num is not set, execute app.run)
         '''
-
-        application.run(host=self._rest_address, port=self._rest_port,
-                        threaded=True)
+        is_ok, thread_num = GlobalModule.EM_CONFIG.read_if_process_rest_conf(
+            "Rest_server_thread_num")
+        if not is_ok or not thread_num:
+            application.run(host=self._rest_address, port=self._rest_port,
+                            threaded=True)
+            return
+        is_ok, keepalive_timeout = (
+            GlobalModule.EM_CONFIG.read_if_process_rest_conf(
+                "Rest_keepalive_timeout"))
+        if not is_ok or not keepalive_timeout or keepalive_timeout < 0:
+            keepalive_timeout = 5
+        GlobalModule.EM_LOGGER.debug(
+            "REST WSGI Server thread:%s keepalive:%s",
+            thread_num, keepalive_timeout)
+        rest_server = EmRestWSGIServer(self._rest_address,
+                                       self._rest_port,
+                                       application,
+                                       thread_num,
+                                       keepalive_timeout)
+        rest_server.serve_forever()
@@ -6,10 +6,10 @@
 '''
 Individual scenario for adding individual UNI static route  Cgwsh service
 '''
-import json
 from lxml import etree
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 from EmCgwshServiceFlavor import EmCgwshServiceFlavor
 from EmCgwshServiceBase import EmCgwshServiceBase
 
@@ -44,7 +44,7 @@ class EmCgwshCustomerUniRouteMerge(EmCgwshServiceFlavor, EmCgwshServiceBase):
         Return value:
             device_json_message: JSON message
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -54,4 +54,4 @@ class EmCgwshCustomerUniRouteMerge(EmCgwshServiceFlavor, EmCgwshServiceBase):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
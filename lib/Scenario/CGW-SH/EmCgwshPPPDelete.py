@@ -6,10 +6,10 @@
 '''
 Individual scenario for deleting PPP in Cgwsh service
 '''
-import json
 from lxml import etree
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 from EmCgwshServiceFlavor import EmCgwshServiceFlavor
 from EmCgwshServiceBase import EmCgwshServiceBase
 
@@ -43,7 +43,7 @@ class EmCgwshPPPDelete(EmCgwshServiceFlavor, EmCgwshServiceBase):
         Return value:
             device_json_message: JSON message
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -53,4 +53,4 @@ class EmCgwshPPPDelete(EmCgwshServiceFlavor, EmCgwshServiceBase):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
@@ -5,11 +5,11 @@
 '''
 Individual scenario for ACL configuration deletion
 '''
-import json
 from lxml import etree
 from EmDeleteScenario import EmDeleteScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmACLFilterDelete(EmDeleteScenario):
@@ -52,7 +52,7 @@ class EmACLFilterDelete(EmDeleteScenario):
             }
         }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -65,7 +65,7 @@ class EmACLFilterDelete(EmDeleteScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_acl_filter(self, json, xml, xml_ns):
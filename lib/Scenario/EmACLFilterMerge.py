@@ -5,12 +5,12 @@
 '''
 Individual scenario for ACLFilter generation
 '''
-import json
 from lxml import etree
 import ipaddress
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmACLFilterMerge(EmMergeScenario):
@@ -54,7 +54,7 @@ class EmACLFilterMerge(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -68,7 +68,7 @@ class EmACLFilterMerge(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_acl_filter(self, json, xml, xml_ns):
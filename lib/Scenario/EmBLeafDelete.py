@@ -6,12 +6,12 @@
 Individual scenario for B-Leaf reduction.
 '''
 from lxml import etree
-import json
 from EmBLeafScenario import EmBLeafScenario
 from EmDeleteScenario import EmDeleteScenario
 from EmLeafDelete import EmLeafDelete
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmBLeafDelete(EmBLeafScenario, EmLeafDelete):
@@ -55,7 +55,7 @@ class EmBLeafDelete(EmBLeafScenario, EmLeafDelete):
         Explanation about parameter:
             None
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
         ospf_elm = self._find_xml_node(xml_elm, self._xml_ns + "ospf")
         if ospf_elm is not None:
             GlobalModule.EM_LOGGER.debug('OSPF tag EXIST')
@@ -85,7 +85,7 @@ class EmBLeafDelete(EmBLeafScenario, EmLeafDelete):
         Explanation about return value:
             device_json_message: JSON message
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -104,4 +104,4 @@ class EmBLeafDelete(EmBLeafScenario, EmLeafDelete):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
@@ -9,6 +9,7 @@ import json
 from lxml import etree
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 from EmLeafMerge import EmLeafMerge
 from EmBLeafScenario import EmBLeafScenario
 
@@ -45,7 +46,7 @@ class EmBLeafMerge(EmBLeafScenario, EmLeafMerge):
         Explanation about return value
             device_json_message: JSON message
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -66,4 +67,4 @@ class EmBLeafMerge(EmBLeafScenario, EmLeafMerge):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
@@ -6,10 +6,10 @@
 '''
 Individual scenario for updating B-Leaf.
 '''
-import json
 from lxml import etree
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 from EmBLeafScenario import EmBLeafScenario
 from EmLeafMerge import EmLeafMerge
 from EmDeviceMerge import EmDeviceMerge
@@ -47,7 +47,7 @@ class EmBLeafUpdate(EmBLeafScenario, EmLeafMerge):
         Explanation about return value
             device_json_message: JSON message
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -62,7 +62,7 @@ class EmBLeafUpdate(EmBLeafScenario, EmLeafMerge):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _process_scenario(self,
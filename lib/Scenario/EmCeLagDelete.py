@@ -5,11 +5,11 @@
 '''
 Individual scenario of LAG deletion for CE.
 '''
-import json
 from lxml import etree
 from EmDeleteScenario import EmDeleteScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmCeLagDelete(EmDeleteScenario):
@@ -54,7 +54,7 @@ class EmCeLagDelete(EmDeleteScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -68,7 +68,7 @@ class EmCeLagDelete(EmDeleteScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device__json_message)
 
-        return json.dumps(device__json_message)
+        return EmOrderMessage(device__json_message)
 
     @decorater_log
     def _gen_json_name(self, json, xml, xml_ns):
@@ -5,11 +5,11 @@
 '''
 Individual scenario to add LAG for CE.
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmCeLagMerge(EmMergeScenario):
@@ -55,7 +55,7 @@ class EmCeLagMerge(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -69,7 +69,7 @@ class EmCeLagMerge(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device__json_message)
 
-        return json.dumps(device__json_message)
+        return EmOrderMessage(device__json_message)
 
     @decorater_log
     def _gen_json_name(self, json, xml, xml_ns):
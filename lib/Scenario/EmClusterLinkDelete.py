@@ -5,11 +5,11 @@
 '''
 Individual scenario for deleting inter-cluster link.
 '''
-import json
 from lxml import etree
 from EmDeleteScenario import EmDeleteScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmClusterLinkDelete(EmDeleteScenario):
@@ -53,7 +53,7 @@ class EmClusterLinkDelete(EmDeleteScenario):
             }
         }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -68,7 +68,7 @@ class EmClusterLinkDelete(EmDeleteScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_cluster_link(self, json, xml, xml_ns):
@@ -5,11 +5,11 @@
 '''
 Individual scenario to create inter-cluster link.
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmClusterLinkMerge(EmMergeScenario):
@@ -56,7 +56,7 @@ class EmClusterLinkMerge(EmMergeScenario):
             }
         }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -81,7 +81,7 @@ class EmClusterLinkMerge(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_cluster_link_phy(self, json, xml, xml_ns):
@@ -6,10 +6,10 @@
 Class for updating device information
 '''
 from lxml import etree
-import json
 from EmDeviceMerge import EmDeviceMerge
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmDeviceInfoUpdate(EmDeviceMerge):
@@ -73,7 +73,7 @@ class EmDeviceInfoUpdate(EmDeviceMerge):
             device_json_message: JSON message
         '''
         device_json_message = {}
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
         device_obj = {}
@@ -81,7 +81,7 @@ class EmDeviceInfoUpdate(EmDeviceMerge):
         device_obj["equipment"] = self._gen_json_equipment(xml_elm,
                                                            self._xml_ns)
         device_json_message["device"] = device_obj
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_name(self, xml, xml_ns):
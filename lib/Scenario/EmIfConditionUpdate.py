@@ -5,11 +5,11 @@
 '''
 Scenario for opening and closing IF
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmIfConditionUpdate(EmMergeScenario):
@@ -53,7 +53,7 @@ class EmIfConditionUpdate(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -66,7 +66,7 @@ class EmIfConditionUpdate(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_name(self, json, xml, xml_ns):
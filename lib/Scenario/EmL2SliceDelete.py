@@ -6,12 +6,12 @@
 Individual scenario for deleting L2 slice.
 '''
 import threading
-import json
 from lxml import etree
 import EmSeparateScenario
 from EmCommonDriver import EmCommonDriver
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmL2SliceDelete(EmSeparateScenario.EmScenario):
@@ -526,7 +526,7 @@ class EmL2SliceDelete(EmSeparateScenario.EmScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -568,4 +568,4 @@ class EmL2SliceDelete(EmSeparateScenario.EmScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device__json_message)
 
-        return json.dumps(device__json_message)
+        return EmOrderMessage(device__json_message)
@@ -5,11 +5,11 @@
 '''
 Individual scenario to add L2 slice.
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmL2SliceEvpnControl(EmMergeScenario):
@@ -58,7 +58,7 @@ class EmL2SliceEvpnControl(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -249,7 +249,7 @@ class EmL2SliceEvpnControl(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _creating_json_dummy_vlan(self, xml_elm, ms_json):
@@ -356,4 +356,4 @@ class EmL2SliceEvpnControl(EmMergeScenario):
         slice_elm = etree.Element("slice_name")
         slice_elm.text = slice_name
         element.append(slice_elm)
-        return etree.tostring(element)
+        return EmOrderXml(element)
@@ -5,11 +5,11 @@
 '''
 Individual scenario of L2 slise update.
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmL2SliceUpdate(EmMergeScenario):
@@ -52,7 +52,7 @@ class EmL2SliceUpdate(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -115,7 +115,7 @@ class EmL2SliceUpdate(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @staticmethod
     @decorater_log
@@ -126,4 +126,4 @@ class EmL2SliceUpdate(EmMergeScenario):
         slice_elm = etree.Element("slice_name")
         slice_elm.text = slice_name
         element.append(slice_elm)
-        return etree.tostring(element)
+        return EmOrderXml(element)
@@ -5,11 +5,11 @@
 '''
 Individual scenario for deleting L3 slice.
 '''
-import json
 from lxml import etree
 from EmDeleteScenario import EmDeleteScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmL3SliceDelete(EmDeleteScenario):
@@ -184,7 +184,7 @@ class EmL3SliceDelete(EmDeleteScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -323,7 +323,7 @@ class EmL3SliceDelete(EmDeleteScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @staticmethod
     @decorater_log
@@ -334,4 +334,4 @@ class EmL3SliceDelete(EmDeleteScenario):
         slice_elm = etree.Element("slice_name")
         slice_elm.text = slice_name
         element.append(slice_elm)
-        return etree.tostring(element)
+        return EmOrderXml(element)
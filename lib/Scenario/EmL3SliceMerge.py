@@ -5,11 +5,11 @@
 '''
 Individual scenario to add L3 slice.
 '''
-import json
 from lxml import etree
 from EmMergeScenario import EmMergeScenario
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmL3SliceMerge(EmMergeScenario):
@@ -54,7 +54,7 @@ class EmL3SliceMerge(EmMergeScenario):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -290,7 +290,7 @@ class EmL3SliceMerge(EmMergeScenario):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @staticmethod
     @decorater_log
@@ -301,4 +301,4 @@ class EmL3SliceMerge(EmMergeScenario):
         slice_elm = etree.Element("slice_name")
         slice_elm.text = slice_name
         element.append(slice_elm)
-        return etree.tostring(element)
+        return EmOrderXml(element)
@@ -5,11 +5,11 @@
 '''
 Individual scenario for Leaf expansion.
 '''
-import json
 from lxml import etree
 from EmDeviceMerge import EmDeviceMerge
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmLeafMerge(EmDeviceMerge):
@@ -92,7 +92,7 @@ class EmLeafMerge(EmDeviceMerge):
                 }
             }
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         GlobalModule.EM_LOGGER.debug(
             "device_message = %s", etree.tostring(xml_elm, pretty_print=True))
@@ -133,7 +133,7 @@ class EmLeafMerge(EmDeviceMerge):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_name(self, json, xml, xml_ns):
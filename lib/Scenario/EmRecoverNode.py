@@ -6,10 +6,10 @@
 Individual scenario of recover node
 '''
 import json
-from lxml import etree
 import EmRecover
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmRecoverNode(EmRecover.EmRecover):
@@ -48,7 +48,7 @@ class EmRecoverNode(EmRecover.EmRecover):
 
         device_json_message = json.loads(json_message)
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         self._gen_json_inner_if(
             device_json_message, xml_elm, self._xml_ns, "internal-interface")
@@ -59,7 +59,7 @@ class EmRecoverNode(EmRecover.EmRecover):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_inner_if(self,
@@ -126,7 +126,7 @@ class EmRecoverNode(EmRecover.EmRecover):
         Return value:
             None
         '''
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
         db_update = self._find_xml_node(
             xml_elm, self._xml_ns + "db_update")
 
@@ -6,10 +6,10 @@
 Individual scenario of recover service
 '''
 import json
-from lxml import etree
 import EmRecover
 import GlobalModule
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderMessage, EmOrderXml
 
 
 class EmRecoverService(EmRecover.EmRecover):
@@ -48,7 +48,7 @@ class EmRecoverService(EmRecover.EmRecover):
 
         device_json_message = json.loads(json_message)
 
-        xml_elm = etree.fromstring(device_message)
+        xml_elm = EmOrderXml.to_element(device_message)
 
         self._gen_json_qos(
             device_json_message, xml_elm, self._xml_ns)
@@ -56,7 +56,7 @@ class EmRecoverService(EmRecover.EmRecover):
         GlobalModule.EM_LOGGER.debug(
             "device__json_message = %s", device_json_message)
 
-        return json.dumps(device_json_message)
+        return EmOrderMessage(device_json_message)
 
     @decorater_log
     def _gen_json_qos(self, json, xml, xml_ns):
@@ -10,6 +10,7 @@ import Queue
 import copy
 from lxml import etree
 from EmCommonLog import decorater_log
+from EmOrderMessage import EmOrderXml
 import GlobalModule
 
 
@@ -197,8 +198,8 @@ class EmScenario(threading.Thread):
 
         for event, element in context:
 
-            GlobalModule.EM_LOGGER.debug("EVENT : %s , ELEMENT : %s"
-                                         % (event, element))
+            GlobalModule.EM_LOGGER.debug("EVENT : %s , ELEMENT : %s",
+                                         event, element)
 
             if event == "end" and \
                     element.tag == ns_value + "force":
@@ -225,7 +226,7 @@ class EmScenario(threading.Thread):
         '''
         Device name:Create Netconf message (json letter string).
         '''
-        return etree.tostring(element)
+        return EmOrderXml(element)
 
     @decorater_log
     def _gen_sub_thread(
@@ -360,9 +360,8 @@ class BeluganosDriver(EmSeparateDriver):
                                                    inner_if,
                                                    operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(ifs_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(ifs_node))
 
     @decorater_log
     def _set_internal_link_interface_node(self,
@@ -405,9 +404,8 @@ class BeluganosDriver(EmSeparateDriver):
                                      inner_ifs,
                                      operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (nw_inss_node.tag, etree.tostring(nw_inss_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            nw_inss_node.tag, self.common_util_log.xml_str(nw_inss_node))
 
 
 
@@ -5,6 +5,7 @@
 '''
 Individual section on deriver (base class)
 '''
+import io
 import json
 import os
 import re
@@ -15,9 +16,9 @@ from codecs import BOM_UTF8
 from lxml import etree
 import ipaddress
 import GlobalModule
-import copy
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
+from EmOrderMessage import EmOrderMessage
 from EmNetconfProtocol import EmNetconfProtocol
 from EmDriverCommonUtilityDB import EmDriverCommonUtilityDB
 from EmDriverCommonUtilityLog import EmDriverCommonUtilityLog
@@ -189,6 +190,7 @@ class EmSeparateDriver(object):
         self.list_enable_service = []
         self.get_config_message = {}
         self.get_config_default = None
+        self.comparsion_sw_db_tags = {}
 
         self.driver_public_method = {}
 
@@ -276,8 +278,7 @@ class EmSeparateDriver(object):
             for _, value in sorted(recover_util_cls_dict.items()):
                 target_recover_util_class_ins = self._select_recover_util(
                     value[1])
-                tmp_ec = copy.copy(ec_message)
-                tmp_ec_json = json.loads(tmp_ec)
+                tmp_ec_json = EmOrderMessage.to_data(ec_message)
 
                 if not target_recover_util_class_ins:
                     result = self._update_error
@@ -738,7 +739,10 @@ class EmSeparateDriver(object):
                                                   from_config_name="before",
                                                   to_config=device_config,
                                                   to_config_name="after",
-                                                  driver_info=driver_info)
+                                                  driver_info=driver_info,
+                                                  from_config_key=(
+                                                      device_name,
+                                                      latest_date))
             diff_data = conf_audit.compare_device_configuration()
         except Exception as exc_info:
             self.common_util_log.logging(
@@ -865,9 +869,11 @@ class EmSeparateDriver(object):
         '''
         self.common_util_log.logging(
             device_name, self.log_level_debug,
-            ("send_message message_type:%s ,service_type:%s ,operation:%s ." +
-             "send_message = %s") % (message_type, service_type, operation,
-                                     send_message), __name__)
+            "send_message message_type:%s ,service_type:%s ,operation:%s .",
+            __name__, message_type, service_type, operation)
+        self.common_util_log.logging_payload(
+            device_name, self.log_level_debug,
+            "send_message = %s", send_message, __name__)
         is_result, message = \
             self.net_protocol.send_control_signal(message_type, send_message)
         if isinstance(message, str) and \
@@ -875,8 +881,10 @@ class EmSeparateDriver(object):
             is_result = False
         self.common_util_log.logging(
             device_name, self.log_level_debug,
-            "receive_message is_result:%s ,message:%s" %
-            (is_result, message), __name__)
+            "receive_message is_result:%s", __name__, is_result)
+        self.common_util_log.logging_payload(
+            device_name, self.log_level_debug,
+            "receive_message message:%s", message, __name__)
         return is_result, message
 
     @decorater_log
@@ -1000,9 +1008,8 @@ class EmSeparateDriver(object):
         '''
         tmp = parent
         for tag in tags:
-            if tmp.find(tag) is not None:
-                tmp = tmp.find(tag)
-            else:
+            tmp = tmp.find(tag)
+            if tmp is None:
                 return None
         return tmp
 
@@ -1099,7 +1106,7 @@ class EmSeparateDriver(object):
         '''
 
         is_vld_check = False
-        parse_json = json.loads(device_info)
+        parse_json = EmOrderMessage.to_data(device_info)
         if service_type in self._validation_methods:
             is_vld_check = self._validation_methods[service_type](parse_json)
         if is_vld_check is False:
@@ -1127,7 +1134,8 @@ class EmSeparateDriver(object):
         if db_info is not None:
             parse_db_info = json.loads(db_info)
         if receive_message is not None:
-            parse_netconf = self._parse_receive_info(receive_message)
+            parse_netconf = self._parse_receive_info(
+                receive_message, self.comparsion_sw_db_tags.get(service_type))
         is_check_result = False
         try:
             if parse_db_info is None or parse_netconf is None:
@@ -1175,10 +1183,10 @@ class EmSeparateDriver(object):
         self.common_util_log.logging(
             "comparsion_pair_result",
             self.log_level_debug,
-            "%s : %s = %s" % (
-                (netconf_val.tag if netconf_val is not None else None),
-                (netconf_val.text if netconf_val is not None else None),
-                db_val), __name__)
+            "%s : %s = %s", __name__,
+            (netconf_val.tag if netconf_val is not None else None),
+            (netconf_val.text if netconf_val is not None else None),
+            db_val)
         return is_ok
 
 
@@ -1897,17 +1905,22 @@ class EmSeparateDriver(object):
 
 
     @decorater_log
-    def _parse_receive_info(self, receive_message):
+    def _parse_receive_info(self, receive_message, tags=None):
         '''
         Response message analysis(xml)
             Called out before SW-DB comparison processing
         Parameter:
             receive_message : Response message
+            tags : Tag names of nodes which are kept under configuration
+                   node (All nodes are kept if None.)
         Return value :
             Analysis result : XML object
         '''
         try:
-            xml_obj = etree.fromstring(receive_message)
+            if tags:
+                xml_obj = self._iterparse_receive_info(receive_message, tags)
+            else:
+                xml_obj = etree.fromstring(receive_message)
         except Exception, ex_message:
             xml_obj = None
             self.common_util_log.logging(
@@ -1916,14 +1929,63 @@ class EmSeparateDriver(object):
             self.common_util_log.logging(
                 "receive_device",
                 self.log_level_debug,
-                ("xml_error_message = %s (receive_message = %s)" %
-                 (ex_message, receive_message)),
-                __name__)
+                "xml_error_message = %s (receive_message = %s)",
+                __name__, ex_message, receive_message)
         self.common_util_log.logging(
             "receive_device", self.log_level_debug,
-            "parse_xml_obj = %s " % (xml_obj,), __name__)
+            "parse_xml_obj = %s ", __name__, xml_obj)
         return xml_obj
 
+    @staticmethod
+    @decorater_log
+    def _iterparse_receive_info(receive_message, tags):
+        '''
+        Response message analysis(xml) by iterparse
+            Nodes under configuration node other than the designated ones
+            are discarded while parsing.
+            (Memory for large config is not used by unnecessary nodes.)
+        Parameter:
+            receive_message : Response message
+            tags : Tag names of nodes which are kept under configuration node
+        Return value :
+            Analysis result : XML object
+        '''
+        if isinstance(receive_message, unicode):
+            receive_message = receive_message.encode("utf-8")
+        context = etree.iterparse(io.BytesIO(receive_message),
+                                  events=("start", "end"))
+        root = None
+        depth = 0
+        config_depth = None
+        skip_node = None
+        for event, element in context:
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = element
+                if skip_node is not None:
+                    continue
+                if config_depth is None:
+                    if etree.QName(element).localname == "configuration":
+                        config_depth = depth
+                elif (depth == config_depth + 1 and
+                      etree.QName(element).localname not in tags):
+                    skip_node = element
+                continue
+            depth -= 1
+            if skip_node is None:
+                if config_depth is not None and depth < config_depth:
+                    config_depth = None
+                continue
+            if element is skip_node:
+                element.getparent().remove(element)
+                skip_node = None
+            elif depth == config_depth + 1:
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        return root
+
     @decorater_log
     def _comparsion_sw_db_l2_slice(self, message, db_info):
         '''
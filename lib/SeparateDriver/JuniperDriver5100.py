@@ -8,12 +8,12 @@ Individual section on driver
 '''
 import re
 import ipaddress
-from lxml import etree
 import copy
 import traceback
 import GlobalModule
 from EmSeparateDriver import EmSeparateDriver
 from EmCommonLog import decorater_log
+from EmXmlTemplate import EmXmlTemplate
 
 
 class JuniperDriver5100(EmSeparateDriver):
@@ -29,6 +29,38 @@ class JuniperDriver5100(EmSeparateDriver):
 
     _DEFAULT_INTERNAL_LINK_COST = 100
 
+    _L2_SLICE_VLAN_UNIT_TEMPLATE = EmXmlTemplate(
+        ("unit",
+         ("name", "0"),
+         ("family",
+          ("ethernet-switching",
+           ("vlan",
+            ("members", "$vlan_id")),
+           ("interface-mode", "$port_mode"),
+           ("filter",
+            ("input", "$input"))))))
+
+    _L2_SLICE_VLAN_UNIT_DEL_TEMPLATE = EmXmlTemplate(
+        ("unit",
+         ("name", "0"),
+         ("family",
+          ("ethernet-switching",
+           ("vlan",
+            ("members", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+             "$vlan_id"))))))
+
+    _L2_SLICE_VLAN_VNI_TEMPLATE = EmXmlTemplate(
+        ("vlan",
+         ("name", "$name"),
+         ("vxlan",
+          ("vni", "$vni"),
+          ("ingress-node-replication",)),
+         ("vlan-id", "$vlan_id")))
+
+    _L2_SLICE_VLAN_VNI_DEL_TEMPLATE = EmXmlTemplate(
+        ("vlan", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name")))
+
     @decorater_log
     def __init__(self):
         '''
@@ -63,6 +95,15 @@ class JuniperDriver5100(EmSeparateDriver):
             self.name_l2_slice: tmp_get_mes,
             self.name_l3_slice: tmp_get_mes,
         }
+        self.comparsion_sw_db_tags = {
+            self.name_l2_slice: ("interfaces",
+                                 "vlans",
+                                 "protocols",
+                                 "class-of-service"),
+            self.name_l3_slice: ("interfaces",
+                                 "routing-instances",
+                                 "class-of-service"),
+        }
         self._device_count_margin = 2
         self._device_type_leaf = "leaf"
         self._device_type_spine = "spine"
@@ -150,9 +191,8 @@ class JuniperDriver5100(EmSeparateDriver):
         node_2 = self._set_xml_tag(conf_node, "system")
         self._set_xml_tag(node_2, "host-name", None, None, host_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -169,9 +209,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           self._REPLACE,
                           device_count)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -187,9 +226,8 @@ class JuniperDriver5100(EmSeparateDriver):
         for br_if in breakout_ifs:
             self._set_fpc_breakout(node_1, br_if, operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -214,9 +252,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(
                 node_4, "channel-speed", None, None, br_if["SPEED"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(conf_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(conf_node))
         return conf_node
 
     @decorater_log
@@ -244,9 +281,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           None,
                           "%s/%s" % (lo_addr, lo_prefix))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return if_node
 
     @decorater_log
@@ -279,9 +315,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           None,
                           bundle_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -300,9 +335,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                    attr_val)
         self._set_xml_tag(node_1, "interface_name", None, None, if_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -342,9 +376,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 self._set_xml_tag(node_3, "active")
                 self._set_xml_tag(node_3, "periodic", None, None, "fast")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -378,9 +411,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                            vpn_type=vpn_type,
                                            operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
     @decorater_log
     def _set_interface_inner_link(self,
@@ -403,9 +435,8 @@ class JuniperDriver5100(EmSeparateDriver):
                               None,
                               if_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -432,9 +463,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                            inner_vlan
                                            )
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -460,9 +490,8 @@ class JuniperDriver5100(EmSeparateDriver):
         else:
             self._set_xml_tag(node_1, "disable")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -500,9 +529,8 @@ class JuniperDriver5100(EmSeparateDriver):
                     node_1, "unit", self._ATTR_OPE, self._DELETE)
                 self._set_xml_tag(node_2, "name", None, None, "0")
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -518,9 +546,8 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_interface_unit_inner(
             node_1, if_info.get("IF-ADDR"), if_info.get("IF-PREFIX"), 3, 3)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -554,9 +581,8 @@ class JuniperDriver5100(EmSeparateDriver):
         if inner_vlan != 0:
             self._set_xml_tag(node_2, "vlan-id", text=inner_vlan)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -576,9 +602,8 @@ class JuniperDriver5100(EmSeparateDriver):
         node_2 = self._set_xml_tag(node_1, "forwarding-table")
         self._set_xml_tag(node_2, "export", None, None, "ECMP")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_device_protocols(self, conf_node):
@@ -598,9 +623,8 @@ class JuniperDriver5100(EmSeparateDriver):
         node_4 = self._set_xml_tag(node_3, "interface")
         self._set_xml_tag(node_4, "interface_name", None, None, "all")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_3),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_3))
 
     @decorater_log
     def _set_device_protocols_bgp_common(self,
@@ -629,9 +653,8 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_xml_tag(node_2, "vpn-apply-export")
         self._set_xml_tag(node_2, "peer-as", None, None, as_number)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -652,9 +675,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 node_2 = self._set_xml_tag(node_1, "export")
                 self._set_xml_tag(node_2, "value", None, None, "VPN_export")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(group_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(group_node))
 
     def _set_b_leaf_ospf_data(self, conf_node, dev_reg_info):
         '''
@@ -674,9 +696,8 @@ class JuniperDriver5100(EmSeparateDriver):
             dev_reg_info.get("RANGE-PREFIX"),
             dev_reg_info.get("RANGE-OPERATION"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(protocols_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(protocols_node))
         return area_node
 
     @decorater_log
@@ -700,9 +721,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(node_3, "neighbor-id", None, None, peer_router)
             self._set_xml_tag(node_3, "transit-area", None, None, set_area_id)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -728,9 +748,8 @@ class JuniperDriver5100(EmSeparateDriver):
             tmp_addr = "%s/%s" % (range_addr, range_prefix)
             self._set_xml_tag(node_3, "area_range", None, None, tmp_addr)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -757,9 +776,8 @@ class JuniperDriver5100(EmSeparateDriver):
         if is_loopback:
             self._set_ospf_area_lo_interface(area_node)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(area_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(area_node))
 
     @decorater_log
     def _set_ospf_area_interface(self,
@@ -793,9 +811,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                   "replace",
                                   metric)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -808,9 +825,8 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_xml_tag(node_2, "passive")
         self._set_xml_tag(node_2, "metric", None, None, 10)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -829,18 +845,16 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_xml_tag(node_2, "hello-interval", None, None, "5")
         self._set_xml_tag(node_2, "hold-time", None, None, "15")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_device_protocols_evpn(self, protocols_node):
         node_1 = self._set_xml_tag(protocols_node, "evpn")
         self._set_xml_tag(node_1, "encapsulation", None, None, "vxlan")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_interfaces(self,
@@ -864,9 +878,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 operation=operation,
                 port_mode=if_info.get("IF-PORT-MODE"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -897,9 +910,8 @@ class JuniperDriver5100(EmSeparateDriver):
             else:
                 self._set_qos_policy_inner_link(node_1)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_inner_link_device_dependent(self, if_node):
@@ -1021,9 +1033,8 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_xml_tag(node_2, "vrf-import", None, None, "VPN_import_L2")
         self._set_xml_tag(node_2, "vrf-target", None, None, "target:9999:9999")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
 
@@ -1059,9 +1070,8 @@ class JuniperDriver5100(EmSeparateDriver):
         for tmp_cp in cp_infos.values():
             self._set_l2_slice_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l2_slice_vlan_if(self,
@@ -1078,9 +1088,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "name", None, None, cp_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_1 = self._set_xml_tag(ifs_node, "interface")
         self._set_xml_tag(node_1, "name", None, None, cp_info.get("IF-NAME"))
@@ -1100,9 +1109,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                               evpn["OPERATION"])
             if operation == self._REPLACE:
                 self.common_util_log.logging(
-                    None, self.log_level_debug,
-                    self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                    __name__)
+                    None, self.log_level_debug, self._XML_LOG, __name__,
+                    ifs_node.tag, self.common_util_log.xml_str(node_1))
                 return node_1
 
         if attr_val == self._DELETE:
@@ -1115,9 +1123,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 self._set_l2_slice_vlan_unit(
                     node_1, unit, port_mode=tmp_port, qos_info=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1137,23 +1144,18 @@ class JuniperDriver5100(EmSeparateDriver):
 
         attr, attr_val = self._get_attr_from_operation(vlan.get("OPERATION"))
 
-        node_1 = self._set_xml_tag(if_node, "unit")
-        self._set_xml_tag(node_1, "name", None, None, 0)
-        node_2 = self._set_xml_tag(node_1, "family")
-        node_3 = self._set_xml_tag(node_2, "ethernet-switching")
-        node_4 = self._set_xml_tag(node_3, "vlan")
-        self._set_xml_tag(
-            node_4, "members", attr, attr_val, vlan.get("CE-IF-VLAN-ID"))
-        if attr_val != self._DELETE:
-            self._set_xml_tag(
-                node_3, "interface-mode", None, None, port_mode)
-            node_4 = self._set_xml_tag(node_3, "filter")
-            self._set_xml_tag(
-                node_4, "input", None, None, qos_info)
+        if attr_val == self._DELETE:
+            node_1 = self._L2_SLICE_VLAN_UNIT_DEL_TEMPLATE.fill(
+                if_node, vlan_id=vlan.get("CE-IF-VLAN-ID"))
+        else:
+            node_1 = self._L2_SLICE_VLAN_UNIT_TEMPLATE.fill(
+                if_node,
+                vlan_id=vlan.get("CE-IF-VLAN-ID"),
+                port_mode=port_mode,
+                input=qos_info)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1167,9 +1169,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(node_1, "identifier", None, None, esi)
             self._set_xml_tag(node_1, "all-active")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1190,9 +1191,8 @@ class JuniperDriver5100(EmSeparateDriver):
                               self._REPLACE,
                               val_links)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1208,9 +1208,8 @@ class JuniperDriver5100(EmSeparateDriver):
         else:
             self._set_xml_tag(node_2, "system-id", attr, attr_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1228,9 +1227,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                         vni,
                                         operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1243,15 +1241,14 @@ class JuniperDriver5100(EmSeparateDriver):
         Create vlan(vlan_id/vni sxettings) inside vlans.
         '''
         attr, attr_val = self._get_attr_from_operation(operation)
-        node_1 = self._set_xml_tag(vlans_node, "vlan", attr, attr_val)
-        self._set_xml_tag(node_1, "name", None,  None, "vlan%d" % (vlan_id,))
+        name = "vlan%d" % (vlan_id,)
         if attr_val == self._DELETE:
-            return node_1
-        node_2 = self._set_xml_tag(node_1, "vxlan")
-        self._set_xml_tag(node_2, "vni", None, None, vni)
-        self._set_xml_tag(node_2, "ingress-node-replication")
-        self._set_xml_tag(node_1, "vlan-id", None, None, vlan_id)
-        return node_1
+            return self._L2_SLICE_VLAN_VNI_DEL_TEMPLATE.fill(vlans_node,
+                                                            name=name)
+        return self._L2_SLICE_VLAN_VNI_TEMPLATE.fill(vlans_node,
+                                                     name=name,
+                                                     vni=vni,
+                                                     vlan_id=vlan_id)
 
     @decorater_log
     def _set_l2_slice_protocols_evpn(self,
@@ -1271,9 +1268,8 @@ class JuniperDriver5100(EmSeparateDriver):
                               attr_val,
                               vni)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
 
@@ -1289,9 +1285,8 @@ class JuniperDriver5100(EmSeparateDriver):
             tmp.text = vrf_name
         node_3 = self._xml_setdefault_node(node_2, "routing-options")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_3
 
     @decorater_log
@@ -1311,9 +1306,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                       ip_ver=bgp.get("BGP-IP-VERSION"),
                                       bgp=bgp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_slice_bgp_group(self,
@@ -1333,9 +1327,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(node_3, "unicast")
             self._set_xml_tag(node_1, "type", None, None, "external")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (bgp_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            bgp_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1362,9 +1355,8 @@ class JuniperDriver5100(EmSeparateDriver):
         self._set_xml_tag(node_1, "peer-as", None, None, bgp["BGP-PEER-AS"])
         self._set_xml_tag(node_1, "local-address", None, None, bgp["BGP-LADD"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1385,9 +1377,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                                                 ip_ver)
             self._set_static_route_in_rib(rib_node[ip_ver], route)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_slice_protocol_rib(self,
@@ -1404,9 +1395,8 @@ class JuniperDriver5100(EmSeparateDriver):
             tmp_name = vrf_name + ".inet.0"
         self._set_xml_tag(node_1, "name", None, None, tmp_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (options_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            options_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1432,9 +1422,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 self._set_xml_tag(
                     node_3, "nexthop", None, None, tmp_nh)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (rib_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            rib_node.tag, self.common_util_log.xml_str(node_2))
 
     @decorater_log
     def _set_l3_slice_interfaces(self,
@@ -1447,9 +1436,8 @@ class JuniperDriver5100(EmSeparateDriver):
         for tmp_cp in cp_infos.values():
             self._set_l3_slice_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l3_slice_vlan_if(self,
@@ -1468,9 +1456,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "name", None, None, cp_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_1 = self._set_xml_tag(ifs_node, "interface")
         self._set_xml_tag(node_1, "name", None, None, cp_info.get("IF-NAME"))
@@ -1493,9 +1480,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                              mtu=mtu,
                                              qos=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1518,9 +1504,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           vlan.get("CE-IF-VLAN-ID"))
         if attr_val == self._DELETE:
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_2 = self._set_xml_tag(node_1, "family")
         vrrp = vlan.get("VRRP")
@@ -1557,9 +1542,8 @@ class JuniperDriver5100(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "vlan-id", None, None, vlan.get("CE-IF-VLAN-ID"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1603,9 +1587,8 @@ class JuniperDriver5100(EmSeparateDriver):
         if is_add_cp and mtu is not None and is_vlan:
             self._set_xml_tag(node_1, "mtu", None, None, mtu)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (family_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            family_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -1629,9 +1612,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           vrrp.get("VRRP-GROUP-ID"))
         if attr_val == self._DELETE:
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (address_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                address_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if ip_ver == 4:
             tmp = vrrp.get("VRRP-VIRT-ADDR")
@@ -1661,9 +1643,8 @@ class JuniperDriver5100(EmSeparateDriver):
                     node_3, "interface_name", None, None, track_if)
                 self._set_xml_tag(node_3, "priority-cost", None, None, 10)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (address_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            address_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1681,9 +1662,8 @@ class JuniperDriver5100(EmSeparateDriver):
             node_2.attrib[attr] = self._DELETE
         self._set_xml_tag(node_2, "name", None, None, vrf_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -1737,9 +1717,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           None,
                           vrf_info["VRF-ROUTER-ID"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
 
@@ -3668,9 +3647,8 @@ class JuniperDriver5100(EmSeparateDriver):
         for tmp_cp in qos_infos.values():
             self._set_qos_l2_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_l2_vlan_if(self,
@@ -3688,9 +3666,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                            unit,
                                            qos=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3720,9 +3697,8 @@ class JuniperDriver5100(EmSeparateDriver):
             attr_val, qos.get("REMARK-MENU").get("IPV4"))
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3841,9 +3817,8 @@ class JuniperDriver5100(EmSeparateDriver):
         for tmp_cp in qos_infos.values():
             self._set_qos_l3_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_l3_vlan_if(self,
@@ -3861,9 +3836,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                            unit,
                                            qos=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3902,9 +3876,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 qos_info=qos
             )
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3932,9 +3905,8 @@ class JuniperDriver5100(EmSeparateDriver):
                           attr_val,
                           filter_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (family_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            family_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -4282,9 +4254,8 @@ class JuniperDriver5100(EmSeparateDriver):
                                           if_mes_ec=tmp_if,
                                           operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
         return True
 
@@ -4454,7 +4425,7 @@ class JuniperDriver5100(EmSeparateDriver):
         ns_p = ns_xml(ns_xml.ns_list.xnm)
 
         cp_list = []
-        if_list = []
+        if_list = set()
         vni_list = []
         device_name = None
         for tmp_cp in db_info.get("cp", ()):
@@ -4483,9 +4454,22 @@ class JuniperDriver5100(EmSeparateDriver):
                                         lag.get("links", 0))
                     break
             if cp_info["if_name"] and cp_info["vlan_id"]:
-                if_list.append(cp_info["if_name"])
+                if_list.add(cp_info["if_name"])
                 cp_list.append(cp_info)
 
+        cp_dict = {}
+        vlan_cp_dict = {}
+        if_cp_dict = {}
+        for db_cp in cp_list:
+            cp_dict.setdefault(
+                ("%s" % (db_cp["if_name"],), "%s" % (db_cp["vlan_id"],)),
+                []).append(db_cp)
+            vlan_cp_dict.setdefault(
+                "%s" % (db_cp["vlan_id"],), []).append(db_cp)
+            if_cp_dict.setdefault(
+                "%s" % (db_cp["if_name"],), []).append(db_cp)
+        vni_set = set(vni_list)
+
         interfaces = ns_p.ns_find_node(message,
                                        "configuration",
                                        "interfaces")
@@ -4527,7 +4511,8 @@ class JuniperDriver5100(EmSeparateDriver):
                 for vlan in (ns_p.ns_findall_node(vlans, "members")
                              if vlans is not None else []):
                     match_flg = False
-                    for db_cp in cp_list:
+                    for db_cp in cp_dict.get(
+                            ("%s" % (if_name.text,), "%s" % (vlan.text,)), ()):
                         db_mtu = port_mtu.get(
                             ("%s" % (db_cp.get("port_mode"),)).lower())
                         db_esi = db_cp.get("esi")
@@ -4567,7 +4552,8 @@ class JuniperDriver5100(EmSeparateDriver):
             vlan_id = ns_p.ns_find_node(vlan, "vlan-id")
 
             is_match = False
-            for db_cp in cp_list:
+            for db_cp in (vlan_cp_dict.get("%s" % (vlan_id.text,), ())
+                          if vlan_id is not None else ()):
                 if(self._comparsion_pair(
                         vlan_name, "vlan%s" % (db_cp.get("vlan_id"),)) and
                    self._comparsion_pair(vni, db_cp.get("vni")) and
@@ -4592,7 +4578,7 @@ class JuniperDriver5100(EmSeparateDriver):
                                  "evpn")
         for vni in (ns_p.ns_findall_node(evpn, "extended-vni-list")
                     if is_return and evpn is not None else []):
-            if str(vni.text) not in vni_list:
+            if str(vni.text) not in vni_set:
                 is_return = False
                 self.common_util_log.logging(
                     device_name, self.log_level_debug,
@@ -4619,7 +4605,7 @@ class JuniperDriver5100(EmSeparateDriver):
             unit = ns_p.ns_find_node(interface, "unit")
             if unit is not None:
                 is_ok = False
-                for db_cp in cp_list:
+                for db_cp in if_cp_dict.get("%s" % (if_name.text,), ()):
                     if (self._comparsion_pair(if_name, db_cp["if_name"]) and
                             ("%s" % (db_cp["port_mode"],)).lower() ==
                             self._PORT_MODE_TRUNK):
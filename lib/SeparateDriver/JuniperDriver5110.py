@@ -9,13 +9,13 @@ Individual section on driver
 '''
 import re
 import ipaddress
-from lxml import etree
 import copy
 import traceback
 import GlobalModule
 from EmCommonLog import decorater_log_in_out
 from EmSeparateDriver import EmSeparateDriver
 from EmCommonLog import decorater_log
+from EmXmlTemplate import EmXmlTemplate
 
 
 class JuniperDriver5110(EmSeparateDriver):
@@ -31,6 +31,136 @@ class JuniperDriver5110(EmSeparateDriver):
 
     _DEFAULT_INTERNAL_LINK_COST = 100
 
+    _L2_SLICE_VLAN_UNIT_TEMPLATE = EmXmlTemplate(
+        ("unit",
+         ("name", "0"),
+         ("family",
+          ("ethernet-switching",
+           ("vlan",
+            ("members", "$vlan_id")),
+           ("interface-mode", "$port_mode"),
+           ("storm-control",
+            ("profile-name", "default-shutdown")),
+           ("recovery-timeout",
+            ("time-in-seconds", "100")),
+           ("filter",
+            ("input", "$input"),
+            ("output", "$output"))))),
+        optional=("output",))
+
+    _L2_SLICE_VLAN_UNIT_DEL_TEMPLATE = EmXmlTemplate(
+        ("unit",
+         ("name", "0"),
+         ("family",
+          ("ethernet-switching",
+           ("vlan",
+            ("members", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+             "$vlan_id"))))))
+
+    _L2_SLICE_VLAN_VNI_TEMPLATE = EmXmlTemplate(
+        ("vlan",
+         ("name", "$name"),
+         ("no-arp-suppression",),
+         ("vxlan",
+          ("vni", "$vni"),
+          ("ingress-node-replication",)),
+         ("vlan-id", "$vlan_id"),
+         ("l3-interface", "$l3_interface")),
+        optional=("l3_interface",))
+
+    _L2_SLICE_VLAN_VNI_DEL_TEMPLATE = EmXmlTemplate(
+        ("vlan", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name")))
+
+    _VLAN_TRAFFIC_TERM_TRUNK_NAMES = (
+        ("name_1000", "1000_vlan{0}-multicast_be"),
+        ("name_1001", "1001_vlan{0}-unicast_be"),
+        ("name_1002", "1002_vlan{0}-unicast_af1"),
+        ("name_1003", "1003_vlan{0}-unicast_af2"),
+        ("name_1004", "1004_vlan{0}-unicast_af3"),
+        ("name_1005", "1005_vlan{0}-other"),
+    )
+
+    _VLAN_TRAFFIC_TERM_TRUNK_TEMPLATE = EmXmlTemplate(
+        ("term",
+         ("name", "$name_1000"),
+         ("from",
+          ("destination-mac-address",
+           ("mac-address", "ff:ff:ff:ff:ff:ff/48")),
+          ("destination-mac-address",
+           ("mac-address", "01:00:5e:00:00:00/24")),
+          ("destination-mac-address",
+           ("mac-address", "33:33:00:00:00:00/16")),
+          ("user-vlan-id", "$vlan_id")),
+         ("then",
+          ("forwarding-class", "multicast_be"),
+          ("loss-priority", "low"),
+          ("count", "$count"))),
+        ("term",
+         ("name", "$name_1001"),
+         ("from",
+          ("user-vlan-id", "$vlan_id"),
+          ("user-vlan-1p-priority", "0")),
+         ("then",
+          ("forwarding-class", "unicast_be"),
+          ("loss-priority", "low"),
+          ("count", "$count"),
+          ("policer", "$policer"))),
+        ("term",
+         ("name", "$name_1002"),
+         ("from",
+          ("user-vlan-id", "$vlan_id"),
+          ("user-vlan-1p-priority", "1")),
+         ("then",
+          ("forwarding-class", "unicast_af1"),
+          ("loss-priority", "low"),
+          ("count", "$count"))),
+        ("term",
+         ("name", "$name_1003"),
+         ("from",
+          ("user-vlan-id", "$vlan_id"),
+          ("user-vlan-1p-priority", "2")),
+         ("then",
+          ("forwarding-class", "unicast_af2"),
+          ("loss-priority", "low"),
+          ("count", "$count"))),
+        ("term",
+         ("name", "$name_1004"),
+         ("from",
+          ("user-vlan-id", "$vlan_id"),
+          ("user-vlan-1p-priority", "3")),
+         ("then",
+          ("forwarding-class", "unicast_af3"),
+          ("loss-priority", "low"),
+          ("count", "$count"))),
+        ("term",
+         ("name", "$name_1005"),
+         ("from",
+          ("user-vlan-id", "$vlan_id"),
+          ("user-vlan-1p-priority", "4"),
+          ("user-vlan-1p-priority", "5"),
+          ("user-vlan-1p-priority", "6"),
+          ("user-vlan-1p-priority", "7")),
+         ("then",
+          ("forwarding-class", "unicast_be"),
+          ("loss-priority", "low"),
+          ("count", "$count"))),
+        optional=("policer",))
+
+    _VLAN_TRAFFIC_TERM_TRUNK_DEL_TEMPLATE = EmXmlTemplate(
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1000")),
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1001")),
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1002")),
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1003")),
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1004")),
+        ("term", {_ATTR_OPE: GlobalModule.ORDER_DELETE},
+         ("name", "$name_1005")))
+
     @decorater_log
     def __init__(self):
         '''
@@ -153,9 +283,8 @@ class JuniperDriver5110(EmSeparateDriver):
         node_2 = self._set_xml_tag(conf_node, "system")
         self._set_xml_tag(node_2, "host-name", None, None, host_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -172,9 +301,8 @@ class JuniperDriver5110(EmSeparateDriver):
                           self._REPLACE,
                           device_count)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -223,9 +351,8 @@ class JuniperDriver5110(EmSeparateDriver):
             lo_addr = "{0}/{1}" .format(lo_addr, lo_prefix)
             self._set_xml_tag(node_5, "source", text=lo_addr)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return if_node
 
     @decorater_log
@@ -242,9 +369,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                       filter_name=filter_name,
                                       operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (filter_node.tag, etree.tostring(filter_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            filter_node.tag, self.common_util_log.xml_str(filter_node))
         return filter_node
 
     @decorater_log
@@ -367,9 +493,8 @@ class JuniperDriver5110(EmSeparateDriver):
                               None,
                               bundle_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -388,9 +513,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                    attr_val)
         self._set_xml_tag(node_1, "interface_name", None, None, if_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -430,9 +554,8 @@ class JuniperDriver5110(EmSeparateDriver):
                 self._set_xml_tag(node_3, "active")
                 self._set_xml_tag(node_3, "periodic", None, None, "fast")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -466,9 +589,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                            vpn_type=vpn_type,
                                            operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
     @decorater_log
     def _set_interface_inner_link(self,
@@ -492,9 +614,8 @@ class JuniperDriver5110(EmSeparateDriver):
                               if_info.get("IF-NAME"))
 
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -521,9 +642,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                            inner_vlan
                                            )
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -549,9 +669,8 @@ class JuniperDriver5110(EmSeparateDriver):
         else:
             self._set_xml_tag(node_1, "disable")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -582,9 +701,8 @@ class JuniperDriver5110(EmSeparateDriver):
         if inner_vlan != 0:
             self._set_xml_tag(node_2, "vlan-id", text=inner_vlan)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -604,9 +722,8 @@ class JuniperDriver5110(EmSeparateDriver):
         node_2 = self._set_xml_tag(node_1, "forwarding-table")
         self._set_xml_tag(node_2, "export", None, None, "ECMP")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_device_protocols(self, conf_node):
@@ -637,9 +754,8 @@ class JuniperDriver5110(EmSeparateDriver):
         self._set_xml_tag(node_2, "vpn-apply-export")
         self._set_xml_tag(node_2, "peer-as", None, None, as_number)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -655,9 +771,8 @@ class JuniperDriver5110(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "address", None, None, l3v_lbb["RR-ADDR"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(group_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(group_node))
 
     def _set_b_leaf_ospf_data(self, conf_node, dev_reg_info):
         '''
@@ -671,9 +786,8 @@ class JuniperDriver5110(EmSeparateDriver):
             dev_reg_info.get("RANGE-PREFIX"),
             dev_reg_info.get("RANGE-OPERATION"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(protocols_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(protocols_node))
         return area_node
 
     @decorater_log
@@ -695,9 +809,8 @@ class JuniperDriver5110(EmSeparateDriver):
         node_2 = self._set_xml_tag(node_1, "area", None, None)
         self._set_xml_tag(node_2, "area_id", None, None, set_area_id)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -724,9 +837,8 @@ class JuniperDriver5110(EmSeparateDriver):
         if is_loopback:
             self._set_ospf_area_lo_interface(area_node)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(area_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(area_node))
 
     @decorater_log
     def _set_ospf_area_interface(self,
@@ -760,9 +872,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                   "replace",
                                   metric)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -775,9 +886,8 @@ class JuniperDriver5110(EmSeparateDriver):
         self._set_xml_tag(node_2, "passive")
         self._set_xml_tag(node_2, "metric", None, None, 10)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -787,9 +897,8 @@ class JuniperDriver5110(EmSeparateDriver):
         self._set_xml_tag(node_1, "default-gateway", None, None,
                           "no-gateway-community")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_interfaces(self,
@@ -813,9 +922,8 @@ class JuniperDriver5110(EmSeparateDriver):
                     operation=operation,
                     port_mode=if_info.get("IF-PORT-MODE"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -844,9 +952,8 @@ class JuniperDriver5110(EmSeparateDriver):
             else:
                 self._set_qos_policy_inner_link(node_1)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_inner_link_device_dependent(self, if_node):
@@ -945,9 +1052,8 @@ class JuniperDriver5110(EmSeparateDriver):
         self._set_xml_tag(node_2, "vrf-import", None, None, "VPN_import_L2")
         self._set_xml_tag(node_2, "vrf-target", None, None, "target:9999:9999")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
 
@@ -1012,9 +1118,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                          vrf_id,
                                          operation=self._DELETE)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l2_slice_interfaces_irb(self,
@@ -1059,9 +1164,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                                         operation=operation)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l2_slice_interfaces_irb_vlan_del(self,
@@ -1095,9 +1199,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                 virtual_gateway_address_list=virtual_gateway_address_list)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l2_slice_interfaces_irb_del(self,
@@ -1125,9 +1228,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                                 operation=operation)
 
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l2_slice_vlan_if(self,
@@ -1144,9 +1246,8 @@ class JuniperDriver5110(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "name", None, None, cp_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_1 = self._set_xml_tag(ifs_node, "interface")
         self._set_xml_tag(node_1, "name", None, None, cp_info.get("IF-NAME"))
@@ -1169,9 +1270,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                               evpn["OPERATION"])
             if operation == self._REPLACE:
                 self.common_util_log.logging(
-                    None, self.log_level_debug,
-                    self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                    __name__)
+                    None, self.log_level_debug, self._XML_LOG, __name__,
+                    ifs_node.tag, self.common_util_log.xml_str(node_1))
                 return node_1
 
         if attr_val == self._DELETE:
@@ -1188,9 +1288,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                              qos_info=tmp_qos,
                                              if_name=tmp_if_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1205,38 +1304,26 @@ class JuniperDriver5110(EmSeparateDriver):
 
         attr, attr_val = self._get_attr_from_operation(vlan.get("OPERATION"))
 
-        node_1 = self._set_xml_tag(if_node, "unit")
-        self._set_xml_tag(node_1, "name", None, None, 0)
-        node_2 = self._set_xml_tag(node_1, "family")
-        node_3 = self._set_xml_tag(node_2, "ethernet-switching")
-        node_4 = self._set_xml_tag(node_3, "vlan")
-        self._set_xml_tag(
-            node_4, "members", attr, attr_val, vlan.get("CE-IF-VLAN-ID"))
-        if attr_val != self._DELETE:
-            self._set_xml_tag(
-                node_3, "interface-mode", None, None, port_mode)
-
-            node_5 = self._set_xml_tag(node_3, "storm-control")
-            self._set_xml_tag(
-                node_5, "profile-name", None, None, "default-shutdown")
-            node_6 = self._set_xml_tag(node_3, "recovery-timeout")
-            self._set_xml_tag(
-                node_6, "time-in-seconds", None, None, 100)
-
-            node_4 = self._set_xml_tag(node_3, "filter")
+        if attr_val == self._DELETE:
+            node_1 = self._L2_SLICE_VLAN_UNIT_DEL_TEMPLATE.fill(
+                if_node, vlan_id=vlan.get("CE-IF-VLAN-ID"))
+        else:
             if_name = param.get("if_name")
             new_if_name = self._change_change_underbar_name(if_name)
-            self._set_xml_tag(node_4, "input", None, None,
-                              "for_" + new_if_name)
+            output = None
             if (port_mode == self._PORT_MODE_TRUNK and
                     qos_info.get("OUTFLOW-SHAPING-RATE") is not None):
-                self._set_xml_tag(node_4, "output", None, None,
-                                  "for_" + new_if_name + "_egress")
+                output = "for_" + new_if_name + "_egress"
+            node_1 = self._L2_SLICE_VLAN_UNIT_TEMPLATE.fill(
+                if_node,
+                vlan_id=vlan.get("CE-IF-VLAN-ID"),
+                port_mode=port_mode,
+                input="for_" + new_if_name,
+                output=output)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1275,9 +1362,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                   irb_addr.get("IRB-VIRT-GW-ADDR"))
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1317,9 +1403,8 @@ class JuniperDriver5110(EmSeparateDriver):
                           None)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1338,9 +1423,8 @@ class JuniperDriver5110(EmSeparateDriver):
         self._set_xml_tag(node_1, "name", None, None, vlan_id)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1354,9 +1438,8 @@ class JuniperDriver5110(EmSeparateDriver):
             self._set_xml_tag(node_1, "identifier", None, None, esi)
             self._set_xml_tag(node_1, "all-active")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1377,9 +1460,8 @@ class JuniperDriver5110(EmSeparateDriver):
                               self._REPLACE,
                               val_links)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1398,9 +1480,8 @@ class JuniperDriver5110(EmSeparateDriver):
             self._set_xml_tag(node_2, "system-id", attr, attr_val)
             self._set_xml_tag(node_2, "admin-key", attr, attr_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1427,9 +1508,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                         is_irb,
                                         operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1448,9 +1528,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                         None,
                                         operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1464,19 +1543,16 @@ class JuniperDriver5110(EmSeparateDriver):
         Create vlan(vlan_id/vni setting) inside of vlans
         '''
         attr, attr_val = self._get_attr_from_operation(operation)
-        node_1 = self._set_xml_tag(vlans_node, "vlan", attr, attr_val)
-        self._set_xml_tag(node_1, "name", None,  None, "vlan%d" % (vlan_id,))
+        name = "vlan%d" % (vlan_id,)
         if attr_val == self._DELETE:
-            return node_1
-        self._set_xml_tag(node_1, "no-arp-suppression", None, None, None)
-        node_2 = self._set_xml_tag(node_1, "vxlan")
-        self._set_xml_tag(node_2, "vni", None, None, vni)
-        self._set_xml_tag(node_2, "ingress-node-replication")
-        self._set_xml_tag(node_1, "vlan-id", None, None, vlan_id)
-        if is_irb:
-            l3_if_str = "irb.{0}".format(vlan_id)
-            self._set_xml_tag(node_1, "l3-interface", None, None, l3_if_str)
-        return node_1
+            return self._L2_SLICE_VLAN_VNI_DEL_TEMPLATE.fill(vlans_node,
+                                                            name=name)
+        l3_if_str = "irb.{0}".format(vlan_id) if is_irb else None
+        return self._L2_SLICE_VLAN_VNI_TEMPLATE.fill(vlans_node,
+                                                     name=name,
+                                                     vni=vni,
+                                                     vlan_id=vlan_id,
+                                                     l3_interface=l3_if_str)
 
     @decorater_log
     def _set_l2_slice_protocols_evpn(self,
@@ -1496,9 +1572,8 @@ class JuniperDriver5110(EmSeparateDriver):
                               attr_val,
                               vni)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1516,9 +1591,8 @@ class JuniperDriver5110(EmSeparateDriver):
             node_2.attrib[attr] = self._DELETE
         self._set_xml_tag(node_2, "name", None, None, vrf_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -1666,9 +1740,8 @@ class JuniperDriver5110(EmSeparateDriver):
                     operation=operation)
 
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (conf_node.tag, etree.tostring(if_node)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                conf_node.tag, self.common_util_log.xml_str(if_node))
 
     @decorater_log
     def _set_vlan_traffic_firewall_if_filter(self,
@@ -1786,90 +1859,40 @@ class JuniperDriver5110(EmSeparateDriver):
         Set term to set firewall for VLAN traffic acquisition(trunk port)
         '''
 
-        attr, attr_val = self._get_attr_from_operation(operation)
-        term_name = "1000_vlan{0}-multicast_be".format(vlan_id)
-        node_1 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            node_2 = self._set_vlan_traffic_firewall_term_from(node_1)
-            self._set_xml_tag(node_2, "user-vlan-id", None, None, vlan_id)
-            new_if_name = self._change_change_underbar_name(if_name)
-            tmp_count = "count-vlan{0}-{1}".format(vlan_id, new_if_name)
-            self._set_vlan_traffic_firewall_term_then(
-                node_1, forwarding_class="multicast_be",
-                loss_priority="low", count=tmp_count)
-
-        term_name = "1001_vlan{0}-unicast_be".format(vlan_id)
-        node_3 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            self._set_vlan_traffic_firewall_term_from_vlanid(
-                node_3, user_vlan_id=vlan_id, user_vlan_priority_value=1)
-
-            qos_inflow = cp_info.get("QOS", {}).get("INFLOW-SHAPING-RATE")
-            speed = cp_info.get("IF-SPEED")
-            if_speed = None
-            if cp_info.get("IF-TYPE") == self._if_type_lag:
-                for lag_if in device_info.get("lag", {}):
-                    if if_name == lag_if.get("if_name"):
-                        if_speed = \
-                            int(lag_if.get("link_speed").strip("g")) * \
-                            int(lag_if.get("links"))
-                        break
-            else:
-                if_speed = int(speed.strip("g"))
-
-            flow_val = None
-            if qos_inflow:
-                flow_val = int(round(float(qos_inflow) *
-                                     float(if_speed) * 10.0))
-            policer = "{0}m-limit".format(flow_val) if flow_val else None
-            self._set_vlan_traffic_firewall_term_then(
-                node_3, forwarding_class="unicast_be", loss_priority="low",
-                count=tmp_count, policer=policer)
-
-        term_name = "1002_vlan{0}-unicast_af1".format(vlan_id)
-        node_4 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            self._set_vlan_traffic_firewall_term_from_vlanid(
-                node_4, user_vlan_id=vlan_id, user_vlan_priority_value=2)
-            self._set_vlan_traffic_firewall_term_then(
-                node_4, forwarding_class="unicast_af1", loss_priority="low",
-                count=tmp_count)
-
-        term_name = "1003_vlan{0}-unicast_af2".format(vlan_id)
-        node_5 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            self._set_vlan_traffic_firewall_term_from_vlanid(
-                node_5, user_vlan_id=vlan_id, user_vlan_priority_value=3)
-            self._set_vlan_traffic_firewall_term_then(
-                node_5, forwarding_class="unicast_af2", loss_priority="low",
-                count=tmp_count)
+        term_names = dict(
+            (slot_name, term_name.format(vlan_id))
+            for slot_name, term_name in self._VLAN_TRAFFIC_TERM_TRUNK_NAMES)
+        if operation == self._DELETE:
+            self._VLAN_TRAFFIC_TERM_TRUNK_DEL_TEMPLATE.fill(conf_node,
+                                                            **term_names)
+            return
 
-        term_name = "1004_vlan{0}-unicast_af3".format(vlan_id)
-        node_6 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            self._set_vlan_traffic_firewall_term_from_vlanid(
-                node_6, user_vlan_id=vlan_id, user_vlan_priority_value=4)
-            self._set_vlan_traffic_firewall_term_then(
-                node_6, forwarding_class="unicast_af3", loss_priority="low",
-                count=tmp_count)
+        new_if_name = self._change_change_underbar_name(if_name)
+        tmp_count = "count-vlan{0}-{1}".format(vlan_id, new_if_name)
+
+        qos_inflow = cp_info.get("QOS", {}).get("INFLOW-SHAPING-RATE")
+        speed = cp_info.get("IF-SPEED")
+        if_speed = None
+        if cp_info.get("IF-TYPE") == self._if_type_lag:
+            for lag_if in device_info.get("lag", {}):
+                if if_name == lag_if.get("if_name"):
+                    if_speed = \
+                        int(lag_if.get("link_speed").strip("g")) * \
+                        int(lag_if.get("links"))
+                    break
+        else:
+            if_speed = int(speed.strip("g"))
 
-        term_name = "1005_vlan{0}-other".format(vlan_id)
-        node_7 = self._set_vlan_traffic_firewall_term_name(
-            conf_node, term_name, attr, attr_val)
-        if operation != self._DELETE:
-            node_8 = self._set_vlan_traffic_firewall_term_from_vlanid(
-                node_7, user_vlan_id=vlan_id, user_vlan_priority_value=5)
-            self._set_xml_tag(node_8, "user-vlan-1p-priority", None, None, 5)
-            self._set_xml_tag(node_8, "user-vlan-1p-priority", None, None, 6)
-            self._set_xml_tag(node_8, "user-vlan-1p-priority", None, None, 7)
-            self._set_vlan_traffic_firewall_term_then(
-                node_7, forwarding_class="unicast_be", loss_priority="low",
-                count=tmp_count)
+        flow_val = None
+        if qos_inflow:
+            flow_val = int(round(float(qos_inflow) *
+                                 float(if_speed) * 10.0))
+        policer = "{0}m-limit".format(flow_val) if flow_val else None
+        self._VLAN_TRAFFIC_TERM_TRUNK_TEMPLATE.fill(conf_node,
+                                                    vlan_id=vlan_id,
+                                                    count=tmp_count,
+                                                    policer=policer,
+                                                    **term_names)
 
     @decorater_log
     def _set_vlan_traffic_firewall_term_name(self,
@@ -4057,9 +4080,8 @@ class JuniperDriver5110(EmSeparateDriver):
                               filter_name)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(conf_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(conf_node))
         return ifs_node
 
     @decorater_log
@@ -4092,9 +4114,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                              tmp_ope)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(conf_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(conf_node))
 
     @decorater_log
     def _set_qos_l2_vlan_if_rep(self,
@@ -4165,9 +4186,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                       attr, attr_val, policer)
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(ifs_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(ifs_node))
         return ifs_node
 
     @decorater_log
@@ -4479,9 +4499,8 @@ class JuniperDriver5110(EmSeparateDriver):
                                           if_mes_ec=tmp_if,
                                           operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
         return True
 
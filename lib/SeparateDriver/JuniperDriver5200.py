@@ -7,7 +7,6 @@ Individual section on driver (JuniperDriver's (QFX5200-32C) driver)
 '''
 import re
 import ipaddress
-from lxml import etree
 import copy
 import traceback
 import GlobalModule
@@ -61,6 +60,11 @@ class JuniperDriver5200(EmSeparateDriver):
             self.name_l2_slice: tmp_get_mes,
             self.name_l3_slice: tmp_get_mes,
         }
+        self.comparsion_sw_db_tags = {
+            self.name_l3_slice: ("interfaces",
+                                 "routing-instances",
+                                 "class-of-service"),
+        }
         self._device_type_leaf = "leaf"
         self._device_type_spine = "spine"
 
@@ -114,9 +118,8 @@ class JuniperDriver5200(EmSeparateDriver):
         node_2 = self._set_xml_tag(conf_node, "system")
         self._set_xml_tag(node_2, "host-name", None, None, host_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -133,9 +136,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           self._REPLACE,
                           device_count)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -151,9 +153,8 @@ class JuniperDriver5200(EmSeparateDriver):
         for br_if in breakout_ifs:
             self._set_fpc_breakout(node_1, br_if, operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -178,9 +179,8 @@ class JuniperDriver5200(EmSeparateDriver):
             self._set_xml_tag(
                 node_4, "channel-speed", None, None, br_if["SPEED"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(conf_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(conf_node))
         return conf_node
 
     @decorater_log
@@ -208,9 +208,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           None,
                           "%s/%s" % (lo_addr, lo_prefix))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return if_node
 
     @decorater_log
@@ -243,9 +242,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           None,
                           bundle_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -264,9 +262,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                    attr_val)
         self._set_xml_tag(node_1, "interface_name", None, None, if_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -306,9 +303,8 @@ class JuniperDriver5200(EmSeparateDriver):
                 self._set_xml_tag(node_3, "active")
                 self._set_xml_tag(node_3, "periodic", None, None, "fast")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -342,9 +338,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                            vpn_type=vpn_type,
                                            operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
     @decorater_log
     def _set_interface_inner_link(self,
@@ -367,9 +362,8 @@ class JuniperDriver5200(EmSeparateDriver):
                               None,
                               if_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -396,9 +390,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                            inner_vlan
                                            )
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -420,9 +413,8 @@ class JuniperDriver5200(EmSeparateDriver):
         else:
             self._set_xml_tag(node_1, "disable")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -460,9 +452,8 @@ class JuniperDriver5200(EmSeparateDriver):
                     node_1, "unit", self._ATTR_OPE, self._DELETE)
                 self._set_xml_tag(node_2, "name", None, None, "0")
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -478,9 +469,8 @@ class JuniperDriver5200(EmSeparateDriver):
         self._set_interface_unit_inner(
             node_1, if_info.get("IF-ADDR"), if_info.get("IF-PREFIX"), 3, 3)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -514,9 +504,8 @@ class JuniperDriver5200(EmSeparateDriver):
         if inner_vlan != 0:
             self._set_xml_tag(node_2, "vlan-id", text=inner_vlan)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -536,9 +525,8 @@ class JuniperDriver5200(EmSeparateDriver):
         node_2 = self._set_xml_tag(node_1, "forwarding-table")
         self._set_xml_tag(node_2, "export", None, None, "ECMP")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_device_protocols(self, conf_node):
@@ -558,9 +546,8 @@ class JuniperDriver5200(EmSeparateDriver):
         node_4 = self._set_xml_tag(node_3, "interface")
         self._set_xml_tag(node_4, "interface_name", None, None, "all")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_3),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_3))
 
     @decorater_log
     def _set_device_protocols_bgp_common(self,
@@ -589,9 +576,8 @@ class JuniperDriver5200(EmSeparateDriver):
         self._set_xml_tag(node_2, "vpn-apply-export")
         self._set_xml_tag(node_2, "peer-as", None, None, as_number)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -612,9 +598,8 @@ class JuniperDriver5200(EmSeparateDriver):
                 node_2 = self._set_xml_tag(node_1, "export")
                 self._set_xml_tag(node_2, "value", None, None, "VPN_export")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(group_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(group_node))
 
     def _set_b_leaf_ospf_data(self, conf_node, dev_reg_info):
         '''
@@ -634,9 +619,8 @@ class JuniperDriver5200(EmSeparateDriver):
             dev_reg_info.get("RANGE-PREFIX"),
             dev_reg_info.get("RANGE-OPERATION"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(protocols_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(protocols_node))
         return area_node
 
     @decorater_log
@@ -660,9 +644,8 @@ class JuniperDriver5200(EmSeparateDriver):
             self._set_xml_tag(node_3, "neighbor-id", None, None, peer_router)
             self._set_xml_tag(node_3, "transit-area", None, None, set_area_id)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -688,9 +671,8 @@ class JuniperDriver5200(EmSeparateDriver):
             tmp_addr = "%s/%s" % (range_addr, range_prefix)
             self._set_xml_tag(node_3, "area_range", None, None, tmp_addr)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -717,9 +699,8 @@ class JuniperDriver5200(EmSeparateDriver):
         if is_loopback:
             self._set_ospf_area_lo_interface(area_node)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(area_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(area_node))
 
     @decorater_log
     def _set_ospf_area_interface(self,
@@ -753,9 +734,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                   "replace",
                                   metric)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -768,9 +748,8 @@ class JuniperDriver5200(EmSeparateDriver):
         self._set_xml_tag(node_2, "passive")
         self._set_xml_tag(node_2, "metric", None, None, 10)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -789,9 +768,8 @@ class JuniperDriver5200(EmSeparateDriver):
         self._set_xml_tag(node_2, "hello-interval", None, None, "5")
         self._set_xml_tag(node_2, "hold-time", None, None, "15")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_interfaces(self,
@@ -815,9 +793,8 @@ class JuniperDriver5200(EmSeparateDriver):
                 operation=operation,
                 port_mode=if_info.get("IF-PORT-MODE"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -845,9 +822,8 @@ class JuniperDriver5200(EmSeparateDriver):
             else:
                 self._set_qos_policy_inner_link(node_1)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_policy_inner_link_device_dependent(self, if_node):
@@ -953,9 +929,8 @@ class JuniperDriver5200(EmSeparateDriver):
             tmp.text = vrf_name
         node_3 = self._xml_setdefault_node(node_2, "routing-options")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_3
 
     @decorater_log
@@ -975,9 +950,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                       ip_ver=bgp.get("BGP-IP-VERSION"),
                                       bgp=bgp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_slice_bgp_group(self,
@@ -997,9 +971,8 @@ class JuniperDriver5200(EmSeparateDriver):
             self._set_xml_tag(node_3, "unicast")
             self._set_xml_tag(node_1, "type", None, None, "external")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (bgp_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            bgp_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1026,9 +999,8 @@ class JuniperDriver5200(EmSeparateDriver):
         self._set_xml_tag(node_1, "peer-as", None, None, bgp["BGP-PEER-AS"])
         self._set_xml_tag(node_1, "local-address", None, None, bgp["BGP-LADD"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1049,9 +1021,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                                                 ip_ver)
             self._set_static_route_in_rib(rib_node[ip_ver], route)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_slice_protocol_rib(self,
@@ -1068,9 +1039,8 @@ class JuniperDriver5200(EmSeparateDriver):
             tmp_name = vrf_name + ".inet.0"
         self._set_xml_tag(node_1, "name", None, None, tmp_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (options_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            options_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1096,9 +1066,8 @@ class JuniperDriver5200(EmSeparateDriver):
                 self._set_xml_tag(
                     node_3, "nexthop", None, None, tmp_nh)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (rib_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            rib_node.tag, self.common_util_log.xml_str(node_2))
 
     @decorater_log
     def _set_l3_slice_interfaces(self,
@@ -1111,9 +1080,8 @@ class JuniperDriver5200(EmSeparateDriver):
         for tmp_cp in cp_infos.values():
             self._set_l3_slice_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l3_slice_vlan_if(self,
@@ -1132,9 +1100,8 @@ class JuniperDriver5200(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "name", None, None, cp_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_1 = self._set_xml_tag(ifs_node, "interface")
         self._set_xml_tag(node_1, "name", None, None, cp_info.get("IF-NAME"))
@@ -1157,9 +1124,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                              mtu=mtu,
                                              qos=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1182,9 +1148,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           vlan.get("CE-IF-VLAN-ID"))
         if attr_val == self._DELETE:
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_2 = self._set_xml_tag(node_1, "family")
         vrrp = vlan.get("VRRP")
@@ -1221,9 +1186,8 @@ class JuniperDriver5200(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "vlan-id", None, None, vlan.get("CE-IF-VLAN-ID"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1266,9 +1230,8 @@ class JuniperDriver5200(EmSeparateDriver):
         if is_add_cp and mtu is not None and is_vlan:
             self._set_xml_tag(node_1, "mtu", None, None, mtu)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (family_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            family_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -1292,9 +1255,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           vrrp.get("VRRP-GROUP-ID"))
         if attr_val == self._DELETE:
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (address_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                address_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if ip_ver == 4:
             tmp = vrrp.get("VRRP-VIRT-ADDR")
@@ -1324,9 +1286,8 @@ class JuniperDriver5200(EmSeparateDriver):
                     node_3, "interface_name", None, None, track_if)
                 self._set_xml_tag(node_3, "priority-cost", None, None, 10)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (address_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            address_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -1344,9 +1305,8 @@ class JuniperDriver5200(EmSeparateDriver):
             node_2.attrib[attr] = self._DELETE
         self._set_xml_tag(node_2, "name", None, None, vrf_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -1400,9 +1360,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           None,
                           vrf_info["VRF-ROUTER-ID"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
 
@@ -2994,9 +2953,8 @@ class JuniperDriver5200(EmSeparateDriver):
         for tmp_cp in qos_infos.values():
             self._set_qos_l3_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_qos_l3_vlan_if(self,
@@ -3014,9 +2972,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                            unit,
                                            qos=tmp_qos)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3047,9 +3004,8 @@ class JuniperDriver5200(EmSeparateDriver):
                 qos_info=qos
             )
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -3077,9 +3033,8 @@ class JuniperDriver5200(EmSeparateDriver):
                           attr_val,
                           filter_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (family_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            family_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -3415,9 +3370,8 @@ class JuniperDriver5200(EmSeparateDriver):
                                           if_mes_ec=tmp_if,
                                           operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
         return True
 
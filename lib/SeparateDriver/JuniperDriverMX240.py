@@ -7,7 +7,6 @@ Individual section on driver (JuniperDriver's driver (MX240))
 '''
 import re
 import ipaddress
-from lxml import etree
 import copy
 import traceback
 import GlobalModule
@@ -216,6 +215,10 @@ class JuniperDriverMX240(EmSeparateDriver):
             self.name_l2_slice: tmp_get_mes,
             self.name_l3_slice: tmp_get_mes,
         }
+        self.comparsion_sw_db_tags = {
+            self.name_l3_slice: ("interfaces",
+                                 "routing-instances"),
+        }
 
     @decorater_log
     def _send_control_signal(self,
@@ -294,9 +297,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                           None,
                           bundle_val)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -315,9 +317,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                                    attr_val)
         self._set_xml_tag(node_1, "interface_name", None, None, if_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -357,9 +358,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                 self._set_xml_tag(node_3, "active")
                 self._set_xml_tag(node_3, "periodic", None, None, "fast")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -382,9 +382,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         else:
             self._set_xml_tag(node_1, "disable")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -422,9 +421,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                     node_1, "unit", self._ATTR_OPE, self._DELETE)
                 self._set_xml_tag(node_2, "name", None, None, "0")
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         if if_type == self._if_type_phy:
             node_1 = self._set_interface_physical(if_node,
@@ -440,9 +438,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         self._set_interface_unit_inner(
             node_1, if_info.get("IF-ADDR"), if_info.get("IF-PREFIX"), 3, 3)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -469,9 +466,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         if vpn_type != 2 and opposite_vpn_type != 2:
             self._set_xml_tag(node_3, "mpls")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_2),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -496,9 +492,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         node_2 = self._set_xml_tag(node_1, "area", attr, attr_val)
         self._set_xml_tag(node_2, "area_id", None, None, "0.0.0.0")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (protocols_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            protocols_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -521,9 +516,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                                           metric,
                                           operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(area_node)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(area_node))
 
     @decorater_log
     def _set_ospf_area_interface(self,
@@ -546,9 +540,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             self._set_xml_tag(node_2, "interface-type", None, None, "p2p")
             self._set_xml_tag(node_2, "metric", None, None, metric)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (area_node.tag, etree.tostring(node_2)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            area_node.tag, self.common_util_log.xml_str(node_2))
         return node_2
 
     @decorater_log
@@ -584,9 +577,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             tmp.text = vrf_name
         node_3 = self._xml_setdefault_node(node_2, "routing-options")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_3
 
     @decorater_log
@@ -606,9 +598,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                                       ip_ver=bgp.get("BGP-IP-VERSION"),
                                       bgp=bgp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_slice_bgp_group(self,
@@ -628,9 +619,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             self._set_xml_tag(node_3, "unicast")
             self._set_xml_tag(node_1, "type", None, None, "external")
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (bgp_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            bgp_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -657,9 +647,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         self._set_xml_tag(node_1, "peer-as", None, None, bgp["BGP-PEER-AS"])
         self._set_xml_tag(node_1, "local-address", None, None, bgp["BGP-LADD"])
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (group_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            group_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -673,9 +662,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         for tmp_cp in cp_infos.values():
             self._set_l3_slice_vlan_if(node_1, tmp_cp)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l3_slice_vlan_if(self,
@@ -694,9 +682,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "name", None, None, cp_info.get("IF-NAME"))
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                ifs_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_1 = self._set_xml_tag(ifs_node, "interface")
         self._set_xml_tag(node_1, "name", None, None, cp_info.get("IF-NAME"))
@@ -717,9 +704,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                                              is_vlan=is_vlan,
                                              mtu=mtu)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (ifs_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            ifs_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -741,9 +727,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                           vlan.get("CE-IF-VLAN-ID"))
         if attr_val == self._DELETE:
             self.common_util_log.logging(
-                None, self.log_level_debug,
-                self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-                __name__)
+                None, self.log_level_debug, self._XML_LOG, __name__,
+                if_node.tag, self.common_util_log.xml_str(node_1))
             return node_1
         node_2 = self._set_xml_tag(node_1, "family")
         is_add_cp = False
@@ -773,9 +758,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             self._set_xml_tag(
                 node_1, "vlan-id", None, None, vlan.get("CE-IF-VLAN-ID"))
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(node_1))
         return node_1
 
     @decorater_log
@@ -807,9 +791,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         if is_add_cp and mtu is not None and is_vlan:
             self._set_xml_tag(node_1, "mtu", None, None, mtu)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (family_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            family_node.tag, self.common_util_log.xml_str(node_1))
 
     @decorater_log
     def _set_l3_slice_routing_instance(self,
@@ -826,9 +809,8 @@ class JuniperDriverMX240(EmSeparateDriver):
             node_2.attrib[attr] = self._DELETE
         self._set_xml_tag(node_2, "name", None, None, vrf_name)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
     @decorater_log
@@ -877,9 +859,8 @@ class JuniperDriverMX240(EmSeparateDriver):
         self._set_xml_tag(node_2, "no-vrf-propagate-ttl")
 
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (conf_node.tag, etree.tostring(node_1)),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            conf_node.tag, self.common_util_log.xml_str(node_1))
         return node_2
 
 
@@ -1675,9 +1656,8 @@ class JuniperDriverMX240(EmSeparateDriver):
                                           if_mes_ec=tmp_if,
                                           operation=operation)
         self.common_util_log.logging(
-            None, self.log_level_debug,
-            self._XML_LOG % (if_node.tag, etree.tostring(if_node),),
-            __name__)
+            None, self.log_level_debug, self._XML_LOG, __name__,
+            if_node.tag, self.common_util_log.xml_str(if_node))
 
         return True
 
@@ -36,7 +36,7 @@ class EmRecoverUtilACL(EmRecoverUtilBase.EmRecoverUtilBase):
             EC message for restoration(JSON)
         '''
         self.common_util_log.logging(
-            " ", self.log_level_debug, "db_info = %s" % db_info, __name__)
+            " ", self.log_level_debug, "db_info = %s", __name__, db_info)
         self.common_util_log.logging(
             " ", self.log_level_debug, "ec_message = %s" %
             ec_message, __name__)
@@ -62,10 +62,11 @@ class EmRecoverUtilACL(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_ec_message = %s" % return_ec_message, __name__)
+            "return_ec_message = %s", __name__, return_ec_message)
 
         return True, json.dumps(return_ec_message)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _create_recover_db_info(self, ec_message, db_info):
         '''
@@ -91,10 +92,11 @@ class EmRecoverUtilACL(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_db_info = %s" % return_db_info, __name__)
+            "return_db_info = %s", __name__, return_db_info)
 
         return True, json.dumps(return_db_info)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_filter(self, json, db_info, ec_message):
         '''
@@ -121,6 +123,7 @@ class EmRecoverUtilACL(EmRecoverUtilBase.EmRecoverUtilBase):
 
             json["device"]["filter"].append(acl_filter_message)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_term(self, json, db_info, ec_message):
         '''
@@ -36,7 +36,7 @@ class EmRecoverUtilBLeaf(EmRecoverUtilBase.EmRecoverUtilBase):
             EC message for restoration(JSON)
         '''
         self.common_util_log.logging(
-            " ", self.log_level_debug, "db_info = %s" % db_info, __name__)
+            " ", self.log_level_debug, "db_info = %s", __name__, db_info)
         self.common_util_log.logging(
             " ", self.log_level_debug, "ec_message = %s" %
             ec_message, __name__)
@@ -119,6 +119,6 @@ class EmRecoverUtilBLeaf(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_ec_message = %s" % return_ec_message, __name__)
+            "return_ec_message = %s", __name__, return_ec_message)
 
         return True, json.dumps(return_ec_message)
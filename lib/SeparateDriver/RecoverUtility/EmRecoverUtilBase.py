@@ -8,6 +8,8 @@ Utility for restoration(Base)
 import json
 import sys
 import copy
+import time
+import functools
 import traceback
 import GlobalModule
 from EmCommonLog import decorater_log
@@ -15,6 +17,27 @@ from EmCommonLog import decorater_log_in_out
 from EmDriverCommonUtilityLog import EmDriverCommonUtilityLog
 
 
+def record_section_time(func):
+    '''
+    Decorator which records number of calls and elapsed time
+    of each section of restoration message generation.
+    '''
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        '''
+        Decorator wrapper.
+        '''
+        start_time = time.time()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            section = self.section_time.setdefault(func.__name__, [0, 0.0])
+            section[0] += 1
+            section[1] += time.time() - start_time
+    return wrapper
+
+
 class EmRecoverUtilBase(object):
     '''
     Utility for restoration
@@ -57,6 +80,8 @@ class EmRecoverUtilBase(object):
 
         self.common_util_log = EmDriverCommonUtilityLog()
 
+        self._clear_recover_index()
+
     @decorater_log_in_out
     def create_recover_message(self, ec_message_str,
                                db_info_str, service_type):
@@ -72,6 +97,7 @@ class EmRecoverUtilBase(object):
             DB message for restoration which has been created(in case of "recover service" only)
             EC message for restoration which has been created
         '''
+        self._clear_recover_index()
         try:
             ec_message = json.loads(ec_message_str)
             db_info = json.loads(db_info_str)
@@ -82,6 +108,7 @@ class EmRecoverUtilBase(object):
                     service_type == self.name_recover_service:
                 ret, recover_db_info = self._create_recover_db_info(
                     ec_message, db_info)
+            self._output_section_time(ec_message)
             return ret, recover_db_info, recover_ec_message
         except Exception, ex_message:
             if 'ec_message' in locals():
@@ -95,6 +122,56 @@ class EmRecoverUtilBase(object):
             sys.exc_info()
             return False, None, None
 
+    @decorater_log
+    def _clear_recover_index(self):
+        '''
+        Indexes of DB information and EC message, and section time
+        are cleared.
+        (Called when new restoration message generation starts.)
+        '''
+        self._index_cache = {}
+        self._ifname_table = (None, None)
+        self._opposite_node_table = (None, None)
+        self.section_time = {}
+
+    @decorater_log
+    def _output_section_time(self, ec_message):
+        '''
+        Number of calls and elapsed time of each section are output to log.
+            Explanation about parameter：
+                ec_message : EC message for restoration expansion/"recover service"
+        '''
+        self.common_util_log.logging(
+            ec_message.get("device", {}).get("name"), self.log_level_debug,
+            "section time (%s) : %s" % (
+                self.__class__.__name__,
+                ", ".join("%s=%d/%.3fs" % (name, count, elapsed)
+                          for name, (count, elapsed) in
+                          sorted(self.section_time.items()))),
+            __name__)
+
+    @decorater_log
+    def _get_index(self, rows, *keys):
+        '''
+        Index of rows of DB information is obtained.
+        (Index is generated once for each rows and keys.)
+            Explanation about parameter：
+                rows : rows of DB information (list)
+                keys : item names of index key
+        Return Value :
+            Index : dict {(values of keys): [rows in original order]}
+        '''
+        cache_key = (id(rows), keys)
+        cached_rows, index = self._index_cache.get(cache_key, (None, None))
+        if cached_rows is not rows:
+            index = {}
+            for row in rows:
+                index.setdefault(
+                    tuple(row.get(key) for key in keys), []).append(row)
+            self._index_cache[cache_key] = (rows, index)
+        return index
+
+    @record_section_time
     @decorater_log
     def _gen_json_name(self, json, db_info, ec_message, device_tag=None):
         '''
@@ -111,6 +188,7 @@ class EmRecoverUtilBase(object):
             device_tag = "device"
         json[device_tag]["name"] = ec_message.get("device", {}).get("name")
 
+    @record_section_time
     @decorater_log
     def _gen_json_equipment(self, json, db_info, ec_message):
         '''
@@ -128,6 +206,7 @@ class EmRecoverUtilBase(object):
             equipment["q-in-q"] = db_q_in_q
         json["device"]["equipment"] = equipment
 
+    @record_section_time
     @decorater_log
     def _gen_json_breakout(self, json, db_info, ec_message):
         '''
@@ -154,6 +233,7 @@ class EmRecoverUtilBase(object):
                  "speed": speed,
                  "breakout-num": breakout_num})
 
+    @record_section_time
     @decorater_log
     def _gen_json_internal_phys(self, json, db_info, ec_message):
         '''
@@ -189,6 +269,7 @@ class EmRecoverUtilBase(object):
         json["device"]["internal-physical_value"] = \
             len(json["device"]["internal-physical"])
 
+    @record_section_time
     @decorater_log
     def _gen_json_internal_lag(self, json, db_info, ec_message):
         '''
@@ -261,18 +342,17 @@ class EmRecoverUtilBase(object):
 　　　　　　　　if_name : internal link IF name after recovery
                 ec_message : EC message for restoration expansion/"recover service"    
         '''
-        opposite_node_name = "Recover"
-
-        ec_internal_if_nodes = ec_message.get(
-            "device").get("internal-interface", [])
-        if ec_internal_if_nodes:
-            for ec_internal_if_node in ec_internal_if_nodes:
-                ec_internal_if_name = ec_internal_if_node.get("name")
-                if if_name == ec_internal_if_name:
-                    opposite_node_name = ec_internal_if_node.get(
-                        "opposite-node-name")
-        return opposite_node_name
-
+        cached_message, opposite_node_table = self._opposite_node_table
+        if cached_message is not ec_message:
+            opposite_node_table = {}
+            for ec_internal_if_node in ec_message.get(
+                    "device").get("internal-interface", None) or ():
+                opposite_node_table[ec_internal_if_node.get("name")] = \
+                    ec_internal_if_node.get("opposite-node-name")
+            self._opposite_node_table = (ec_message, opposite_node_table)
+        return opposite_node_table.get(if_name, "Recover")
+
+    @record_section_time
     @decorater_log
     def _gen_json_management(self, json, db_info, ec_message):
         '''
@@ -288,6 +368,7 @@ class EmRecoverUtilBase(object):
         json["device"]["management-interface"]["address"] = tmp.get("address")
         json["device"]["management-interface"]["prefix"] = tmp.get("prefix")
 
+    @record_section_time
     @decorater_log
     def _gen_json_loopback(self, json, db_info, ec_message):
         '''
@@ -303,6 +384,7 @@ class EmRecoverUtilBase(object):
         json["device"]["loopback-interface"]["address"] = tmp.get("address")
         json["device"]["loopback-interface"]["prefix"] = tmp.get("prefix")
 
+    @record_section_time
     @decorater_log
     def _gen_json_snmp(self, json, db_info, ec_message):
         '''
@@ -318,6 +400,7 @@ class EmRecoverUtilBase(object):
         json["device"]["snmp"]["server-address"] = tmp.get("address")
         json["device"]["snmp"]["community"] = tmp.get("community")
 
+    @record_section_time
     @decorater_log
     def _gen_json_ntp(self, json, db_info, ec_message):
         '''
@@ -332,6 +415,7 @@ class EmRecoverUtilBase(object):
         tmp = db_info.get("device").get("ntp")
         json["device"]["ntp"]["server-address"] = tmp.get("address")
 
+    @record_section_time
     @decorater_log
     def _gen_json_ospf(self, json, db_info, ec_message):
         '''
@@ -361,6 +445,7 @@ class EmRecoverUtilBase(object):
         if prefix is not None:
             json["device"]["ospf"]["range"]["prefix"] = prefix
 
+    @record_section_time
     @decorater_log
     def _gen_json_vpn(self, json, db_info, ec_message):
         '''
@@ -408,6 +493,7 @@ class EmRecoverUtilBase(object):
                 "device").get("as_number")
             json["device"].update(device_json_message)
 
+    @record_section_time
     @decorater_log
     def _gen_json_slice_name(self, json, db_info, ec_message, slice_name):
         '''
@@ -422,6 +508,7 @@ class EmRecoverUtilBase(object):
         '''
         json["device-leaf"]["slice_name"] = slice_name
 
+    @record_section_time
     @decorater_log
     def _gen_json_vrf(self, json, db_info, ec_message, slice_name,
                       slice_type=GlobalModule.SERVICE_L3_SLICE):
@@ -437,20 +524,21 @@ class EmRecoverUtilBase(object):
         '''
         db_info = db_info.get(slice_type)
         tmp_vrf = {}
-        for vrf in db_info.get("vrf_detail", ()):
-            if vrf.get("slice_name") == slice_name:
-                json["device-leaf"]["vrf"]["vrf-name"] = vrf.get("vrf_name")
-                json["device-leaf"]["vrf"]["rt"] = vrf.get("rt")
-                json["device-leaf"]["vrf"]["rd"] = vrf.get("rd")
-                json["device-leaf"]["vrf"]["router-id"] = vrf.get("router_id")
-                tmp_vrf = vrf
-                break
+        vrf_index = self._get_index(db_info.get("vrf_detail", ()),
+                                    "slice_name")
+        for vrf in vrf_index.get((slice_name,), ())[:1]:
+            json["device-leaf"]["vrf"]["vrf-name"] = vrf.get("vrf_name")
+            json["device-leaf"]["vrf"]["rt"] = vrf.get("rt")
+            json["device-leaf"]["vrf"]["rd"] = vrf.get("rd")
+            json["device-leaf"]["vrf"]["router-id"] = vrf.get("router_id")
+            tmp_vrf = vrf
         if slice_type == self.name_l2_slice:
             self._gen_json_vrf_l2(json, tmp_vrf, db_info, slice_name)
 
         if not json["device-leaf"]["vrf"].get("vrf-name", ()):
             del json["device-leaf"]["vrf"]
 
+    @record_section_time
     @decorater_log
     def _gen_json_vrf_l2(self, json, vrf_detail_info, db_info, slice_name):
         '''
@@ -465,15 +553,16 @@ class EmRecoverUtilBase(object):
         '''
         tmp_vrf_info = copy.deepcopy(vrf_detail_info)
         if not json["device-leaf"]["vrf"].get("vrf-name", ()):
-            for dummy_cp in db_info.get("dummy_cp", ()):
-                if dummy_cp.get("slice_name") == slice_name:
-                    tmp_vrf_info = copy.deepcopy(dummy_cp)
-                    json["device-leaf"]["vrf"]["vrf-name"] = \
-                        tmp_vrf_info.get("vrf_name")
-                    json["device-leaf"]["vrf"]["rt"] = tmp_vrf_info.get("rt")
-                    json["device-leaf"]["vrf"]["rd"] = tmp_vrf_info.get("rd")
-                    json["device-leaf"]["vrf"]["router-id"] = \
-                        tmp_vrf_info.get("router_id")
+            dummy_cp_index = self._get_index(db_info.get("dummy_cp", ()),
+                                             "slice_name")
+            for dummy_cp in dummy_cp_index.get((slice_name,), ())[-1:]:
+                tmp_vrf_info = copy.deepcopy(dummy_cp)
+                json["device-leaf"]["vrf"]["vrf-name"] = \
+                    tmp_vrf_info.get("vrf_name")
+                json["device-leaf"]["vrf"]["rt"] = tmp_vrf_info.get("rt")
+                json["device-leaf"]["vrf"]["rd"] = tmp_vrf_info.get("rd")
+                json["device-leaf"]["vrf"]["router-id"] = \
+                    tmp_vrf_info.get("router_id")
 
         json["device-leaf"]["vrf"]["vrf-id"] = tmp_vrf_info.get("vrf_id")
 
@@ -564,19 +653,15 @@ class EmRecoverUtilBase(object):
         Exception :
             ValueError : Conversion failed
         '''
+        ifname_table = self._get_ifname_table(recover_ec_message)
         converted_if_name = None
         if if_type == self._if_type_phy or if_type == "all":
-            for if_info in recover_ec_message.get(
-                    "device").get("physical-ifs", []):
-                if if_info.get("old-name") == old_ifname:
-                    converted_if_name = if_info.get("name")
-                    break
+            converted_if_name = ifname_table[self._if_type_phy].get(
+                old_ifname)
         if converted_if_name is None and \
                 (if_type == self._if_type_lag or if_type == "all"):
-            for if_info in recover_ec_message.get("device").get("lag-ifs", []):
-                if if_info.get("old-name") == old_ifname:
-                    converted_if_name = if_info.get("name")
-                    break
+            converted_if_name = ifname_table[self._if_type_lag].get(
+                old_ifname)
         if converted_if_name is None:
             self.common_util_log.logging(
                 " ", self.log_level_debug,
@@ -588,3 +673,26 @@ class EmRecoverUtilBase(object):
             "if convert success. old_name=%s new_name=%s" %
             (old_ifname, converted_if_name), __name__)
         return converted_if_name
+
+    @decorater_log
+    def _get_ifname_table(self, recover_ec_message):
+        '''
+        Interface name conversion table is obtained.
+        (Table is generated once for each EC message.)
+        Parameter:
+            recover_ec_message : EC message for restoration expansion/"recover service"（IF Name Conversion Table）
+        Return Value :
+            IF name conversion table :
+                dict {IF type: {IF name before restoration: IF name after restoration}}
+        '''
+        cached_message, ifname_table = self._ifname_table
+        if cached_message is not recover_ec_message:
+            ifname_table = {self._if_type_phy: {}, self._if_type_lag: {}}
+            device = recover_ec_message.get("device")
+            for if_type, tag in ((self._if_type_phy, "physical-ifs"),
+                                 (self._if_type_lag, "lag-ifs")):
+                for if_info in device.get(tag, []):
+                    ifname_table[if_type].setdefault(
+                        if_info.get("old-name"), if_info.get("name"))
+            self._ifname_table = (recover_ec_message, ifname_table)
+        return ifname_table
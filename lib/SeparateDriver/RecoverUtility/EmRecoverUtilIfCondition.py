@@ -43,7 +43,7 @@ class EmRecoverUtilIfCondition(EmRecoverUtilBase.EmRecoverUtilBase):
             EC message for recovering(JSON)
         '''
         self.common_util_log.logging(
-            " ", self.log_level_debug, "db_info = %s" % db_info, __name__)
+            " ", self.log_level_debug, "db_info = %s", __name__, db_info)
         self.common_util_log.logging(
             " ", self.log_level_debug, "ec_message = %s" %
             ec_message, __name__)
@@ -74,10 +74,11 @@ class EmRecoverUtilIfCondition(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_ec_message = %s" % return_ec_message, __name__)
+            "return_ec_message = %s", __name__, return_ec_message)
 
         return True, json.dumps(return_ec_message)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _create_recover_db_info(self, ec_message, db_info):
         '''
@@ -99,10 +100,11 @@ class EmRecoverUtilIfCondition(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_db_info = %s" % return_db_info, __name__)
+            "return_db_info = %s", __name__, return_db_info)
 
         return True, json.dumps(return_db_info)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_if_condition(self, json, db_info, ec_message):
         '''
@@ -127,8 +129,9 @@ class EmRecoverUtilIfCondition(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "json = %s" % json, __name__)
+            "json = %s", __name__, json)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_if_condition_type(self, json, db_info, ec_message,
                                     db_if_type, convert_if_type):
@@ -43,6 +43,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
         recover_db_info_list = []
         recover_ec_message_list = []
 
+        self._clear_recover_index()
         try:
             ret = True
             ec_message = json.loads(ec_message_str)
@@ -58,7 +59,6 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
             unrecovered_slice_name_set = copy.deepcopy(slice_name_set)
             req_convert = True
             for slice_name in slice_name_set:
-                db_info_for_update = copy.deepcopy(db_info)
                 ret, recover_ec_message = \
                     self._create_recover_ec_message(
                         ec_message, db_info, slice_name)
@@ -66,7 +66,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                     return False, None, None
                 if recover_ec_message is not None:
                     ret, recover_db_info = self._create_recover_db_info(
-                        ec_message, db_info_for_update, slice_name,
+                        ec_message, db_info, slice_name,
                         unrecovered_slice_name_set, req_convert)
                     if not ret:
                         return False, None, None
@@ -77,6 +77,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
                 unrecovered_slice_name_set.remove(slice_name)
 
+            self._output_section_time(ec_message)
             return ret, recover_db_info_list, recover_ec_message_list
         except Exception, ex_message:
             self.common_util_log.logging(
@@ -99,7 +100,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
             EC message for restoration(JSON)
         '''
         self.common_util_log.logging(
-            " ", self.log_level_debug, "db_info = %s" % db_info, __name__)
+            " ", self.log_level_debug, "db_info = %s", __name__, db_info)
         self.common_util_log.logging(
             " ", self.log_level_debug, "ec_message = %s" %
             ec_message, __name__)
@@ -140,7 +141,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_ec_message = %s" % return_ec_message, __name__)
+            "return_ec_message = %s", __name__, return_ec_message)
 
         if len(return_ec_message["device-leaf"].get("cp", [])) == 0 and \
                 len(return_ec_message["device-leaf"].get("dummy_cp", [])) == 0:
@@ -148,6 +149,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         return True, json.dumps(return_ec_message)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _create_recover_db_info(self, ec_message, db_info,
                                 slice_name,
@@ -155,6 +157,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                                 req_convert):
         '''
         Create L2 slice EVPN control DB information for restoration
+        (db_info is not changed.)
         Parameter:
             ec_message : EC message for "recover service"
             db_info : DB information
@@ -165,7 +168,10 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
             Result : Success：True  Failure：False
             DB information for restoration(JSON)
         '''
-        return_db_info = db_info.get(self.name_l2_slice)
+        if req_convert:
+            return_db_info = copy.deepcopy(db_info.get(self.name_l2_slice))
+        else:
+            return_db_info = dict(db_info.get(self.name_l2_slice))
         if req_convert:
             return_db_info["device"]["platform_name"] = \
                 ec_message.get("device").get("equipment").get("platform")
@@ -188,25 +194,21 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                     vrf["if_name"] = self._convert_ifname(
                         vrf.get("if_name"), ec_message, "all")
 
-        for cp in return_db_info.get("cp")[:]:
-            if cp.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("cp").remove(cp)
-        for dummy_cp in return_db_info.get("dummy_cp")[:]:
-            if dummy_cp.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("dummy_cp").remove(dummy_cp)
-        for vrf in return_db_info.get("vrf_detail")[:]:
-            if vrf.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("vrf_detail").remove(vrf)
+        for key in ("cp", "dummy_cp", "vrf_detail"):
+            return_db_info[key] = [
+                row for row in return_db_info.get(key)
+                if row.get("slice_name") not in unrecovered_slice_name_set]
         return_db_info["cp_value"] = len(return_db_info["cp"])
         return_db_info["dummy_cp_value"] = len(return_db_info["dummy_cp"])
         return_db_info["vrf_detail_value"] = len(return_db_info["vrf_detail"])
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_db_info = %s" % return_db_info, __name__)
+            "return_db_info = %s", __name__, return_db_info)
 
         return True, json.dumps(return_db_info)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l2_cp(self, json, db_info, ec_message, slice_name):
         '''
@@ -220,10 +222,9 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
         '''
         l2_db_info = db_info.get(self.name_l2_slice, {})
+        cp_index = self._get_index(l2_db_info.get("cp", ()), "slice_name")
 
-        for cp_info in l2_db_info.get("cp", ()):
-            if cp_info.get("slice_name") != slice_name:
-                continue
+        for cp_info in cp_index.get((slice_name,), ()):
             cp_message = \
                 {
                     "operation": None,
@@ -264,6 +265,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
         if len(json["device-leaf"]["cp"]) == 0:
             del json["device-leaf"]["cp"]
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l2_dummy_cp(self, json, db_info, ec_message, slice_name):
         '''
@@ -277,10 +279,10 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
         '''
         l2_db_info = db_info.get(self.name_l2_slice, {})
+        dummy_cp_index = self._get_index(l2_db_info.get("dummy_cp", ()),
+                                         "slice_name")
 
-        for cp_info in l2_db_info.get("dummy_cp", ()):
-            if cp_info.get("slice_name") != slice_name:
-                continue
+        for cp_info in dummy_cp_index.get((slice_name,), ()):
             dmy_cp_message = \
                 {
                     "operation": None,
@@ -334,6 +336,7 @@ class EmRecoverUtilL2Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         return irb_message
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_multi_homing(self, json, db_info, ec_message, slice_name):
         '''
@@ -46,6 +46,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
         recover_db_info_list = []
         recover_ec_message_list = []
 
+        self._clear_recover_index()
         try:
             ret = True
             ec_message = json.loads(ec_message_str)
@@ -59,7 +60,6 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
             req_convert = True
             for slice_name in slice_name_set:
-                db_info_for_update = copy.deepcopy(db_info)
                 ret, recover_ec_message = \
                     self._create_recover_ec_message(
                         ec_message, db_info, slice_name)
@@ -67,7 +67,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                     return False, None, None
                 if recover_ec_message is not None:
                     ret, recover_db_info = self._create_recover_db_info(
-                        ec_message, db_info_for_update, slice_name,
+                        ec_message, db_info, slice_name,
                         unrecovered_slice_name_set, req_convert)
                     if not ret:
                         return False, None, None
@@ -78,6 +78,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
                 unrecovered_slice_name_set.remove(slice_name)
 
+            self._output_section_time(ec_message)
             return ret, recover_db_info_list, recover_ec_message_list
         except Exception, ex_message:
             self.common_util_log.logging(
@@ -100,7 +101,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
             EC message for restoration(JSON)
         '''
         self.common_util_log.logging(
-            " ", self.log_level_debug, "db_info = %s" % db_info, __name__)
+            " ", self.log_level_debug, "db_info = %s", __name__, db_info)
         self.common_util_log.logging(
             " ", self.log_level_debug, "ec_message = %s" %
             ec_message, __name__)
@@ -136,10 +137,11 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_ec_message = %s" % return_ec_message, __name__)
+            "return_ec_message = %s", __name__, return_ec_message)
 
         return True, json.dumps(return_ec_message)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _create_recover_db_info(self, ec_message, db_info,
                                 slice_name,
@@ -147,6 +149,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                                 req_convert):
         '''
         Create L3 slice creation DB information for restoration
+        (db_info is not changed.)
         Parameter:
             ec_message : EC message for "recover service"
             db_info : DB information
@@ -157,7 +160,10 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
             Result : Success：True  Failure：False
             DB information for restoration(JSON)
         '''
-        return_db_info = db_info.get(self.name_l3_slice)
+        if req_convert:
+            return_db_info = copy.deepcopy(db_info.get(self.name_l3_slice))
+        else:
+            return_db_info = dict(db_info.get(self.name_l3_slice))
 
         if req_convert:
             return_db_info["device"]["platform_name"] = \
@@ -187,21 +193,11 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 static["if_name"] = self._convert_ifname(
                     static.get("if_name"), ec_message, "all")
 
-        for cp in return_db_info.get("cp")[:]:
-            if cp.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("cp").remove(cp)
-        for vrf in return_db_info.get("vrf_detail")[:]:
-            if vrf.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("vrf_detail").remove(vrf)
-        for vrrp in return_db_info.get("vrrp_detail")[:]:
-            if vrrp.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("vrrp_detail").remove(vrrp)
-        for bgp in return_db_info.get("bgp_detail")[:]:
-            if bgp.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("bgp_detail").remove(bgp)
-        for static in return_db_info.get("static_detail")[:]:
-            if static.get("slice_name") in unrecovered_slice_name_set:
-                return_db_info.get("static_detail").remove(static)
+        for key in ("cp", "vrf_detail", "vrrp_detail",
+                    "bgp_detail", "static_detail"):
+            return_db_info[key] = [
+                row for row in return_db_info.get(key)
+                if row.get("slice_name") not in unrecovered_slice_name_set]
 
         return_db_info["cp_value"] = len(return_db_info["cp"])
         return_db_info["vrf_detail_value"] = len(return_db_info["vrf_detail"])
@@ -213,10 +209,11 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         self.common_util_log.logging(
             " ", self.log_level_debug,
-            "return_db_info = %s" % return_db_info, __name__)
+            "return_db_info = %s", __name__, return_db_info)
 
         return True, json.dumps(return_db_info)
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l3_cp(self, json, db_info, ec_message, slice_name):
         '''
@@ -230,10 +227,9 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
         '''
         l3_db_info = db_info.get(self.name_l3_slice)
+        cp_index = self._get_index(l3_db_info.get("cp", ()), "slice_name")
 
-        for cp_info in l3_db_info.get("cp", ()):
-            if cp_info.get("slice_name") != slice_name:
-                continue
+        for cp_info in cp_index.get((slice_name,), ()):
             cp_message = \
                 {
                     "operation": None,
@@ -284,6 +280,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
 
         json["device-leaf"]["cp_value"] = len(json["device-leaf"]["cp"])
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l3cp_ce_interface(self, cp_message, cp_info,
                                     ec_message, slice_name):
@@ -309,6 +306,7 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 "prefix6"] = cp_info.get("ce_ipv6").get("prefix")
         cp_message["ce-interface"]["mtu"] = cp_info.get("mtu_size")
 
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l3cp_vrrp(self, cp_message, l3_db_info,
                             ec_message, slice_name, cp_info):
@@ -323,31 +321,32 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
                 cp_info : DB information(CP）
         '''
-        for vrrp in l3_db_info.get("vrrp_detail", ()):
-            if cp_info.get("if_name") == vrrp.get("if_name") and \
-                    cp_info.get("vlan").get(
-                "vlan_id") == vrrp.get("vlan_id") and \
-                    cp_info.get("slice_name") == vrrp.get("slice_name"):
-                cp_message["vrrp"]["group-id"] = vrrp.get("group_id")
-                if vrrp.get("virtual").get("ipv4_address") is not None:
-                    cp_message["vrrp"][
-                        "virtual-address"] = \
-                        vrrp.get("virtual").get("ipv4_address")
-                if vrrp.get("virtual").get("ipv6_address") is not None:
-                    cp_message["vrrp"][
-                        "virtual-address6"] = \
-                        vrrp.get("virtual").get("ipv6_address")
-                cp_message["vrrp"]["priority"] = vrrp.get("priority")
-                if vrrp.get("priority") == self._vrrp_master:
-                    for track_if in vrrp.get("track_if_name", []):
-                        converted_track_if = self._convert_ifname(
-                            track_if, ec_message, "all")
-                        cp_message["vrrp"]["track"][
-                            "interface"].append({"name": converted_track_if})
-                    cp_message["vrrp"]["track"]["track_interface_value"] = len(
-                        cp_message["vrrp"]["track"]["interface"])
-                break
-
+        vrrp_index = self._get_index(l3_db_info.get("vrrp_detail", ()),
+                                     "if_name", "vlan_id", "slice_name")
+        index_key = (cp_info.get("if_name"),
+                     cp_info.get("vlan").get("vlan_id"),
+                     cp_info.get("slice_name"))
+        for vrrp in vrrp_index.get(index_key, ())[:1]:
+            cp_message["vrrp"]["group-id"] = vrrp.get("group_id")
+            if vrrp.get("virtual").get("ipv4_address") is not None:
+                cp_message["vrrp"][
+                    "virtual-address"] = \
+                    vrrp.get("virtual").get("ipv4_address")
+            if vrrp.get("virtual").get("ipv6_address") is not None:
+                cp_message["vrrp"][
+                    "virtual-address6"] = \
+                    vrrp.get("virtual").get("ipv6_address")
+            cp_message["vrrp"]["priority"] = vrrp.get("priority")
+            if vrrp.get("priority") == self._vrrp_master:
+                for track_if in vrrp.get("track_if_name", []):
+                    converted_track_if = self._convert_ifname(
+                        track_if, ec_message, "all")
+                    cp_message["vrrp"]["track"][
+                        "interface"].append({"name": converted_track_if})
+                cp_message["vrrp"]["track"]["track_interface_value"] = len(
+                    cp_message["vrrp"]["track"]["interface"])
+
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l3cp_bgp(self, cp_message, l3_db_info,
                            ec_message, slice_name, cp_info):
@@ -362,28 +361,29 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
                 cp_info : DB information(CP）
         '''
-        for bgp in l3_db_info.get("bgp_detail", ()):
-            if cp_info.get("if_name") == bgp.get("if_name") and \
-                    cp_info.get("vlan").get("vlan_id") == \
-                    bgp.get("vlan_id") and \
-                    cp_info.get("slice_name") == bgp.get("slice_name"):
-                if bgp.get("master"):
-                    cp_message["bgp"]["master"] = "ON"
-                cp_message["bgp"]["remote-as-number"] = bgp.get("as_number")
-                if bgp.get("local").get("ipv4_address") is not None:
-                    cp_message["bgp"][
-                        "local-address"] = bgp.get("local").get("ipv4_address")
-                if bgp.get("remote").get("ipv4_address") is not None:
-                    cp_message["bgp"]["remote-address"] = \
-                        bgp.get("remote").get("ipv4_address")
-                if bgp.get("local").get("ipv6_address") is not None:
-                    cp_message["bgp"]["local-address6"] = \
-                        bgp.get("local").get("ipv6_address")
-                if bgp.get("remote").get("ipv6_address") is not None:
-                    cp_message["bgp"]["remote-address6"] = \
-                        bgp.get("remote").get("ipv6_address")
-                break
-
+        bgp_index = self._get_index(l3_db_info.get("bgp_detail", ()),
+                                    "if_name", "vlan_id", "slice_name")
+        index_key = (cp_info.get("if_name"),
+                     cp_info.get("vlan").get("vlan_id"),
+                     cp_info.get("slice_name"))
+        for bgp in bgp_index.get(index_key, ())[:1]:
+            if bgp.get("master"):
+                cp_message["bgp"]["master"] = "ON"
+            cp_message["bgp"]["remote-as-number"] = bgp.get("as_number")
+            if bgp.get("local").get("ipv4_address") is not None:
+                cp_message["bgp"][
+                    "local-address"] = bgp.get("local").get("ipv4_address")
+            if bgp.get("remote").get("ipv4_address") is not None:
+                cp_message["bgp"]["remote-address"] = \
+                    bgp.get("remote").get("ipv4_address")
+            if bgp.get("local").get("ipv6_address") is not None:
+                cp_message["bgp"]["local-address6"] = \
+                    bgp.get("local").get("ipv6_address")
+            if bgp.get("remote").get("ipv6_address") is not None:
+                cp_message["bgp"]["remote-address6"] = \
+                    bgp.get("remote").get("ipv6_address")
+
+    @EmRecoverUtilBase.record_section_time
     @decorater_log
     def _gen_json_l3cp_static(self, cp_message, l3_db_info,
                               ec_message, slice_name, cp_info):
@@ -398,35 +398,35 @@ class EmRecoverUtilL3Slice(EmRecoverUtilBase.EmRecoverUtilBase):
                 slice_name : Slice name to be recovered
                 cp_info : DB information(CP）
         '''
-        for static in l3_db_info.get("static_detail", ()):
-            if cp_info.get("if_name") == static.get("if_name") and \
-                    cp_info.get("vlan").get("vlan_id") == \
-                    static.get("vlan_id") and \
-                    cp_info.get("slice_name") == static.get("slice_name"):
-
-                if static.get("ipv4").get("address") is not None:
-                    route4 = \
-                        {
-                            "address": None,
-                            "prefix": 0,
-                            "nexthop": None
-                        }
-                    route4["address"] = static.get("ipv4").get("address")
-                    route4["prefix"] = static.get("ipv4").get("prefix")
-                    route4["nexthop"] = static.get("ipv4").get("nexthop")
-                    cp_message["static"]["route"].append(route4)
-
-                if static.get("ipv6").get("address") is not None:
-                    route6 = \
-                        {
-                            "address": None,
-                            "prefix": 0,
-                            "nexthop": None
-                        }
-                    route6["address"] = static.get("ipv6").get("address")
-                    route6["prefix"] = static.get("ipv6").get("prefix")
-                    route6["nexthop"] = static.get("ipv6").get("nexthop")
-                    cp_message["static"]["route6"].append(route6)
+        static_index = self._get_index(l3_db_info.get("static_detail", ()),
+                                       "if_name", "vlan_id", "slice_name")
+        index_key = (cp_info.get("if_name"),
+                     cp_info.get("vlan").get("vlan_id"),
+                     cp_info.get("slice_name"))
+        for static in static_index.get(index_key, ()):
+            if static.get("ipv4").get("address") is not None:
+                route4 = \
+                    {
+                        "address": None,
+                        "prefix": 0,
+                        "nexthop": None
+                    }
+                route4["address"] = static.get("ipv4").get("address")
+                route4["prefix"] = static.get("ipv4").get("prefix")
+                route4["nexthop"] = static.get("ipv4").get("nexthop")
+                cp_message["static"]["route"].append(route4)
+
+            if static.get("ipv6").get("address") is not None:
+                route6 = \
+                    {
+                        "address": None,
+                        "prefix": 0,
+                        "nexthop": None
+                    }
+                route6["address"] = static.get("ipv6").get("address")
+                route6["prefix"] = static.get("ipv6").get("prefix")
+                route6["nexthop"] = static.get("ipv6").get("nexthop")
+                cp_message["static"]["route6"].append(route6)
 
         cp_message["static"]["route_value"] = len(
             cp_message["static"]["route"])
@@ -6,10 +6,11 @@
 Utility (DB) module common for the system.
 '''
 import threading
-from lxml import etree
 import GlobalModule
+from EmDBIndexedRows import EmDBIndexedRows
 from EmCommonLog import decorater_log
 from EmCommonLog import decorater_log_in_out
+from EmOrderMessage import EmOrderXml
 
 
 class EmSysCommonUtilityDB(object):
@@ -72,6 +73,54 @@ class EmSysCommonUtilityDB(object):
 
     __db_delete = "DELETE"
 
+    __em_info_tables = {
+        __service.l3_slice: (table_VrfDetailInfo,
+                             table_VlanIfInfo,
+                             table_StaticRouteDetailInfo,
+                             table_BgpDetailInfo,
+                             table_VrrpDetailInfo,
+                             table_VrrpTrackIfInfo),
+        __service.l2_slice: (table_VlanIfInfo,
+                             table_PhysicalIfInfo,
+                             table_DummyVlanIfInfo,
+                             table_VrfDetailInfo,
+                             table_MultiHomingInfo,
+                             table_ACLInfo),
+        __service.spine: (table_DeviceRegistrationInfo,
+                          table_LagIfInfo,
+                          table_LagMemberIfInfo,
+                          table_InnerLinkIfInfo,
+                          table_PhysicalIfInfo,
+                          table_BreakoutIfInfo),
+        __service.leaf: (table_DeviceRegistrationInfo,
+                         table_LagIfInfo,
+                         table_LagMemberIfInfo,
+                         table_InnerLinkIfInfo,
+                         table_PhysicalIfInfo,
+                         table_BreakoutIfInfo,
+                         table_L3VpnLeafBgpBasicInfo),
+        __service.b_leaf: (table_DeviceRegistrationInfo,
+                           table_LagIfInfo,
+                           table_LagMemberIfInfo,
+                           table_InnerLinkIfInfo,
+                           table_PhysicalIfInfo,
+                           table_BreakoutIfInfo,
+                           table_L3VpnLeafBgpBasicInfo),
+        __service.ce_lag: (table_LagIfInfo,
+                           table_LagMemberIfInfo,
+                           table_PhysicalIfInfo),
+        __service.internal_link: (table_LagIfInfo,
+                                  table_LagMemberIfInfo,
+                                  table_PhysicalIfInfo,
+                                  table_InnerLinkIfInfo,
+                                  table_BreakoutIfInfo),
+        __service.breakout: (table_VlanIfInfo,),
+        __service.cluster_link: (table_ClusterLinkIfInfo,
+                                 table_PhysicalIfInfo),
+        __service.acl_filter: (table_ACLInfo,
+                               table_ACLDetailInfo),
+    }
+
     @decorater_log
     def __init__(self):
         '''
@@ -259,6 +308,7 @@ class EmSysCommonUtilityDB(object):
             GlobalModule.EM_LOGGER.debug('Device Name:%s Device Status:%s',
                                          device_name,
                                          transaction_status)
+            EmTransactionStatusNotice.notify(transaction_id)
             return True
         else:
             GlobalModule.EM_LOGGER.warning(
@@ -319,7 +369,7 @@ class EmSysCommonUtilityDB(object):
             return False
 
         try:
-            xml_obj = etree.fromstring(ec_message)
+            xml_obj = EmOrderXml.to_element(ec_message)
             param_set_db = [xml_obj, db_controlorer, device_name]
             param_set_db.extend(add_param)
             funcs, params = set_db_info_function(*param_set_db)
@@ -391,6 +441,27 @@ class EmSysCommonUtilityDB(object):
                 '209001 Database Get Information Error')
             return False, None
 
+    @staticmethod
+    @decorater_log_in_out
+    def read_device_registered_list():
+        '''
+        Method which instructs DB control to read all devices
+        in device registration information table.
+        Explanation about parameter:
+            None
+        Return value:
+            Execution result : boolean(True or False)
+            List of (Device name, Platform name) : list
+        '''
+        result, data = GlobalModule.DB_CONTROL.read_device_regist_all_info()
+        if result:
+            return True, [(row['device_name'], row['platform_name'])
+                          for row in data]
+        else:
+            GlobalModule.EM_LOGGER.warning(
+                '209001 Database Get Information Error')
+            return False, None
+
     @staticmethod
     @decorater_log_in_out
     def write_device_status_list(transaction_id):
@@ -416,6 +487,7 @@ class EmSysCommonUtilityDB(object):
         Method which gets launched from common section on driver
         and instructs DB control to read the tables corresponding
         to the Service type and Order type.
+        (Tables are read by one SELECT sentence.)
         Explanation about parameter:
             device_name:Device name
             service_type:Service type
@@ -423,226 +495,26 @@ class EmSysCommonUtilityDB(object):
             Execution result : boolean(True or False)
             Information about table read out by DB control : tuple
         '''
-        if service_type == self.__service.l3_slice:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_vrf_detail_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_vlanif_info(
-                device_name)
-            result3, data3 = GlobalModule\
-                .DB_CONTROL.read_static_route_detail_info(device_name)
-            result4, data4 = GlobalModule\
-                .DB_CONTROL.read_bgp_detail_info(device_name)
-            result5, data5 = GlobalModule.DB_CONTROL.read_vrrp_detail_info(
-                device_name)
-            result6, data6 = GlobalModule.DB_CONTROL.read_vrrp_trackif_info(
-                device_name)
-
-            if (result1 and result2 and result3 and
-                    result4 and result5 and result6):
-
-                data = (data1, data2, data3, data4, data5, data6)
-                data_all =\
-                    data1 or data2 or data3 or data4 or data5 or data6
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.l2_slice:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_vlanif_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-            result3, data3 = GlobalModule.DB_CONTROL.read_dummy_vlan_if_info(
-                device_name)
-            result4, data4 = GlobalModule.DB_CONTROL.read_vrf_detail_info(
-                device_name)
-            result5, data5 = GlobalModule.DB_CONTROL.read_multi_homing_info(
-                device_name)
-            result6, data6 = GlobalModule.DB_CONTROL.read_acl_info(
-                device_name)
-
-            if (result1 and result2 and result3 and
-                    result4 and result5 and result6):
-
-                data = (data1, data2, data3, data4, data5, data6)
-                data_all =\
-                    data1 or data2 or data3 or data4 or data5 or data6
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.spine:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_device_regist_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_lagif_info(
-                device_name)
-            result3, data3 = GlobalModule.DB_CONTROL.read_lagmemberif_info(
-                device_name)
-            result4, data4 = GlobalModule.DB_CONTROL.read_inner_link_if_info(
-                device_name)
-            result5, data5 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-            result6, data6 = GlobalModule.DB_CONTROL.read_breakout_if_info(
-                device_name)
-
-            if (result1 and result2 and result3 and
-                    result4 and result5 and result6):
-
-                data = (data1, data2, data3, data4, data5, data6)
-                data_all =\
-                    data1 or data2 or data3 or data4 or data5 or data6
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type in (self.__service.leaf, self.__service.b_leaf):
-
-            result1, data1 = GlobalModule.DB_CONTROL\
-                .read_device_regist_info(device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_lagif_info(
-                device_name)
-            result3, data3 = GlobalModule.DB_CONTROL.read_lagmemberif_info(
-                device_name)
-            result4, data4 = GlobalModule.DB_CONTROL.read_inner_link_if_info(
-                device_name)
-            result5, data5 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-            result6, data6 = GlobalModule.DB_CONTROL.read_breakout_if_info(
-                device_name)
-            result7, data7 = GlobalModule.DB_CONTROL\
-                .read_leaf_bgp_basic_info(device_name)
-
-            if (result1 and result2 and result3 and
-                    result4 and result5 and result6 and result7):
-
-                data = (data1, data2, data3, data4, data5, data6, data7)
-                data_all =\
-                    data1 or data2 or data3 or data4 or data5 or data6 or data7
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.ce_lag:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_lagif_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_lagmemberif_info(
-                device_name)
-            result3, data3 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-
-            if result1 and result2 and result3:
-
-                data = (data1, data2, data3)
-                data_all = data1 or data2 or data3
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.internal_link:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_lagif_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_lagmemberif_info(
-                device_name)
-            result3, data3 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-            result4, data4 = GlobalModule.DB_CONTROL.read_inner_link_if_info(
-                device_name)
-            result5, data5 = GlobalModule.DB_CONTROL.read_breakout_if_info(
-                device_name)
-
-            if result1 and result2 and result3 and result4 and result5:
-
-                data = (data1, data2, data3, data4, data5)
-                data_all = data1 or data2 or data3 or data4 or data5
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.breakout:
-
-            result, data = GlobalModule.DB_CONTROL.read_vlanif_info(
-                device_name)
-
-            if result:
-                if len(data) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.cluster_link:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_cluster_link_if_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_physical_if_info(
-                device_name)
-
-            if (result1 and result2):
-
-                data = (data1, data2)
-                data_all = data1 or data2
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        elif service_type == self.__service.acl_filter:
-
-            result1, data1 = GlobalModule.DB_CONTROL.read_acl_info(
-                device_name)
-            result2, data2 = GlobalModule.DB_CONTROL.read_acl_detail_info(
-                device_name)
-
-            if (result1 and result2):
-
-                data = (data1, data2)
-                data_all = data1 or data2
-                if len(data_all) == 0:
-                    data = None
-                return True, data
-            else:
-                GlobalModule.EM_LOGGER.warning(
-                    '209001 Database Get Information Error')
-                return False, None
-
-        else:
+        tables = self.__em_info_tables.get(service_type)
+        if tables is None:
             GlobalModule.EM_LOGGER.debug('Service Type Error')
             return False, None
 
+        result, snapshot = GlobalModule.DB_CONTROL.read_device_snapshot(
+            device_name, tables)
+        if not result:
+            GlobalModule.EM_LOGGER.warning(
+                '209001 Database Get Information Error')
+            return False, None
+
+        data = tuple(snapshot[table] for table in tables)
+        data_all = [row for table_data in data for row in table_data]
+        if len(data_all) == 0:
+            return True, None
+        if service_type == self.__service.breakout:
+            data = data[0]
+        return True, data
+
     @staticmethod
     def read_system_status(data_type=GET_DATA_TYPE_MEMORY):
         '''
@@ -1498,6 +1370,7 @@ class EmSysCommonUtilityDB(object):
                        (device_name,))
             GlobalModule.EM_LOGGER.debug(err_mes)
             raise ValueError("DB Control ERROR")
+        db_lag = EmDBIndexedRows(db_lag)
 
         lag_if_nodes = dev_node.findall(name_s +
                                         lag_if_node_tag.get(
@@ -1939,17 +1812,21 @@ class EmSysCommonUtilityDB(object):
                 self.__get_param(tmp_node, name_s + "router-id", str))
         tmp_func_list = []
         tmp_param_list = []
+        db_vlan_info = None
 
         for cp_node in dev_node.findall(name_s + "cp"):
             if cp_node.find(name_s + "port-mode") is None and \
                     (slice_type == self.__service.l2_slice):
-                ok, db_vlan_info = GlobalModule.DB_CONTROL.read_vlanif_info(
-                    device_name)
-                if not ok:
-                    err_mes = ('DB Fault read_vlanif_info(device_name = %s)' %
-                               (device_name,))
-                    GlobalModule.EM_LOGGER.debug(err_mes)
-                    raise ValueError("DB Control ERROR")
+                if db_vlan_info is None:
+                    ok, db_vlan_info = (
+                        GlobalModule.DB_CONTROL.read_vlanif_info(device_name))
+                    if not ok:
+                        err_mes = (
+                            'DB Fault read_vlanif_info(device_name = %s)' %
+                            (device_name,))
+                        GlobalModule.EM_LOGGER.debug(err_mes)
+                        raise ValueError("DB Control ERROR")
+                    db_vlan_info = EmDBIndexedRows(db_vlan_info)
                 if_name = self.__get_param(cp_node, name_s + "name", str)
                 vlan_id = self.__get_param(cp_node, name_s + "vlan-id", int)
                 cp_param = self.__get_key_recode(db_vlan_info,
@@ -1959,7 +1836,8 @@ class EmSysCommonUtilityDB(object):
                                                  slice_name=slice_name)
 
                 self._change_multi(
-                    cp_node, name_s, slice_name, device_name, cp_param)
+                    cp_node, name_s, slice_name, device_name, cp_param,
+                    db_vlan_info)
                 cp_param["db_control"] = ("UPDATE")
                 cp_param["esi"] = self.__get_param(
                     cp_node, name_s + "esi", str)
@@ -2705,6 +2583,9 @@ class EmSysCommonUtilityDB(object):
                        (device_name, db_vlan_info))
             GlobalModule.EM_LOGGER.debug(err_mes)
             raise ValueError("VLAN COUNT ZERO ERROR")
+        db_vlan_info = EmDBIndexedRows(db_vlan_info)
+        db_vrf_detail_info = None
+        db_dummy_vlan_info = None
         cp_del_count = 0
         vlan_count = 0
 
@@ -2742,15 +2623,17 @@ class EmSysCommonUtilityDB(object):
                         GlobalModule.DB_CONTROL.write_vlanif_info)
                     param_list.append(cp_param)
                 if dev_node.find(name_s + "vrf") is not None:
-                    ok, db_vrf_detail_info = (
-                        GlobalModule.DB_CONTROL.read_vrf_detail_info(
-                            device_name))
-                    if not ok:
-                        err_mes = (
-                            'DB Fault read_vrf_detail_info(device_name = %s)' %
-                            (device_name,))
-                        GlobalModule.EM_LOGGER.debug(err_mes)
-                        raise ValueError("DB Control ERROR")
+                    if db_vrf_detail_info is None:
+                        ok, db_vrf_detail_info = (
+                            GlobalModule.DB_CONTROL.read_vrf_detail_info(
+                                device_name))
+                        if not ok:
+                            err_mes = ('DB Fault read_vrf_detail_info' +
+                                       '(device_name = %s)' % (device_name,))
+                            GlobalModule.EM_LOGGER.debug(err_mes)
+                            raise ValueError("DB Control ERROR")
+                        db_vrf_detail_info = (
+                            EmDBIndexedRows(db_vrf_detail_info))
                     vrf_param = self.__get_key_recode(db_vrf_detail_info,
                                                       device_name=device_name,
                                                       if_name=if_name,
@@ -2807,7 +2690,8 @@ class EmSysCommonUtilityDB(object):
                                                  slice_name=slice_name)
 
                 self._change_multi(
-                    cp_node, name_s, slice_name, device_name, cp_param)
+                    cp_node, name_s, slice_name, device_name, cp_param,
+                    db_vlan_info)
                 cp_param["db_control"] = ("UPDATE")
                 cp_param["esi"] = self.__get_param(
                     cp_node, name_s + "esi", str)
@@ -3012,15 +2896,16 @@ class EmSysCommonUtilityDB(object):
         for dummy_node in dev_node.findall(name_s + "dummy_vlan"):
             vlan_id = self.__get_param(dummy_node, name_s + "vlan-id", int)
             if dummy_node.get(key_ope) == val_del:
-                ok, db_dummy_vlan_info = (
-                    GlobalModule.DB_CONTROL.read_dummy_vlan_if_info(
-                        device_name))
-                if not ok:
-                    err_mes = (
-                        'DB Fault read_dummy_vlan_if_info(device_name = %s)' %
-                        (device_name,))
-                    GlobalModule.EM_LOGGER.debug(err_mes)
-                    raise ValueError("DB Control ERROR")
+                if db_dummy_vlan_info is None:
+                    ok, db_dummy_vlan_info = (
+                        GlobalModule.DB_CONTROL.read_dummy_vlan_if_info(
+                            device_name))
+                    if not ok:
+                        err_mes = ('DB Fault read_dummy_vlan_if_info' +
+                                   '(device_name = %s)' % (device_name,))
+                        GlobalModule.EM_LOGGER.debug(err_mes)
+                        raise ValueError("DB Control ERROR")
+                    db_dummy_vlan_info = EmDBIndexedRows(db_dummy_vlan_info)
                 dummy_param = self.__get_key_recode(db_dummy_vlan_info,
                                                     device_name=device_name,
                                                     vlan_id=vlan_id,
@@ -3071,19 +2956,23 @@ class EmSysCommonUtilityDB(object):
                       name_s,
                       slice_name,
                       device_name,
-                      cp_param):
-        is_ok, vlan_data = \
-            GlobalModule.DB_CONTROL.read_vlanif_info(
-                device_name)
+                      cp_param,
+                      vlan_data=None):
+        is_ok = True
+        if vlan_data is None:
+            is_ok, vlan_data = \
+                GlobalModule.DB_CONTROL.read_vlanif_info(
+                    device_name)
         if is_ok:
-            for data in vlan_data:
-                if data["device_name"] == device_name and \
-                        data["slice_name"] == slice_name and \
-                        data["if_name"] == cp_param["if_name"] and \
-                        data["vlan_id"] == cp_param["vlan_id"]:
-                    cp_param = data
-                    port_mode_data = data["port_mode"]
-                    vni_data = data["vni"]
+            if not isinstance(vlan_data, EmDBIndexedRows):
+                vlan_data = EmDBIndexedRows(vlan_data)
+            for data in vlan_data.select(device_name=device_name,
+                                         slice_name=slice_name,
+                                         if_name=cp_param["if_name"],
+                                         vlan_id=cp_param["vlan_id"]):
+                cp_param = data
+                port_mode_data = data["port_mode"]
+                vni_data = data["vni"]
 
         cp_param["port_mode"] = port_mode_data
         cp_param["vni"] = vni_data
@@ -3117,6 +3006,7 @@ class EmSysCommonUtilityDB(object):
                 'DB Fault read_inner_link_if_info(device_name = %s)'
                 % (device_name,))
             raise ValueError("DB Control (VLANIFINFO) ERROR")
+        db_internal_link_info = EmDBIndexedRows(db_internal_link_info)
         for in_node in dev_node.findall(name_s + "internal-interface"):
             if_name = self.__get_param(in_node, name_s + "name", str)
             if_type = self.__get_param(in_node, name_s + "type", str)
@@ -3194,6 +3084,8 @@ class EmSysCommonUtilityDB(object):
                        (device_name, db_vlan_info))
             GlobalModule.EM_LOGGER.debug(err_mes)
             raise ValueError("VLAN COUNT ZERO ERROR")
+        db_vlan_info = EmDBIndexedRows(db_vlan_info)
+        db_vrrp = EmDBIndexedRows(db_vrrp)
 
         vlan_count = 0
         for row in db_vlan_info:
@@ -3401,6 +3293,7 @@ class EmSysCommonUtilityDB(object):
                 'DB Fault read_static_route_detail_info(device_name = %s)' %
                 (device_name,))
             raise ValueError("DB Control (STATIC_DETAIL) ERROR")
+        db_vlan_info = EmDBIndexedRows(db_vlan_info)
 
         static_db_counts = {}
         for row in db_static:
@@ -3494,6 +3387,7 @@ class EmSysCommonUtilityDB(object):
             GlobalModule.EM_LOGGER.debug(
                 'DB Fault read_vlanif_info(device_name = %s)' % (device_name,))
             raise ValueError("DB Control (VLANIFINFO) ERROR")
+        db_vlan_info = EmDBIndexedRows(db_vlan_info)
 
         for cp_node in dev_node.findall(name_s + "cp"):
             if_name = self.__get_param(cp_node, name_s + "name", str)
@@ -3746,13 +3640,18 @@ class EmSysCommonUtilityDB(object):
     @staticmethod
     @decorater_log
     def __get_key_recode(db_rows, **keyvalues):
-        return_row = None
-        for row in db_rows:
-            tmp_row = row.copy()
-            tmp_row.update(keyvalues)
-            if row == tmp_row:
-                return_row = tmp_row
-                break
+        '''
+        Copy of the first row which matches all key values is acquired.
+        (Pass EmDBIndexedRows as db_rows when it is called repeatedly
+         for the same rows, so that the hash index is reused.)
+        '''
+        if not isinstance(db_rows, EmDBIndexedRows):
+            db_rows = EmDBIndexedRows(db_rows)
+        row = db_rows.find(**keyvalues)
+        if row is None:
+            return None
+        return_row = row.copy()
+        return_row.update(keyvalues)
         return return_row
 
     @decorater_log
@@ -4956,3 +4855,81 @@ class EmStatus(object):
         '''
         with cls.lock:
             cls.em_status = status
+
+
+class EmTransactionStatusNotice(object):
+    '''
+    In-process notice of device status update for each transaction.
+    (DB is still the record of device status.
+     This class only wakes up the order flow control waiting for update.)
+    '''
+
+    lock = threading.Lock()
+    notice_dict = {}
+
+    @classmethod
+    @decorater_log
+    def get_sequence(cls, transaction_id):
+        '''
+        Launched from order flow control before reading device status,
+        and returns the sequence number of update notice.
+        Explanation about parameter:
+            transaction_id: Transaction ID
+        Explanation about return value:
+            sequence number of update notice : int
+        '''
+        with cls.lock:
+            notice = cls.notice_dict.setdefault(
+                str(transaction_id), [threading.Condition(cls.lock), 0])
+            return notice[1]
+
+    @classmethod
+    @decorater_log
+    def notify(cls, transaction_id):
+        '''
+        Launched when device status is written
+        (or the order is timed out), and wakes up waiting order flow control.
+        Explanation about parameter:
+            transaction_id: Transaction ID
+        Explanation about return value:
+            None
+        '''
+        with cls.lock:
+            notice = cls.notice_dict.get(str(transaction_id))
+            if notice is not None:
+                notice[1] += 1
+                notice[0].notify_all()
+
+    @classmethod
+    @decorater_log
+    def wait(cls, transaction_id, sequence, timeout):
+        '''
+        Waits until device status is updated after the sequence number
+        has been obtained, or the timeout has passed.
+        Explanation about parameter:
+            transaction_id: Transaction ID
+            sequence: sequence number obtained before reading device status
+            timeout: maximum waiting time (sec)
+        Explanation about return value:
+            update notice has been received : boolean
+        '''
+        with cls.lock:
+            notice = cls.notice_dict.setdefault(
+                str(transaction_id), [threading.Condition(cls.lock), 0])
+            if notice[1] == sequence:
+                notice[0].wait(timeout)
+            return notice[1] != sequence
+
+    @classmethod
+    @decorater_log
+    def remove(cls, transaction_id):
+        '''
+        Launched from order flow control at the end of order,
+        and deletes the notice for the transaction.
+        Explanation about parameter:
+            transaction_id: Transaction ID
+        Explanation about return value:
+            None
+        '''
+        with cls.lock:
+            cls.notice_dict.pop(str(transaction_id), None)
@@ -311,9 +311,15 @@ CREATE TABLE DeviceConfigrationinfo(
     log_type                text,
     get_timing              Integer,
     config_file             text    NOT NULL,
+    base_configration_id    Integer,
+    delta_num               Integer DEFAULT 0,
     PRIMARY KEY (device_configration_id, working_date)
 );
 
+CREATE INDEX DeviceConfigrationinfo_latest_idx
+    ON DeviceConfigrationinfo (device_name, working_date DESC, working_time DESC,
+                               device_configration_id DESC);
+
 CREATE TABLE NvrAdminPasswordMgmt(
     device_name             text    NOT NULL,
     administrator_password  text    NOT NULL,
@@ -41,4 +41,13 @@ WHERE
     DevConfD.device_name = DevConfE.device_name
 AND DevConfD.working_date = DevConfE.working_date
 AND DevConfD.working_time = DevConfE.working_time
+AND DevConfD.device_configration_id NOT IN
+    (
+        SELECT
+            DevConfF.base_configration_id
+        FROM
+            deviceconfigrationinfo AS DevConfF
+        WHERE
+            DevConfF.base_configration_id IS NOT NULL
+    )
 ;
\ No newline at end of file
@@ -0,0 +1,22 @@
+#!/bin/bash
+##
+##  MSF2018B_config_history.sh
+##
+## SQL statement script for updating DB schema so that device configuration
+## information table keeps deltas between full configurations.
+##
+## Copyright(c) 2019 Nippon Telegraph and Telephone Corporation
+##
+
+## Current directoy is moved.
+cd `dirname "$0"`
+
+## File for environmental configuration is read.
+source ./db_env
+
+## Path of SQL file for updating DB schema at each release timing
+DB_SCHEMA_UPDATE_SCRIPT="./MSF2018B_config_history.sql"
+
+psql -U ${SBY_USER} -h ${SBY_SERVER} -p 5432 ${RESTORE_DB_NAME} < ${DB_SCHEMA_UPDATE_SCRIPT}
+
+exit 0
@@ -0,0 +1,7 @@
+ALTER TABLE DeviceConfigrationinfo ADD COLUMN base_configration_id Integer;
+ALTER TABLE DeviceConfigrationinfo ADD COLUMN delta_num Integer DEFAULT 0;
+UPDATE DeviceConfigrationinfo SET delta_num=0;
+
+CREATE INDEX DeviceConfigrationinfo_latest_idx
+    ON DeviceConfigrationinfo (device_name, working_date DESC, working_time DESC,
+                               device_configration_id DESC);